@@ -0,0 +1,121 @@
+import contextlib
+import datetime
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Tuple
+
+from taskwarrior import Client
+from taskwarrior.task import DATETIME_FORMAT
+
+
+@contextlib.contextmanager
+def temporary_client(**kwargs) -> Iterator[Client]:
+    """Yields a client backed by a fresh, empty Taskwarrior data directory."""
+    data_location = tempfile.mkdtemp()
+    taskrc_path = os.path.join(data_location, "taskrc")
+
+    with open(taskrc_path, "w") as outf:
+        outf.write(f"data.location = {data_location}\n")
+
+    try:
+        yield Client(config_filename=taskrc_path, **kwargs)
+    finally:
+        shutil.rmtree(data_location)
+
+
+class ImportTime(NamedTuple):
+    module: str
+    # Microseconds spent importing the module itself, and including the
+    # modules it imported
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+# Written to stderr before running the measured code, separating its imports
+# from those made while starting the interpreter
+IMPORT_MARKER = "-- measured --"
+
+
+def import_times(code: str) -> List[ImportTime]:
+    """Runs `code` in a new interpreter, returning the modules it imported.
+
+    Uses `python -X importtime`; modules imported by the interpreter before
+    running `code` are left out.
+
+    """
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            f"import sys; sys.stderr.write({IMPORT_MARKER!r} + '\\n'); {code}",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    lines = result.stderr.splitlines()
+    start = lines.index(IMPORT_MARKER) + 1
+    times = []
+    for line in lines[start:]:
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line.partition(":")[2].split("|")
+        times.append(
+            ImportTime(
+                module=name.strip(),
+                self_us=int(self_us),
+                cumulative_us=int(cumulative_us),
+                depth=(len(name) - len(name.lstrip()) - 1) // 2,
+            )
+        )
+    return times
+
+
+@contextlib.contextmanager
+def timer() -> Iterator[Tuple[float, ...]]:
+    """Measures wall time; the elapsed seconds are in `result[0]` on exit."""
+    result = [0.0]
+    started = time.perf_counter()
+    try:
+        yield result  # type: ignore[misc]
+    finally:
+        result[0] = time.perf_counter() - started
+
+
+def make_export(count: int) -> str:
+    """Returns `task export` output for `count` synthetic tasks."""
+    start = datetime.datetime(2020, 1, 1)
+    rng = random.Random(0)
+
+    def timestamp() -> str:
+        return (start + datetime.timedelta(seconds=rng.randrange(10**8))).strftime(
+            DATETIME_FORMAT
+        )
+
+    return json.dumps(
+        [
+            {
+                "description": f"Task {i}",
+                "entry": timestamp(),
+                "modified": timestamp(),
+                "due": timestamp(),
+                "status": "pending",
+                "uuid": str(uuid.UUID(int=rng.getrandbits(128))),
+            }
+            for i in range(count)
+        ]
+    )
@@ -0,0 +1,59 @@
+"""Compares building a DataFrame from `Task` objects with `build_columns`.
+
+Reports the time taken to turn a synthetic export into a pandas DataFrame of
+a few fields, and the peak memory used doing so.
+
+Usage: python benchmarks/bench_columns.py [--tasks 200000]
+
+"""
+
+import argparse
+import json
+import tracemalloc
+from typing import List
+
+import pandas
+from _common import make_export
+from _common import timer
+from pydantic import parse_raw_as
+
+from taskwarrior.columns import build_columns
+from taskwarrior.task import Task
+
+FIELDS = ["uuid", "description", "status", "due", "entry"]
+
+
+def from_tasks(export: str) -> pandas.DataFrame:
+    tasks = parse_raw_as(List[Task], export)
+    return pandas.DataFrame(
+        [{field: getattr(task, field) for field in FIELDS} for task in tasks]
+    )
+
+
+def from_columns(export: str) -> pandas.DataFrame:
+    return build_columns(json.loads(export), FIELDS).to_pandas()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=200000)
+    args = parser.parse_args()
+
+    export = make_export(args.tasks)
+
+    for name, build in (("tasks", from_tasks), ("columns", from_columns)):
+        tracemalloc.start()
+        with timer() as elapsed:
+            frame = build(export)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(
+            f"{name:<8} n={args.tasks} time={elapsed[0]:7.3f}s "
+            f"peak={peak / 1024 / 1024:8.1f}MiB"
+        )
+        del frame
+
+
+if __name__ == "__main__":
+    main()
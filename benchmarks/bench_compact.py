@@ -0,0 +1,77 @@
+"""Compares the memory held per task by lists of tasks and `CompactTaskList`.
+
+Generates a dataset (see `datasets.py`), then measures, using
+`tracemalloc`, the memory still allocated after holding every task as a
+list of `Task`s, a list of `LazyTask`s, and a `CompactTaskList`, along
+with the time taken to build each.
+
+Usage: python benchmarks/bench_compact.py [--sizes 10000,100000]
+
+"""
+import argparse
+import gc
+import json
+import os
+import shutil
+import tempfile
+import tracemalloc
+from typing import List
+
+from _common import timer
+from datasets import generate_dataset
+from pydantic import parse_raw_as
+
+from taskwarrior import Task
+from taskwarrior.compact import CompactTaskList
+from taskwarrior.datafile import DataFileReader
+from taskwarrior.task import LazyTask
+
+UDA_TYPES = {"estimate": "numeric", "size": "string"}
+
+BUILDERS = {
+    "Task": lambda export: parse_raw_as(List[Task], export),
+    "LazyTask": lambda export: [
+        LazyTask.from_export(data) for data in json.loads(export)
+    ],
+    "CompactTaskList": lambda export: CompactTaskList.from_export(
+        json.loads(export), udas=UDA_TYPES
+    ),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="10000,100000")
+    args = parser.parse_args()
+
+    for size in (int(size) for size in args.sizes.split(",")):
+        root = tempfile.mkdtemp()
+        try:
+            data_location = os.path.join(root, "data")
+            generate_dataset(data_location, size, size // 2)
+            reader = DataFileReader(data_location, uda_types=UDA_TYPES)
+            export = json.dumps(list(reader.iter_export()))
+        finally:
+            shutil.rmtree(root)
+
+        count = len(json.loads(export))
+        for name, build in BUILDERS.items():
+            gc.collect()
+            tracemalloc.start()
+            with timer() as elapsed:
+                tasks = build(export)
+            gc.collect()
+            retained, _ = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            assert len(tasks) == count
+            del tasks
+            print(
+                f"{name:<16} n={count:<7} {retained / count:8.0f} bytes/task "
+                f"total={retained / 1024 / 1024:8.1f}MiB "
+                f"build={elapsed[0]:7.3f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
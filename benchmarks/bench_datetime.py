@@ -0,0 +1,50 @@
+"""Measures the cost of parsing Taskwarrior timestamps when loading tasks.
+
+Compares `parse_datetime` with `dateutil.parser.parse` on the timestamps
+of a synthetic export, and times building `Task` models from that export.
+
+Usage: python benchmarks/bench_datetime.py [--tasks 100000]
+
+"""
+import argparse
+import json
+from typing import List
+
+import dateutil.parser
+from _common import make_export
+from _common import timer
+from pydantic import parse_raw_as
+
+from taskwarrior.task import Task
+from taskwarrior.task import parse_datetime
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=100000)
+    args = parser.parse_args()
+
+    export = make_export(args.tasks)
+    values: List[str] = [
+        item[field]
+        for item in json.loads(export)
+        for field in ("entry", "modified", "due")
+    ]
+
+    with timer() as elapsed:
+        for value in values:
+            dateutil.parser.parse(value)
+    print(f"dateutil.parser.parse  n={len(values)} {elapsed[0]:8.3f}s")
+
+    with timer() as elapsed:
+        for value in values:
+            parse_datetime(value)
+    print(f"parse_datetime         n={len(values)} {elapsed[0]:8.3f}s")
+
+    with timer() as elapsed:
+        parse_raw_as(List[Task], export)
+    print(f"parse_raw_as(Task)     n={args.tasks} {elapsed[0]:8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Compares per-task `delete` calls with `delete_many` and `delete_where`.
+
+Usage: python benchmarks/bench_delete.py [--sizes 1,100,5000]
+
+"""
+import argparse
+
+from _common import temporary_client
+from _common import timer
+
+from taskwarrior import Q
+from taskwarrior import Task
+
+
+def report(name: str, size: int, elapsed: float) -> None:
+    print(
+        f"{name:<12} n={size:<6} total={elapsed:8.3f}s "
+        f"per-task={elapsed / size * 1000:8.3f}ms"
+    )
+
+
+def run(size: int, loop_limit: int) -> None:
+    if size <= loop_limit:
+        with temporary_client() as client:
+            tasks = [Task(description=f"Task {i}") for i in range(size)]
+            client.add_many(tasks)
+            with timer() as elapsed:
+                for task in tasks:
+                    client.delete(task)
+        report("delete", size, elapsed[0])
+
+    with temporary_client() as client:
+        tasks = [Task(description=f"Task {i}") for i in range(size)]
+        client.add_many(tasks)
+        with timer() as elapsed:
+            client.delete_many(tasks)
+    report("delete_many", size, elapsed[0])
+
+    with temporary_client() as client:
+        client.add_many(
+            Task(description=f"Task {i}", project="Stale") for i in range(size)
+        )
+        with timer() as elapsed:
+            client.delete_where(Q(project="Stale"))
+    report("delete_where", size, elapsed[0])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="1,100,5000")
+    parser.add_argument(
+        "--loop-limit",
+        type=int,
+        default=1000,
+        help="Skip the per-task loop for sizes above this; it is very slow.",
+    )
+    args = parser.parse_args()
+
+    for size in (int(size) for size in args.sizes.split(",")):
+        run(size, args.loop_limit)
+
+
+if __name__ == "__main__":
+    main()
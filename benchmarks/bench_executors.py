@@ -0,0 +1,43 @@
+"""Measures the per-call overhead of each process executor.
+
+Runs a trivial command repeatedly using each executor.  Use `--rss-mb` to
+first allocate (and touch) that much memory, as the cost of starting a
+process from a large process is what differs most between executors.
+
+Usage: python benchmarks/bench_executors.py [--calls 200] [--rss-mb 0]
+
+"""
+import argparse
+import os
+
+from _common import timer
+
+from taskwarrior.executors import PosixSpawnExecutor
+from taskwarrior.executors import SubprocessExecutor
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--rss-mb", type=int, default=0)
+    parser.add_argument("--command", default="true")
+    args = parser.parse_args()
+
+    ballast = bytearray(args.rss_mb * 1024 * 1024)
+    for offset in range(0, len(ballast), 4096):
+        ballast[offset] = 1
+
+    env = dict(os.environ)
+    for executor in (SubprocessExecutor(), PosixSpawnExecutor()):
+        executor.run([args.command], env)
+        with timer() as elapsed:
+            for _ in range(args.calls):
+                executor.run([args.command], env)
+        print(
+            f"{type(executor).__name__:<20} rss={args.rss_mb}MiB "
+            f"per-call={elapsed[0] / args.calls * 1000:8.3f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Measures dependency graph analysis on a synthetic project.
+
+Each task depends on up to three randomly-chosen earlier tasks, so the
+graph is acyclic and has long dependency chains.
+
+Usage: python benchmarks/bench_graph.py [--tasks 30000]
+
+"""
+
+import argparse
+import random
+import uuid
+
+from _common import timer
+
+from taskwarrior.graph import DependencyGraph
+from taskwarrior.task import Task
+
+
+def make_tasks(count: int):
+    rng = random.Random(0)
+    uuids = [uuid.UUID(int=rng.getrandbits(128)) for _ in range(count)]
+
+    return [
+        Task.construct(
+            uuid=task_uuid,
+            description=f"Task {i}",
+            status=rng.choice(["pending", "pending", "completed"]),
+            depends=rng.sample(uuids[:i], min(i, rng.randrange(4))),
+        )
+        for i, task_uuid in enumerate(uuids)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=30000)
+    args = parser.parse_args()
+
+    tasks = make_tasks(args.tasks)
+
+    with timer() as build:
+        graph = DependencyGraph(tasks)
+    print(f"build            {build[0] * 1000:8.1f}ms")
+
+    for name in ("topological_sort", "cycles", "critical_path", "blocked", "blocking"):
+        with timer() as elapsed:
+            result = getattr(graph, name)()
+        print(f"{name:<16} {elapsed[0] * 1000:8.1f}ms ({len(result)} results)")
+
+
+if __name__ == "__main__":
+    main()
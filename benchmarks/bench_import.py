@@ -0,0 +1,52 @@
+"""Compares per-task `import_` calls with batched `import_many` calls.
+
+Usage: python benchmarks/bench_import.py [--sizes 1,100,10000]
+
+"""
+import argparse
+
+from _common import temporary_client
+from _common import timer
+
+from taskwarrior import Task
+
+
+def run(size: int, loop_limit: int) -> None:
+    if size <= loop_limit:
+        with temporary_client() as client:
+            tasks = [Task(description=f"Task {i}") for i in range(size)]
+            with timer() as elapsed:
+                for task in tasks:
+                    client.add(task)
+        print(
+            f"import_      n={size:<6} total={elapsed[0]:8.3f}s "
+            f"per-task={elapsed[0] / size * 1000:8.3f}ms"
+        )
+
+    with temporary_client() as client:
+        tasks = [Task(description=f"Task {i}") for i in range(size)]
+        with timer() as elapsed:
+            client.add_many(tasks)
+    print(
+        f"import_many  n={size:<6} total={elapsed[0]:8.3f}s "
+        f"per-task={elapsed[0] / size * 1000:8.3f}ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="1,100,10000")
+    parser.add_argument(
+        "--loop-limit",
+        type=int,
+        default=1000,
+        help="Skip the per-task loop for sizes above this; it is very slow.",
+    )
+    args = parser.parse_args()
+
+    for size in (int(size) for size in args.sizes.split(",")):
+        run(size, args.loop_limit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Compares eager validation, lazy validation, and projection of tasks.
+
+Reports the time taken to build tasks from a synthetic export, the time
+taken to then read a few fields of each task, and the peak memory used.
+
+Usage: python benchmarks/bench_lazy.py [--tasks 100000]
+
+"""
+
+import argparse
+import json
+import tracemalloc
+from typing import List
+
+from _common import make_export
+from _common import timer
+from pydantic import parse_raw_as
+
+from taskwarrior.task import LazyTask
+from taskwarrior.task import ProjectedTask
+from taskwarrior.task import Task
+
+FIELDS = ["description", "status", "due"]
+
+
+def eager(export: str) -> List[Task]:
+    return parse_raw_as(List[Task], export)
+
+
+def lazy(export: str) -> List[Task]:
+    return [LazyTask.from_export(data) for data in json.loads(export)]
+
+
+def projected(export: str) -> List[Task]:
+    return [
+        ProjectedTask.from_export_fields(data, FIELDS) for data in json.loads(export)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=100000)
+    args = parser.parse_args()
+
+    export = make_export(args.tasks)
+
+    for name, build in (("eager", eager), ("lazy", lazy), ("fields", projected)):
+        tracemalloc.start()
+        with timer() as construction:
+            tasks = build(export)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        with timer() as access:
+            for task in tasks:
+                [getattr(task, field) for field in FIELDS]
+
+        print(
+            f"{name:<6} n={args.tasks} construct={construction[0]:7.3f}s "
+            f"access={access[0]:7.3f}s peak={peak / 1024 / 1024:8.1f}MiB"
+        )
+        del tasks
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Measures `ClientPool` throughput across many tenants' data directories.
+
+Creates `--tenants` data directories of `--tasks` tasks each, then runs
+`count` and `filter` for every tenant using 1, 8, and 32 workers on
+threads and on processes, reporting tenants handled per second.
+
+Usage: python benchmarks/bench_pool.py [--tenants 64] [--tasks 500]
+       [--workers 1,8,32]
+
+"""
+
+import argparse
+import os
+import shutil
+import tempfile
+
+from _common import timer
+from datasets import generate_dataset
+
+from taskwarrior.pool import ClientPool
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tenants", type=int, default=64)
+    parser.add_argument("--tasks", type=int, default=500)
+    parser.add_argument("--workers", default="1,8,32")
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp()
+    try:
+        tenants = {
+            f"tenant{index}": generate_dataset(
+                os.path.join(root, f"tenant{index}"),
+                args.tasks,
+                args.tasks // 2,
+                seed=index,
+            )
+            for index in range(args.tenants)
+        }
+
+        for mode in ("thread", "process"):
+            for workers in (int(workers) for workers in args.workers.split(",")):
+                with ClientPool(tenants, max_workers=workers, mode=mode) as pool:
+                    for method, call in (
+                        ("count", lambda: pool.count(status="pending")),
+                        ("filter", lambda: pool.filter(project="Work")),
+                    ):
+                        with timer() as elapsed:
+                            errors = sum(
+                                1 for result in call() if result.error is not None
+                            )
+                        print(
+                            f"{mode:<7} workers={workers:<3} {method:<6} "
+                            f"tenants={args.tenants} time={elapsed[0]:7.3f}s "
+                            f"{args.tenants / elapsed[0]:8.1f} tenants/s "
+                            f"errors={errors}"
+                        )
+    finally:
+        shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    main()
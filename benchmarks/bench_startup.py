@@ -0,0 +1,51 @@
+"""Measures the time taken to import `taskwarrior` using `-X importtime`.
+
+Each scenario is run `--repeats` times in a new interpreter; the median
+total time spent importing modules is reported, along with the modules
+taking longest to import themselves in the last run.  Heavy dependencies
+(pydantic, dateutil, and pytz) should only appear once tasks are parsed.
+
+Usage: python benchmarks/bench_startup.py [--repeats 10] [--top 5]
+
+"""
+import argparse
+import statistics
+
+from _common import import_times
+
+SCENARIOS = {
+    "import": "import taskwarrior",
+    "count": (
+        "from taskwarrior import Client, Q\n"
+        "try:\n"
+        "    Client().count('+next', Q(project='Home') | Q(project='Work'))\n"
+        "except Exception:\n"
+        "    pass  # Taskwarrior is not needed to measure imports\n"
+    ),
+    "task": "from taskwarrior import Task",
+}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--top", type=int, default=5)
+    args = parser.parse_args()
+
+    top = args.top
+    for name, code in SCENARIOS.items():
+        totals = []
+        for _ in range(args.repeats):
+            times = import_times(code)
+            totals.append(sum(t.cumulative_us for t in times if t.depth == 0))
+
+        slowest = sorted(times, key=lambda t: t.self_us, reverse=True)[:top]
+        print(
+            f"{name:<7} median={statistics.median(totals) / 1000:7.1f}ms "
+            f"modules={len(times):<4} slowest: "
+            + ", ".join(f"{t.module} {t.self_us / 1000:.1f}ms" for t in slowest)
+        )
+
+
+if __name__ == "__main__":
+    main()
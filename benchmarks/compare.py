@@ -0,0 +1,85 @@
+"""Compares two sets of results written by `run.py`.
+
+Prints the change in median latency and peak memory of each case measured
+in both, and exits with status 1 if any got worse by more than the
+threshold (a fraction; 0.1 is 10%).
+
+Usage: python benchmarks/compare.py BASELINE.json CURRENT.json
+       [--threshold 0.1]
+
+"""
+
+import argparse
+import json
+import sys
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+METRICS = [("median", "time"), ("peak_memory_bytes", "memory")]
+
+
+def load(path: str) -> Tuple[Dict[str, Any], Dict[Tuple[str, int], Dict[str, Any]]]:
+    with open(path) as inf:
+        data = json.load(inf)
+
+    return data["metadata"], {
+        (result["case"], result["size"]): result
+        for result in data["results"]
+        if not result["skipped"]
+    }
+
+
+def change(baseline: Optional[float], current: Optional[float]) -> Optional[float]:
+    if not baseline or current is None:
+        return None
+    return (current - baseline) / baseline
+
+
+def describe(metadata: Dict[str, Any]) -> str:
+    commit = (metadata.get("commit") or "unknown")[:10]
+    if metadata.get("dirty"):
+        commit += "+"
+    taskwarrior = metadata["taskwarrior"] or "Taskwarrior not found"
+    return f"{commit} (Python {metadata['python']}, {taskwarrior})"
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("baseline")
+    parser.add_argument("current")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args()
+
+    baseline_metadata, baseline = load(args.baseline)
+    current_metadata, current = load(args.current)
+
+    print(f"baseline: {describe(baseline_metadata)}")
+    print(f"current:  {describe(current_metadata)}")
+
+    regressions = []
+    for key in sorted(baseline.keys() & current.keys()):
+        changes = []
+        for metric, label in METRICS:
+            difference = change(baseline[key].get(metric), current[key].get(metric))
+            if difference is None:
+                continue
+            flag = ""
+            if difference > args.threshold:
+                flag = " !"
+                regressions.append((key, label))
+            changes.append(f"{label} {difference:+7.1%}{flag}")
+
+        print(f"{key[0]:<15} n={key[1]:<7} {'  '.join(changes)}")
+
+    for key in sorted(baseline.keys() ^ current.keys()):
+        print(f"{key[0]:<15} n={key[1]:<7} not measured in both")
+
+    if regressions:
+        print(f"{len(regressions)} regression(s) above {args.threshold:.0%}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""Generates reproducible, realistic Taskwarrior data directories.
+
+Each data directory holds `pending.data`, `completed.data`, and a `taskrc`
+configuring the UDAs used.  Tasks have projects, tags, priorities, due and
+scheduled dates, annotations, UDAs (`estimate`, numeric, and `size`,
+string), dependencies, and recurrences (templates and their instances).
+
+Recurrence and garbage collection are disabled in the generated `taskrc`
+so that reading the data never changes it.
+
+Usage: python benchmarks/datasets.py DIRECTORY [--pending 10000]
+       [--completed 10000] [--seed 0]
+
+"""
+
+import argparse
+import os
+import random
+import uuid
+from typing import Dict
+from typing import List
+
+from taskwarrior.datafile import format_line
+
+START = 1577836800  # 2020-01-01T00:00:00Z
+DAY = 86400
+
+PROJECTS = [
+    "Home",
+    "Home.Garden",
+    "Home.Kitchen",
+    "Work",
+    "Work.Reports",
+    "Work.Hiring",
+    "Errands",
+    "Health",
+]
+TAGS = ["next", "alarm", "phone", "email", "someday", "waiting", "review", "urgent"]
+WORDS = [
+    "call",
+    "write",
+    "review",
+    "buy",
+    "fix",
+    "plan",
+    "clean",
+    "book",
+    "send",
+    "read",
+]
+SIZES = ["small", "medium", "large"]
+
+# Fraction of pending tasks that are recurring templates; each has
+# `INSTANCES_PER_TEMPLATE` pending instances.
+RECURRING_FRACTION = 0.01
+INSTANCES_PER_TEMPLATE = 3
+
+TASKRC = """data.location = {data_location}
+uda.estimate.type = numeric
+uda.size.type = string
+uda.size.values = small,medium,large
+recurrence = off
+gc = off
+"""
+
+
+def generate_dataset(
+    data_location: str, pending: int, completed: int, seed: int = 0
+) -> str:
+    """Writes a data directory; returns the path of its `taskrc`."""
+    rng = random.Random(seed)
+    os.makedirs(data_location, exist_ok=True)
+
+    pending_tasks: List[Dict[str, str]] = []
+    template_count = int(pending * RECURRING_FRACTION)
+
+    for i in range(template_count):
+        template = make_task(rng, f"Recurring {i}", "recurring")
+        template["recur"] = rng.choice(["daily", "weekly", "monthly"])
+        template["due"] = str(START + rng.randrange(365 * DAY))
+        template["mask"] = "-" * INSTANCES_PER_TEMPLATE
+        pending_tasks.append(template)
+
+        for imask in range(INSTANCES_PER_TEMPLATE):
+            instance = make_task(rng, template["description"], "pending")
+            instance["recur"] = template["recur"]
+            instance["parent"] = template["uuid"]
+            instance["imask"] = str(imask)
+            instance["due"] = str(int(template["due"]) + imask * 7 * DAY)
+            pending_tasks.append(instance)
+
+    while len(pending_tasks) < pending:
+        status = "waiting" if rng.random() < 0.05 else "pending"
+        task = make_task(rng, make_description(rng, len(pending_tasks)), status)
+        if status == "waiting":
+            task["wait"] = str(START + 3650 * DAY)
+        if pending_tasks and rng.random() < 0.1:
+            dependencies = [
+                dependency["uuid"]
+                for dependency in rng.sample(pending_tasks, min(len(pending_tasks), 2))
+                if dependency["status"] != "recurring"
+            ]
+            if dependencies:
+                task["depends"] = ",".join(dependencies)
+        pending_tasks.append(task)
+
+    completed_tasks = []
+    for i in range(completed):
+        status = "deleted" if rng.random() < 0.2 else "completed"
+        task = make_task(rng, make_description(rng, i), status)
+        task["end"] = str(int(task["entry"]) + rng.randrange(30 * DAY))
+        completed_tasks.append(task)
+
+    for filename, tasks in (
+        ("pending.data", pending_tasks[:pending]),
+        ("completed.data", completed_tasks),
+    ):
+        with open(os.path.join(data_location, filename), "w", encoding="utf-8") as f:
+            for task in tasks:
+                f.write(format_line(task))
+                f.write("\n")
+
+    taskrc_path = os.path.join(data_location, "taskrc")
+    with open(taskrc_path, "w") as outf:
+        outf.write(TASKRC.format(data_location=data_location))
+
+    return taskrc_path
+
+
+def make_description(rng: random.Random, index: int) -> str:
+    return f"{rng.choice(WORDS).capitalize()} {' '.join(rng.sample(WORDS, 3))} {index}"
+
+
+def make_task(rng: random.Random, description: str, status: str) -> Dict[str, str]:
+    entry = START + rng.randrange(365 * DAY)
+    task = {
+        "description": description,
+        "entry": str(entry),
+        "modified": str(entry + rng.randrange(30 * DAY)),
+        "status": status,
+        "uuid": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+        "project": rng.choice(PROJECTS),
+    }
+
+    tags = rng.sample(TAGS, rng.choice([0, 0, 1, 1, 2, 3]))
+    if tags:
+        task["tags"] = ",".join(tags)
+    if rng.random() < 0.3:
+        task["priority"] = rng.choice("HML")
+    if rng.random() < 0.4:
+        task["due"] = str(entry + rng.randrange(-30 * DAY, 90 * DAY))
+    if rng.random() < 0.1:
+        task["scheduled"] = str(entry + rng.randrange(30 * DAY))
+    for _ in range(rng.choice([0, 0, 0, 1, 2])):
+        task[f"annotation_{entry + rng.randrange(DAY, 30 * DAY)}"] = (
+            f"Note: {' '.join(rng.sample(WORDS, 4))}"
+        )
+    if rng.random() < 0.5:
+        task["estimate"] = str(rng.randrange(1, 480))
+    if rng.random() < 0.5:
+        task["size"] = rng.choice(SIZES)
+
+    return task
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("directory")
+    parser.add_argument("--pending", type=int, default=10000)
+    parser.add_argument("--completed", type=int, default=10000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(
+        generate_dataset(
+            os.path.abspath(args.directory),
+            args.pending,
+            args.completed,
+            seed=args.seed,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,387 @@
+"""Runs the benchmark suite against synthetic datasets and records results.
+
+For each dataset size, a data directory is generated (see `datasets.py`) and
+each case is run `--repeats` times.  Latency (min, median, and 90th
+percentile), throughput, and the peak memory allocated by Python while
+running the case once more are written as JSON, along with the commit and
+environment measured, so that results can be compared using `compare.py`.
+
+Cases needing Taskwarrior are recorded as skipped if `task` is not found.
+Cases that change the data run against a fresh copy of it each time.
+
+Usage: python benchmarks/run.py [--sizes 10000,100000] [--repeats 5]
+       [--cases parse,filter] [--output results.json]
+
+"""
+
+import argparse
+import datetime
+import functools
+import json
+import operator
+import os
+import platform
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+
+from datasets import generate_dataset
+from pydantic import parse_raw_as
+
+from taskwarrior import Client
+from taskwarrior import Q
+from taskwarrior import Task
+from taskwarrior.compact import CompactTaskList
+from taskwarrior.datafile import DataFileReader
+from taskwarrior.evaluate import compile_filter
+from taskwarrior.instrumentation import percentile
+from taskwarrior.task import LazyTask
+
+UDA_TYPES = {"estimate": "numeric", "size": "string"}
+BATCH_SIZE = 1000
+
+QUERIES = [
+    Q(project="Work", status="pending"),
+    Q("+next", project="Work") | Q(size="large"),
+    Q(due__before=datetime.datetime(2020, 6, 1), description__contains="call"),
+    functools.reduce(
+        operator.or_,
+        (Q(uuid=f"{i:08x}-0000-4000-8000-000000000000") for i in range(10)),
+    ),
+]
+
+
+class Dataset(NamedTuple):
+    data_location: str
+    taskrc_path: str
+    export: str
+    uuids: List[str]
+    size: int
+    task_bin: str
+
+
+class Case(NamedTuple):
+    name: str
+    # Prepares the state passed to `run`; not measured.
+    setup: Callable[[Dataset], Any]
+    run: Callable[[Any], Any]
+    # Number of operations (e.g. tasks) processed by each run
+    operations: Callable[[Dataset], int]
+    unit: str
+    needs_taskwarrior: bool = False
+    mutates: bool = False
+
+
+def client_for(dataset: Dataset) -> Client:
+    return Client(config_filename=dataset.taskrc_path, task_bin=dataset.task_bin)
+
+
+def new_tasks(count: int) -> List[Task]:
+    return [Task(description=f"Benchmark {i}", project="Bench") for i in range(count)]
+
+
+CASES = [
+    Case(
+        "parse",
+        lambda dataset: dataset.export,
+        lambda export: parse_raw_as(List[Task], export),
+        lambda dataset: dataset.size,
+        "tasks",
+    ),
+    Case(
+        "parse_lazy",
+        lambda dataset: dataset.export,
+        lambda export: [LazyTask.from_export(data) for data in json.loads(export)],
+        lambda dataset: dataset.size,
+        "tasks",
+    ),
+    Case(
+        "compact",
+        lambda dataset: json.loads(dataset.export),
+        lambda exported: CompactTaskList.from_export(exported, udas=UDA_TYPES),
+        lambda dataset: dataset.size,
+        "tasks",
+    ),
+    Case(
+        "read_datafiles",
+        lambda dataset: DataFileReader(dataset.data_location, uda_types=UDA_TYPES),
+        lambda reader: list(reader.iter_export()),
+        lambda dataset: dataset.size,
+        "tasks",
+    ),
+    Case(
+        "evaluate",
+        lambda dataset: (
+            compile_filter(QUERIES[1], udas=UDA_TYPES),
+            [LazyTask.from_export(data) for data in json.loads(dataset.export)],
+        ),
+        lambda state: [task for task in state[1] if state[0](task)],
+        lambda dataset: dataset.size,
+        "tasks",
+    ),
+    Case(
+        "q_serialize",
+        lambda dataset: QUERIES * 250,
+        lambda queries: [q.serialize() for q in queries],
+        lambda dataset: len(QUERIES) * 250,
+        "queries",
+    ),
+    Case(
+        "startup",
+        lambda dataset: [sys.executable, "-c", "import taskwarrior"],
+        lambda command: subprocess.run(command, check=True),
+        lambda dataset: 1,
+        "processes",
+    ),
+    Case(
+        "filter",
+        client_for,
+        lambda client: client.filter(project="Work", status="pending"),
+        lambda dataset: 1,
+        "calls",
+        needs_taskwarrior=True,
+    ),
+    Case(
+        "count",
+        client_for,
+        lambda client: client.count(status="pending"),
+        lambda dataset: 1,
+        "calls",
+        needs_taskwarrior=True,
+    ),
+    Case(
+        "get",
+        lambda dataset: (client_for(dataset), dataset.uuids[len(dataset.uuids) // 2]),
+        lambda state: state[0].get(uuid=state[1]),
+        lambda dataset: 1,
+        "calls",
+        needs_taskwarrior=True,
+    ),
+    Case(
+        "import_",
+        lambda dataset: (client_for(dataset), new_tasks(1)[0]),
+        lambda state: state[0].import_(state[1]),
+        lambda dataset: 1,
+        "calls",
+        needs_taskwarrior=True,
+        mutates=True,
+    ),
+    Case(
+        "import_many",
+        lambda dataset: (client_for(dataset), new_tasks(BATCH_SIZE)),
+        lambda state: state[0].import_many(state[1]),
+        lambda dataset: BATCH_SIZE,
+        "tasks",
+        needs_taskwarrior=True,
+        mutates=True,
+    ),
+    Case(
+        "delete",
+        lambda dataset: (client_for(dataset), dataset.uuids[0]),
+        lambda state: state[0].delete(state[0].get(uuid=state[1])),
+        lambda dataset: 1,
+        "calls",
+        needs_taskwarrior=True,
+        mutates=True,
+    ),
+    Case(
+        "delete_many",
+        lambda dataset: (client_for(dataset), dataset.uuids[:BATCH_SIZE]),
+        lambda state: state[0].delete_many(state[1]),
+        lambda dataset: min(BATCH_SIZE, len(dataset.uuids)),
+        "tasks",
+        needs_taskwarrior=True,
+        mutates=True,
+    ),
+]
+
+
+def load_dataset(
+    data_location: str, taskrc_path: str, size: int, task_bin: str
+) -> Dataset:
+    reader = DataFileReader(data_location, uda_types=UDA_TYPES)
+    exported = list(reader.iter_export())
+
+    return Dataset(
+        data_location=data_location,
+        taskrc_path=taskrc_path,
+        export=json.dumps(exported),
+        uuids=[
+            data["uuid"]
+            for data in exported
+            if data["status"] in ("pending", "waiting")
+        ],
+        size=size,
+        task_bin=task_bin,
+    )
+
+
+def copy_dataset(dataset: Dataset, destination: str) -> Dataset:
+    """Returns a copy of `dataset` in `destination`, with its own `taskrc`."""
+    shutil.copytree(dataset.data_location, destination)
+    taskrc_path = os.path.join(destination, "taskrc")
+    with open(taskrc_path, "w") as outf:
+        with open(dataset.taskrc_path) as inf:
+            outf.write(
+                inf.read().replace(
+                    f"data.location = {dataset.data_location}",
+                    f"data.location = {destination}",
+                )
+            )
+
+    return dataset._replace(data_location=destination, taskrc_path=taskrc_path)
+
+
+def run_once(case: Case, dataset: Dataset, scratch: str, trace: bool = False):
+    """Returns the seconds taken by one run, and its peak memory if `trace`."""
+    if case.mutates:
+        copy = os.path.join(scratch, "copy")
+        shutil.rmtree(copy, ignore_errors=True)
+        dataset = copy_dataset(dataset, copy)
+
+    state = case.setup(dataset)
+
+    if trace:
+        tracemalloc.start()
+    started = time.perf_counter()
+    case.run(state)
+    elapsed = time.perf_counter() - started
+    peak = None
+    if trace:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return elapsed, peak
+
+
+def measure(
+    case: Case,
+    dataset: Dataset,
+    repeats: int,
+    scratch: str,
+    skip_reason: Optional[str],
+) -> Dict[str, Any]:
+    result: Dict[str, Any] = {
+        "case": case.name,
+        "size": dataset.size,
+        "unit": case.unit,
+        "operations": case.operations(dataset),
+        "skipped": skip_reason if case.needs_taskwarrior else None,
+    }
+    if result["skipped"]:
+        return result
+
+    timings = sorted(
+        run_once(case, dataset, scratch)[0] for _ in range(max(repeats, 1))
+    )
+    _, peak = run_once(case, dataset, scratch, trace=True)
+
+    result.update(
+        repeats=len(timings),
+        min=timings[0],
+        median=statistics.median(timings),
+        p90=percentile(timings, 90),
+        throughput=result["operations"] / statistics.median(timings),
+        peak_memory_bytes=peak,
+    )
+    return result
+
+
+def get_metadata(task_bin: str) -> Dict[str, Any]:
+    def output(*command: str) -> Optional[str]:
+        try:
+            return subprocess.run(
+                command, capture_output=True, check=True, text=True
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    return {
+        "commit": output("git", "rev-parse", "HEAD"),
+        "dirty": bool(output("git", "status", "--porcelain", "--untracked-files=no")),
+        "python": sys.version.split()[0],
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "taskwarrior": output(task_bin, "--version"),
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+
+
+def report(result: Dict[str, Any]) -> None:
+    name = f"{result['case']:<15} n={result['size']:<7}"
+    if result["skipped"]:
+        print(f"{name} skipped: {result['skipped']}")
+        return
+
+    peak = result["peak_memory_bytes"] / 1024 / 1024
+    print(
+        f"{name} median={result['median'] * 1000:10.2f}ms "
+        f"p90={result['p90'] * 1000:10.2f}ms "
+        f"{result['throughput']:12.1f} {result['unit']}/s peak={peak:8.1f}MiB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sizes", default="10000,100000")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument(
+        "--cases", help="Comma-separated names of the cases to run; default all."
+    )
+    parser.add_argument("--output", help="Write JSON results to this file.")
+    parser.add_argument("--task-bin", default="task")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    cases = CASES
+    if args.cases:
+        names = args.cases.split(",")
+        unknown = set(names) - {case.name for case in CASES}
+        if unknown:
+            parser.error(f"unknown cases: {', '.join(sorted(unknown))}")
+        cases = [case for case in CASES if case.name in names]
+
+    skip_reason = None
+    if shutil.which(args.task_bin) is None:
+        skip_reason = f"Taskwarrior ('{args.task_bin}') was not found"
+
+    results = []
+    for size in (int(size) for size in args.sizes.split(",")):
+        scratch = tempfile.mkdtemp()
+        try:
+            data_location = os.path.join(scratch, "data")
+            # Completed tasks are a third of each dataset
+            taskrc_path = generate_dataset(
+                data_location, size - size // 3, size // 3, seed=args.seed
+            )
+            dataset = load_dataset(data_location, taskrc_path, size, args.task_bin)
+
+            for case in cases:
+                result = measure(case, dataset, args.repeats, scratch, skip_reason)
+                report(result)
+                results.append(result)
+        finally:
+            shutil.rmtree(scratch)
+
+    if args.output:
+        with open(args.output, "w") as outf:
+            json.dump(
+                {"metadata": get_metadata(args.task_bin), "results": results},
+                outf,
+                indent=2,
+            )
+            outf.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -72,7 +72,7 @@ setup(
     keywords=[
         # eg: 'keyword1', 'keyword2', 'keyword3',
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     install_requires=[
         "pydantic>=1.8.2,<2.0.0",
         "python-dateutil>=2.8.2,<3.0.0",
@@ -80,9 +80,9 @@ setup(
         "typing_extensions",
     ],
     extras_require={
-        # eg:
-        #   'rst': ['docutils>=0.11'],
-        #   ':python_version=="2.6"': ['argparse'],
+        "columns": ["numpy"],
+        "arrow": ["numpy", "pyarrow"],
+        "pandas": ["numpy", "pandas"],
     },
     setup_requires=[
         "pytest-runner",
@@ -1,6 +1,38 @@
 # flake8: noqa
-from .client import Client
-from .client import Q
-from .task import Task
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .aio import AsyncClient
+    from .client import Client
+    from .client import Q
+    from .task import Task
 
 __version__ = "0.1.2"
+
+# Imported on first access, so that scripts only counting or deleting tasks
+# never load `asyncio`, or the pydantic models (and dateutil and pytz) of
+# `.task`.
+_LAZY_ATTRIBUTES = {
+    "AsyncClient": "aio",
+    "Client": "client",
+    "Q": "client",
+    "Task": "task",
+}
+
+__all__ = ["AsyncClient", "Client", "Q", "Task"]
+
+
+def __getattr__(name):
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    # Unlike `importlib.import_module`, `__import__` is reported by
+    # `python -X importtime`.
+    value = getattr(__import__(module, globals(), level=1, fromlist=[name]), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Collection
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from .client import BaseClient
+from .client import Q
+from .exceptions import ClientError
+from .exceptions import CommandTimeout
+from .executors import ExecutionResult
+from .instrumentation import Observer
+from .types import FilterSpec
+from .types import StdoutStderr
+from .types import Validation
+
+if TYPE_CHECKING:
+    from .task import Task
+
+DEFAULT_CONCURRENCY = 8
+
+
+class AsyncClient(BaseClient):
+    """A client for use with `asyncio`.
+
+    Mirrors the interface of `Client`, but executes Taskwarrior using
+    `asyncio` subprocesses so that the event loop is not blocked while
+    Taskwarrior runs.
+
+    * `concurrency`: the maximum number of Taskwarrior processes this client
+      will run at once; further calls wait for a running process to finish.
+    * `timeout`: the default number of seconds after which a Taskwarrior
+      process is killed and `CommandTimeout` raised.  Can be overridden
+      per-call.
+    * `observers`: as for `Client`.
+
+    """
+
+    _concurrency: int
+    _timeout: Optional[float]
+    _semaphore: Optional[asyncio.Semaphore]
+
+    def __init__(
+        self,
+        config_filename: Optional[str] = None,
+        config_overrides: Optional[Dict[str, Any]] = None,
+        task_bin: str = "task",
+        concurrency: int = DEFAULT_CONCURRENCY,
+        timeout: Optional[float] = None,
+        observers: Iterable[Observer] = (),
+    ):
+        self._concurrency = concurrency
+        self._timeout = timeout
+        self._observers = list(observers)
+        # Created on first use so that it is bound to the running event loop
+        self._semaphore = None
+
+        super().__init__(
+            config_filename=config_filename,
+            config_overrides=config_overrides,
+            task_bin=task_bin,
+        )
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._concurrency)
+        return self._semaphore
+
+    async def _execute(
+        self, *args: str, stdin: str = "", timeout: Optional[float] = None
+    ) -> StdoutStderr:
+        command = self._get_command(*args)
+        timeout = timeout if timeout is not None else self._timeout
+
+        async with self._get_semaphore():
+            observers = self._observers
+            if observers:
+                for observer in observers:
+                    observer.command_started(command)
+                started = time.perf_counter()
+
+            try:
+                raw_stdout, raw_stderr, return_code = await self._run(
+                    command, stdin, timeout
+                )
+            except BaseException as e:
+                if observers:
+                    self._notify_command_failed(command, e)
+                raise
+
+        if observers:
+            self._notify_command_finished(
+                args,
+                command,
+                time.perf_counter() - started,
+                ExecutionResult(return_code, raw_stdout, raw_stderr),
+            )
+
+        return self._get_result(command, return_code, raw_stdout, raw_stderr)
+
+    async def _run(
+        self, command: List[str], stdin: str, timeout: Optional[float]
+    ) -> Tuple[bytes, bytes, int]:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *command,
+                env=self._get_env(),
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+        except FileNotFoundError:
+            raise ClientError(
+                f"Taskwarrior client at '{self._task_bin}' could not be found."
+            )
+
+        try:
+            raw_stdout, raw_stderr = await asyncio.wait_for(
+                proc.communicate(stdin.encode("utf-8")), timeout
+            )
+        except asyncio.TimeoutError:
+            await self._kill(proc)
+            raise CommandTimeout(
+                command,
+                f"Taskwarrior did not finish within {timeout} seconds.",
+                "",
+                proc.returncode if proc.returncode is not None else -1,
+            )
+        except asyncio.CancelledError:
+            await self._kill(proc)
+            raise
+
+        assert proc.returncode is not None
+        return raw_stdout, raw_stderr, proc.returncode
+
+    async def _kill(self, proc: asyncio.subprocess.Process) -> None:
+        try:
+            proc.kill()
+        except ProcessLookupError:
+            pass
+        await proc.wait()
+
+    async def import_(
+        self, task: Task, timeout: Optional[float] = None
+    ) -> StdoutStderr:
+        self._check_import(task)
+
+        return await self._execute(
+            "import", stdin=task.json(exclude_unset=True), timeout=timeout
+        )
+
+    async def add(self, task: Task, timeout: Optional[float] = None) -> StdoutStderr:
+        self._prepare_add(task)
+
+        return await self.import_(task, timeout=timeout)
+
+    async def modify(self, task: Task, timeout: Optional[float] = None) -> StdoutStderr:
+        self._check_modify(task)
+
+        return await self.import_(task, timeout=timeout)
+
+    async def delete(self, task: Task, timeout: Optional[float] = None) -> StdoutStderr:
+        self._check_delete(task)
+
+        return await self._execute(str(task.uuid), "delete", timeout=timeout)
+
+    async def filter(
+        self,
+        *params: Union[FilterSpec, Q],
+        timeout: Optional[float] = None,
+        validate: Validation = "eager",
+        fields: Optional[Collection[str]] = None,
+        **dictparams: Any,
+    ) -> List[Task]:
+        self._check_read_options(validate, fields)
+        q = Q(*params, **dictparams)
+
+        stdout, _ = await self._execute(q.serialize(), "export", timeout=timeout)
+
+        # Parsing a large export takes long enough to stall the event loop
+        return await asyncio.get_running_loop().run_in_executor(
+            None, self._parse_export, stdout, validate, fields
+        )
+
+    async def count(
+        self,
+        *params: Union[FilterSpec, Q],
+        timeout: Optional[float] = None,
+        **dictparams: Any,
+    ) -> int:
+        q = Q(*params, **dictparams)
+
+        stdout, _ = await self._execute(q.serialize(), "count", timeout=timeout)
+
+        return int(stdout)
+
+    async def get(
+        self,
+        *params: Union[FilterSpec, Q],
+        timeout: Optional[float] = None,
+        **dictparams: Any,
+    ) -> Task:
+        q = Q(*params, **dictparams)
+
+        return self._get_single(await self.filter(q, timeout=timeout), q)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+from typing import Hashable
+from typing import NamedTuple
+from typing import Optional
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class CacheEntry(NamedTuple):
+    fingerprint: Hashable
+    stored_at: float
+    size: int
+    value: Any
+
+
+class ResultCache:
+    """A least-recently-used cache of results read from Taskwarrior.
+
+    Each entry is stored alongside a fingerprint of the data files it was
+    read from; entries whose fingerprint no longer matches are discarded
+    when next requested.
+
+    * `max_bytes`: the approximate total size that cached results may use;
+      least-recently-used entries are evicted to stay within this budget.
+    * `ttl`: if set, the number of seconds after which an entry is
+      discarded even if the data files have not changed.  This is useful if
+      you filter using relative dates (e.g. `due__before='today'`) whose
+      meaning changes over time.
+
+    """
+
+    max_bytes: int
+    ttl: Optional[float]
+
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES, ttl: Optional[float] = None):
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+
+        self._entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, fingerprint: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self.misses += 1
+                return None
+
+            if entry.fingerprint != fingerprint or (
+                self.ttl is not None and time.monotonic() - entry.stored_at > self.ttl
+            ):
+                self._remove(key)
+                self.invalidations += 1
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def set(self, key: Hashable, fingerprint: Hashable, value: Any) -> None:
+        size = sys.getsizeof(value)
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            if size > self.max_bytes:
+                return
+
+            while self._entries and self._size + size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+            self._entries[key] = CacheEntry(fingerprint, time.monotonic(), size, value)
+            self._size += size
+
+    def clear(self) -> None:
+        with self._lock:
+            if self._entries:
+                self.invalidations += len(self._entries)
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key)
+        self._size -= entry.size
+
+    def __repr__(self):
+        return (
+            f"ResultCache(entries={len(self)}, size={self._size}, "
+            f"hits={self.hits}, misses={self.misses}, "
+            f"evictions={self.evictions}, invalidations={self.invalidations})"
+        )
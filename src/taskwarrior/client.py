@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+import contextlib
+import copy
 import datetime
+import json
 import os
-import subprocess
+import time
 import uuid
+from typing import IO
+from typing import TYPE_CHECKING
 from typing import Any
+from typing import Callable
+from typing import Collection
 from typing import Dict
+from typing import Generator
 from typing import Iterable
+from typing import Iterator
 from typing import List
 from typing import Optional
 from typing import Sequence
@@ -14,24 +23,77 @@ from typing import Tuple
 from typing import Union
 from typing import cast
 
-from pydantic import parse_raw_as
 from typing_extensions import Literal
 
+from .cache import ResultCache
 from .exceptions import ClientError
 from .exceptions import ClientUsageError
 from .exceptions import CommandError
 from .exceptions import MultipleObjectsFound
 from .exceptions import NotFound
-from .task import Task
+from .exceptions import UnsupportedFilter
+from .executors import Executor
+from .executors import SubprocessExecutor
+from .instrumentation import CommandEvent
+from .instrumentation import Observer
+from .instrumentation import ParseEvent
 from .types import DictFilterSpec
 from .types import FilterSpec
+from .types import ImportResult
 from .types import StdoutStderr
+from .types import Validation
+from .utils import CountingReader
+from .utils import chunked
 from .utils import convert_dict_to_override_args
+from .utils import flatten_config_dict
+from .utils import iter_json_array
+from .utils import read_taskrc
 
+# Modules using pydantic, dateutil, or pytz (e.g. `.task`) are imported only
+# when first needed, so that `import taskwarrior` followed by a `count` or
+# `delete` stays quick for short-lived scripts.
+if TYPE_CHECKING:
+    import concurrent.futures
+
+    from .columns import Columns
+    from .compact import CompactTaskList
+    from .evaluate import Predicate
+    from .session import Session
+    from .task import Task
+    from .watch import ChangeFeed
+    from .writes import WriteQueue
+
+DEFAULT_IMPORT_CHUNK_SIZE = 1000
+# UUIDs per `get_many` query; keeps each filter argument well below the
+# kernel's 128KiB limit on the length of a single argument.
+DEFAULT_GET_MANY_CHUNK_SIZE = 1000
+# UUIDs per `task delete` invocation, for the same reason.
+DEFAULT_DELETE_CHUNK_SIZE = 1000
+# Exported tasks held in memory at once by `to_columns`
+DEFAULT_COLUMN_CHUNK_SIZE = 10000
+DEFAULT_DATA_LOCATION = "~/.task"
+DATA_FILENAMES = ("pending.data", "completed.data", "undo.data", "backlog.data")
+TRUTHY_CONFIG_VALUES = ("1", "on", "true", "y", "yes")
+# Keeps mass deletions from matching (and counting) already-deleted tasks
+NOT_DELETED_FILTER = "status.not:deleted"
+COMMAND_VERBS = frozenset(
+    ["_uuids", "add", "count", "delete", "export", "import", "modify"]
+)
+
+
+class BaseClient:
+    """Behaviour shared by `Client` and `AsyncClient`.
+
+    Nothing here starts a Taskwarrior process; subclasses decide how
+    commands are executed.
+
+    """
 
-class Client:
     _task_bin: str
     _config_filename: str
+    _command_prefix: Optional[List[str]] = None
+    _observers: Sequence[Observer] = ()
+    _env: Optional[Dict[str, str]] = None
     _config_overrides: Dict[str, Any] = {
         "verbose": "nothing",
         "json": {"array": "TRUE", "depends": {"array": "on"}},
@@ -40,6 +102,8 @@ class Client:
             "confirmation": "no",
         },
         "recurrence": {"confirmation": "no"},
+        # Never ask before changing many tasks at once
+        "bulk": 0,
     }
 
     def __init__(
@@ -54,51 +118,122 @@ class Client:
             or os.getenv("TASKRC", os.path.expanduser("~/.taskrc"))
             or ""
         )
+        # Copied so that overrides given to one client do not affect others
+        self._config_overrides = copy.deepcopy(self._config_overrides)
         self._config_overrides.update(config_overrides or {})
 
         super().__init__()
 
-    def _execute(self, *args: str, stdin: str = "") -> StdoutStderr:
-        command = [
-            self._task_bin,
-            *convert_dict_to_override_args(self._config_overrides),
-            *[str(arg) for arg in args if arg],
-        ]
+    def add_observer(self, observer: Observer) -> None:
+        self._observers = [*self._observers, observer]
 
-        env = os.environ.copy()
-        env["TASKRC"] = self._config_filename
+    def remove_observer(self, observer: Observer) -> None:
+        self._observers = [item for item in self._observers if item is not observer]
 
-        try:
-            proc = subprocess.Popen(
-                command,
-                env=env,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
-            raw_stdout, raw_stderr = proc.communicate(stdin.encode("utf-8"))
-        except FileNotFoundError:
-            raise ClientError(
-                f"Taskwarrior client at '{self._task_bin}' could not be found."
-            )
+    def _notify_command_finished(
+        self,
+        args: Sequence[str],
+        command: List[str],
+        wall_time: float,
+        result: Any,
+        stdout_bytes: Optional[int] = None,
+    ) -> None:
+        # The verb is the first argument Taskwarrior would treat as a command;
+        # everything before it is the filter.
+        position = next(
+            (i for i, arg in enumerate(args) if arg in COMMAND_VERBS), len(args)
+        )
+        event = CommandEvent(
+            verb=args[position] if position < len(args) else "",
+            filter=" ".join(str(arg) for arg in args[:position] if arg),
+            command=command,
+            wall_time=wall_time,
+            cpu_time=result.cpu_time,
+            stdout_bytes=len(result.stdout) if stdout_bytes is None else stdout_bytes,
+            stderr_bytes=len(result.stderr),
+            return_code=result.return_code,
+        )
+        for observer in self._observers:
+            observer.command_finished(event)
+
+    def _notify_command_failed(self, command: List[str], error: BaseException) -> None:
+        for observer in self._observers:
+            observer.command_failed(command, error)
+
+    def update_config_overrides(self, config_overrides: Dict[str, Any]) -> None:
+        """Adds to (or replaces) the configuration overrides of this client."""
+        self._config_overrides.update(config_overrides)
+
+        self._command_prefix = None
+        self._env = None
+
+    def get_config(self) -> Dict[str, str]:
+        """Returns the settings from your taskrc and configuration overrides.
 
+        Settings having their default value because they were not set in
+        either place are not included.
+
+        """
+        config = read_taskrc(self._config_filename)
+        config.update(flatten_config_dict(self._config_overrides))
+
+        return config
+
+    def get_data_location(self) -> str:
+        return os.path.expanduser(
+            self.get_config().get("data.location", DEFAULT_DATA_LOCATION)
+        )
+
+    def _get_uda_types(self, config: Dict[str, str]) -> Dict[str, str]:
+        return {
+            key.split(".")[1]: value
+            for key, value in config.items()
+            if key.startswith("uda.") and key.endswith(".type") and key.count(".") == 2
+        }
+
+    def _get_command_prefix(self) -> List[str]:
+        if self._command_prefix is None:
+            self._command_prefix = [
+                self._task_bin,
+                *convert_dict_to_override_args(self._config_overrides),
+            ]
+
+        return self._command_prefix
+
+    def _get_command(self, *args: str) -> List[str]:
+        return [*self._get_command_prefix(), *[str(arg) for arg in args if arg]]
+
+    def _get_env(self) -> Dict[str, str]:
+        """Returns the environment for Taskwarrior processes.
+
+        The environment is built only once per client; later changes to
+        `os.environ` are not seen.
+
+        """
+        if self._env is None:
+            env = os.environ.copy()
+            env["TASKRC"] = self._config_filename
+            self._env = env
+
+        return self._env
+
+    def _get_result(
+        self, command: List[str], return_code: int, raw_stdout: bytes, raw_stderr: bytes
+    ) -> StdoutStderr:
         stdout = raw_stdout.decode("utf-8", "replace")
         stderr = raw_stderr.decode("utf-8", "replace")
 
-        if proc.returncode != 0:
+        if return_code != 0:
             raise CommandError(
                 command,
                 stderr,
                 stdout,
-                proc.returncode,
+                return_code,
             )
 
         return stdout, stderr
 
-    def import_(self, task: Task) -> StdoutStderr:
-        return self._execute("import", stdin=task.json(exclude_unset=True))
-
-    def add(self, task: Task) -> StdoutStderr:
+    def _prepare_add(self, task: Task) -> None:
         if task.uuid:
             raise ClientUsageError(
                 "Task already has a UUID set.  You may want to use `add` instead."
@@ -106,56 +241,798 @@ class Client:
 
         task.uuid = uuid.uuid4()
 
-        return self.import_(task)
-
-    def modify(self, task: Task) -> StdoutStderr:
+    def _check_modify(self, task: Task) -> None:
         if not task.uuid:
             raise ClientUsageError(
                 "Task has no UUID set.  You may want to use `add` instead."
             )
 
+    def _check_delete(self, task: Task) -> None:
+        if not task.uuid:
+            raise ClientUsageError("Task has no UUID set.")
+
+    def _check_import(self, task: Task) -> None:
+        from .task import ProjectedTask
+
+        if isinstance(task, ProjectedTask):
+            raise ClientUsageError(
+                "Task was retrieved using `fields` and holds only some of its "
+                "fields; importing it would erase the others."
+            )
+
+    def _check_read_options(
+        self, validate: Validation, fields: Optional[Collection[str]] = None
+    ) -> None:
+        # `validate` and `fields` would otherwise silently shadow filters on
+        # UDAs of the same name
+        if validate not in ("eager", "lazy"):
+            raise ClientUsageError(
+                f"Unknown validation {validate!r}.  To filter on a UDA named "
+                "`validate`, pass a `Q` or a dict, e.g. `Q(validate=...)`."
+            )
+        if isinstance(fields, str):
+            raise ClientUsageError(
+                "`fields` must be a collection of field names.  To filter on a "
+                "UDA named `fields`, pass a `Q` or a dict, e.g. `Q(fields=...)`."
+            )
+
+    def _parse_task(
+        self,
+        data: Dict[str, Any],
+        validate: Validation,
+        fields: Optional[Collection[str]] = None,
+    ) -> Task:
+        from .task import LazyTask
+        from .task import ProjectedTask
+        from .task import Task
+
+        if fields is not None:
+            return ProjectedTask.from_export_fields(data, fields, validate=validate)
+        elif validate == "lazy":
+            return LazyTask.from_export(data)
+        return Task.parse_obj(data)
+
+    def _parse_export(
+        self,
+        stdout: str,
+        validate: Validation,
+        fields: Optional[Collection[str]] = None,
+    ) -> List[Task]:
+        observers = self._observers
+        if observers:
+            for observer in observers:
+                observer.parse_started(len(stdout))
+            started = time.perf_counter()
+
+        tasks: List[Task]
+        if fields is None and validate == "eager":
+            from pydantic import parse_raw_as
+
+            from .task import Task
+
+            tasks = parse_raw_as(List[Task], stdout)
+        else:
+            tasks = [
+                self._parse_task(data, validate, fields)
+                for data in json.loads(
+                    stdout or "[]",
+                    object_pairs_hook=(
+                        None if fields is None else get_projecting_hook(fields)
+                    ),
+                )
+            ]
+
+        if observers:
+            event = ParseEvent(
+                wall_time=time.perf_counter() - started,
+                task_count=len(tasks),
+                input_bytes=len(stdout),
+                validate=validate,
+            )
+            for observer in observers:
+                observer.parse_finished(event)
+
+        return tasks
+
+    @staticmethod
+    def _count_tasks(statuses: Iterable[Optional[str]]) -> int:
+        """Counts tasks, given their statuses, as `task count` would."""
+        # Like Taskwarrior, recurring parent tasks are not counted
+        return sum(1 for status in statuses if status != "recurring")
+
+    def _get_single(self, result: List[Task], q: Q) -> Task:
+        if len(result) == 1:
+            return result[0]
+        elif len(result) == 0:
+            raise NotFound(q.serialize())
+        else:
+            raise MultipleObjectsFound(q.serialize())
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._config_filename})"
+
+
+class Client(BaseClient):
+    _read_backend: Literal["task", "native"]
+    _cache: Optional[ResultCache]
+    _executor: Executor
+    _use_write_queue: bool
+    _write_queue: Optional[WriteQueue]
+
+    def __init__(
+        self,
+        config_filename: Optional[str] = None,
+        config_overrides: Optional[Dict[str, Any]] = None,
+        task_bin: str = "task",
+        read_backend: Literal["task", "native"] = "task",
+        cache: Optional[ResultCache] = None,
+        executor: Optional[Executor] = None,
+        observers: Iterable[Observer] = (),
+        write_queue: bool = False,
+    ):
+        self._read_backend = read_backend
+        self._cache = cache
+        self._executor = executor or SubprocessExecutor()
+        self._observers = list(observers)
+        self._use_write_queue = write_queue
+        self._write_queue = None
+
+        super().__init__(
+            config_filename=config_filename,
+            config_overrides=config_overrides,
+            task_bin=task_bin,
+        )
+
+    def _filter_native(
+        self,
+        q: Q,
+        validate: Validation = "eager",
+        fields: Optional[Collection[str]] = None,
+    ) -> List[Task]:
+        """Filters tasks by reading Taskwarrior's data files directly.
+
+        Raises `UnsupportedFilter` if the filter cannot be evaluated without
+        using Taskwarrior itself.
+
+        """
+        return [
+            self._parse_task(data, validate, fields)
+            for data in self._iter_native_export(q)
+        ]
+
+    def _iter_native_export(self, q: Q) -> Iterator[Dict[str, Any]]:
+        """Yields the decoded export of each task matching `q`.
+
+        Raises `UnsupportedFilter` (before yielding anything) if the filter
+        cannot be evaluated without using Taskwarrior itself.
+
+        """
+        config = self.get_config()
+        if config.get("search.case.sensitive", "yes") not in TRUTHY_CONFIG_VALUES:
+            raise UnsupportedFilter("Case-insensitive searches are not supported.")
+
+        from .datafile import DataFileReader
+        from .evaluate import compile_filter
+        from .task import LazyTask
+
+        uda_types = self._get_uda_types(config)
+        # The data files hold no urgency; only Taskwarrior computes it
+        predicate = compile_filter(q, udas=uda_types, unavailable=["urgency"])
+        reader = DataFileReader(
+            os.path.expanduser(config.get("data.location", DEFAULT_DATA_LOCATION)),
+            uda_types=uda_types,
+        )
+
+        # Filters are evaluated against lazily-validated tasks so that only
+        # the fields the filter uses need to be validated.
+        return (
+            data
+            for data in reader.iter_export()
+            if predicate(LazyTask.from_export(data))
+        )
+
+    @property
+    def cache(self) -> Optional[ResultCache]:
+        return self._cache
+
+    def _get_data_fingerprint(self) -> Tuple[Tuple[str, int, int], ...]:
+        data_location = self.get_data_location()
+
+        fingerprint: List[Tuple[str, int, int]] = []
+        for filename in DATA_FILENAMES:
+            try:
+                stat = os.stat(os.path.join(data_location, filename))
+            except OSError:
+                continue
+            fingerprint.append((filename, stat.st_mtime_ns, stat.st_size))
+
+        return tuple(fingerprint)
+
+    def _execute_cached(self, *args: str) -> str:
+        """Executes a read-only command, using the result cache if enabled.
+
+        Returns the command's stdout.
+
+        """
+        if self._cache is None:
+            stdout, _ = self._execute(*args)
+            return stdout
+
+        key = (
+            self._config_filename,
+            tuple(self._get_command_prefix()),
+            args,
+        )
+        # The fingerprint is taken before executing the command so that
+        # changes made while the command is running invalidate its result.
+        fingerprint = self._get_data_fingerprint()
+
+        cached = self._cache.get(key, fingerprint)
+        if cached is not None:
+            return cached
+
+        stdout, _ = self._execute(*args)
+        self._cache.set(key, fingerprint, stdout)
+
+        return stdout
+
+    def _invalidate_cache(self) -> None:
+        if self._cache is not None:
+            self._cache.clear()
+
+    def _execute(self, *args: str, stdin: str = "") -> StdoutStderr:
+        command = self._get_command(*args)
+
+        observers = self._observers
+        if observers:
+            for observer in observers:
+                observer.command_started(command)
+            started = time.perf_counter()
+
+        try:
+            result = self._executor.run(command, self._get_env(), stdin.encode("utf-8"))
+        except BaseException as e:
+            if observers:
+                self._notify_command_failed(command, e)
+            if isinstance(e, FileNotFoundError):
+                raise ClientError(
+                    f"Taskwarrior client at '{self._task_bin}' could not be found."
+                )
+            raise
+
+        if observers:
+            self._notify_command_finished(
+                args, command, time.perf_counter() - started, result
+            )
+
+        return self._get_result(
+            command, result.return_code, result.stdout, result.stderr
+        )
+
+    def import_(self, task: Task) -> StdoutStderr:
+        if self._use_write_queue:
+            return self.submit_import(task).result()
+
+        self._check_import(task)
+        self._invalidate_cache()
+
+        return self._execute("import", stdin=task.json(exclude_unset=True))
+
+    def submit_import(self, task: Task) -> concurrent.futures.Future:
+        """Queues the import of `task` on its data location's write queue.
+
+        Returns a future whose result is the output of the `task import`
+        that imported it.  See `taskwarrior.writes.WriteQueue`.
+
+        """
+        self._check_import(task)
+
+        return self.get_write_queue().submit(self, "import", task)
+
+    def import_many(
+        self, tasks: Iterable[Task], chunk_size: int = DEFAULT_IMPORT_CHUNK_SIZE
+    ) -> List[ImportResult]:
+        """Imports many tasks using as few `task import` invocations as possible.
+
+        Tasks are sent to Taskwarrior as a single JSON array per chunk of
+        `chunk_size` tasks.  Tasks not yet having a UUID are assigned one.
+
+        Returns one `ImportResult` per task, in the order the tasks were
+        provided; if the import of a chunk fails, each task in that chunk
+        will have its `error` set to the raised `CommandError` and the
+        remaining chunks will still be imported.
+
+        """
+        if chunk_size < 1:
+            raise ClientUsageError("Chunk size must be a positive integer.")
+
+        tasks = list(tasks)
+        for task in tasks:
+            self._check_import(task)
+
+        self._invalidate_cache()
+
+        results: List[ImportResult] = []
+
+        for chunk in chunked(tasks, chunk_size):
+            for task in chunk:
+                if not task.uuid:
+                    task.uuid = uuid.uuid4()
+
+            error: Optional[CommandError] = None
+            try:
+                self._execute(
+                    "import",
+                    stdin=f"[{','.join(t.json(exclude_unset=True) for t in chunk)}]",
+                )
+            except CommandError as e:
+                error = e
+
+            results.extend(ImportResult(task, error) for task in chunk)
+
+        return results
+
+    def add(self, task: Task) -> StdoutStderr:
+        self._prepare_add(task)
+
+        return self.import_(task)
+
+    def modify(self, task: Task) -> StdoutStderr:
+        self._check_modify(task)
+
         return self.import_(task)
 
+    def add_many(
+        self, tasks: Iterable[Task], chunk_size: int = DEFAULT_IMPORT_CHUNK_SIZE
+    ) -> List[ImportResult]:
+        tasks = list(tasks)
+
+        for task in tasks:
+            if task.uuid:
+                raise ClientUsageError(
+                    f"Task {task.uuid} already has a UUID set.  "
+                    "You may want to use `modify_many` instead."
+                )
+
+        return self.import_many(tasks, chunk_size=chunk_size)
+
+    def modify_many(
+        self, tasks: Iterable[Task], chunk_size: int = DEFAULT_IMPORT_CHUNK_SIZE
+    ) -> List[ImportResult]:
+        tasks = list(tasks)
+
+        for task in tasks:
+            if not task.uuid:
+                raise ClientUsageError(
+                    "Task has no UUID set.  You may want to use `add_many` instead."
+                )
+
+        return self.import_many(tasks, chunk_size=chunk_size)
+
     def delete(self, task: Task) -> StdoutStderr:
-        if not task.uuid:
-            raise ClientUsageError("Task has no UUID set.")
+        if self._use_write_queue:
+            return self.submit_delete(task).result()
+
+        self._check_delete(task)
+
+        self._invalidate_cache()
 
         return self._execute(str(task.uuid), "delete")
 
+    def submit_delete(self, task: Task) -> concurrent.futures.Future:
+        """Queues the deletion of `task` on its data location's write queue.
+
+        Returns a future whose result is the output of the `task delete`
+        that deleted it.  See `taskwarrior.writes.WriteQueue`.
+
+        """
+        self._check_delete(task)
+
+        return self.get_write_queue().submit(self, "delete", task)
+
+    def delete_many(
+        self,
+        tasks: Iterable[Union[Task, str, uuid.UUID]],
+        chunk_size: int = DEFAULT_DELETE_CHUNK_SIZE,
+    ) -> int:
+        """Deletes many tasks using one `task delete` per `chunk_size` tasks.
+
+        Accepts tasks or their UUIDs.  Returns the number of tasks deleted;
+        UUIDs of tasks that do not exist or were already deleted are skipped
+        and not counted.
+
+        """
+        if chunk_size < 1:
+            raise ClientUsageError("Chunk size must be a positive integer.")
+
+        uuids: List[str] = []
+        for task in tasks:
+            if isinstance(task, (str, uuid.UUID)):
+                uuids.append(str(uuid.UUID(str(task))))
+            else:
+                self._check_delete(task)
+                uuids.append(str(task.uuid))
+
+        # A single `task _uuids` lists the tasks that can still be deleted;
+        # each Taskwarrior process reads every task anyway, so this is cheaper
+        # than counting the tasks of each chunk.
+        deletable = set(self._execute_cached(NOT_DELETED_FILTER, "_uuids").split())
+        uuids = [
+            task_uuid for task_uuid in dict.fromkeys(uuids) if task_uuid in deletable
+        ]
+
+        for chunk in chunked(uuids, chunk_size):
+            self._invalidate_cache()
+            self._execute(*chunk, NOT_DELETED_FILTER, "delete")
+
+        return len(uuids)
+
+    def delete_where(self, q: Groupable) -> int:
+        """Deletes every task matching `q` using a single `task delete`.
+
+        Returns the number of tasks deleted; tasks matching `q` that were
+        already deleted are not counted.
+
+        """
+        filter_string = f"{self._get_mass_filter(q)} {NOT_DELETED_FILTER}"
+
+        affected = self.count(filter_string)
+        if affected:
+            self._invalidate_cache()
+            self._execute(filter_string, "delete")
+
+        return affected
+
+    def modify_where(self, q: Groupable, **changes: Any) -> int:
+        """Changes every task matching `q` using a single `task modify`.
+
+        Each keyword argument sets an attribute; e.g.
+        `modify_where(Q(project="Home"), project="House", due=None)` moves
+        tasks to the "House" project and clears their due dates.  Lists
+        (e.g. `tags=["a", "b"]`) replace the attribute's existing values.
+        Returns the number of tasks matching `q`.
+
+        """
+        if not changes:
+            raise ClientUsageError("No changes were provided.")
+
+        filter_string = self._get_mass_filter(q)
+
+        affected = self.count(filter_string)
+        if affected:
+            self._invalidate_cache()
+            self._execute(
+                filter_string,
+                "modify",
+                *(
+                    f"{key}:{quote_modification_value(value)}"
+                    for key, value in changes.items()
+                ),
+            )
+
+        return affected
+
+    def _get_mass_filter(self, q: Groupable) -> str:
+        filter_string = q.serialize()
+        if not filter_string:
+            # Taskwarrior would otherwise change every task
+            raise ClientUsageError("An empty filter matches every task.")
+
+        return filter_string
+
     def filter(
-        self, *params: Sequence[Union[FilterSpec, Q]], **dictparams: DictFilterSpec
+        self,
+        *params: Union[FilterSpec, Q],
+        validate: Validation = "eager",
+        fields: Optional[Collection[str]] = None,
+        **dictparams: Any,
     ) -> List[Task]:
+        """Returns tasks matching the provided filters.
+
+        * `validate`: when `"lazy"`, tasks are returned as `LazyTask`
+          instances whose fields are validated only once accessed.  This is
+          much faster if you will use only a few fields of each task.
+        * `fields`: if set, only these fields are kept (and validated) and
+          tasks are returned as `ProjectedTask` instances.  Projected tasks
+          cannot be passed to `modify` or `import_`.
+
+        To filter on UDAs named `validate` or `fields`, pass a `Q` or a dict
+        rather than keyword arguments.
+
+        """
+        self._check_read_options(validate, fields)
         q = Q(*params, **dictparams)
 
-        stdout, _ = self._execute(q.serialize(), "export")
+        if self._read_backend == "native":
+            try:
+                return self._filter_native(q, validate=validate, fields=fields)
+            except UnsupportedFilter:
+                pass
 
-        return parse_raw_as(List[Task], stdout)
+        stdout = self._execute_cached(q.serialize(), "export")
+
+        return self._parse_export(stdout, validate, fields)
+
+    def iter_filter(
+        self,
+        *params: Union[FilterSpec, Q],
+        validate: Validation = "eager",
+        fields: Optional[Collection[str]] = None,
+        **dictparams: Any,
+    ) -> Iterator[Task]:
+        """Yields matching tasks while Taskwarrior is still exporting them.
+
+        Unlike `filter`, the export is never held in memory in its entirety;
+        each task is parsed and yielded as soon as it has been read.  If
+        iteration is stopped early, the Taskwarrior process is killed.
+
+        """
+        # Checked now rather than when iteration starts
+        self._check_read_options(validate, fields)
+        q = Q(*params, **dictparams)
+
+        return self._iter_tasks(q, validate, fields)
+
+    def _iter_tasks(
+        self, q: Q, validate: Validation, fields: Optional[Collection[str]]
+    ) -> Iterator[Task]:
+        with contextlib.closing(self._iter_export(q, validate)) as exported:
+            for item in exported:
+                yield self._parse_task(item, validate, fields)
+
+    def to_columns(
+        self,
+        *params: Union[FilterSpec, Q],
+        fields: Sequence[str],
+        chunk_size: int = DEFAULT_COLUMN_CHUNK_SIZE,
+        **dictparams: Any,
+    ) -> Columns:
+        """Returns `fields` of the matching tasks as typed columns.
+
+        Columns are built from Taskwarrior's output without creating tasks,
+        `chunk_size` tasks at a time.  Requires NumPy; see
+        `taskwarrior.columns`.
+
+        """
+        from .columns import build_columns
+
+        q = Q(*params, **dictparams)
+
+        with contextlib.closing(self._iter_export(q)) as exported:
+            return build_columns(
+                exported,
+                fields,
+                udas=self._get_uda_types(self.get_config()),
+                chunk_size=chunk_size,
+            )
+
+    def to_compact(
+        self,
+        *params: Union[FilterSpec, Q],
+        validate: Validation = "eager",
+        **dictparams: Any,
+    ) -> CompactTaskList:
+        """Returns the matching tasks in a memory-efficient `CompactTaskList`.
+
+        Tasks are stored as Taskwarrior's output is read, without creating
+        a `Task` for each; see `taskwarrior.compact`.
+
+        """
+        from .compact import CompactTaskList
 
-    def count(
-        self, *params: Sequence[Union[FilterSpec, Q]], **dictparams: DictFilterSpec
-    ) -> int:
         q = Q(*params, **dictparams)
 
-        stdout, _ = self._execute(q.serialize(), "count")
+        with contextlib.closing(self._iter_export(q, validate)) as exported:
+            return CompactTaskList.from_export(
+                exported,
+                udas=self._get_uda_types(self.get_config()),
+                validate=validate,
+            )
+
+    def _iter_export(
+        self, q: Q, validate: Validation = "eager"
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Yields each exported task (as decoded JSON) as soon as it is read.
+
+        `validate` is only reported to observers.
+
+        """
+        args = (q.serialize(), "export")
+        command = self._get_command(*args)
+
+        observers = self._observers
+        if observers:
+            for observer in observers:
+                observer.command_started(command)
+            started = time.perf_counter()
+
+        try:
+            process = self._executor.open(command, self._get_env())
+        except BaseException as e:
+            if observers:
+                self._notify_command_failed(command, e)
+            if isinstance(e, FileNotFoundError):
+                raise ClientError(
+                    f"Taskwarrior client at '{self._task_bin}' could not be found."
+                )
+            raise
+
+        stdout = CountingReader(process.stdout)
+        task_count = 0
+        completed = False
+        try:
+            for item in iter_json_array(cast(IO[bytes], stdout)):
+                task_count += 1
+                yield item
+            completed = True
+        finally:
+            try:
+                result = process.wait(not completed)
+            except BaseException as e:
+                if observers:
+                    self._notify_command_failed(command, e)
+                raise
+            if observers:
+                wall_time = time.perf_counter() - started
+                self._notify_command_finished(
+                    args, command, wall_time, result, stdout.bytes_read
+                )
+
+        if observers:
+            # Tasks are decoded while Taskwarrior is still writing them, so
+            # the time taken includes that of the command.
+            event = ParseEvent(
+                wall_time=wall_time,
+                task_count=task_count,
+                input_bytes=stdout.bytes_read,
+                validate=validate,
+            )
+            for observer in observers:
+                observer.parse_finished(event)
+
+        if result.return_code != 0:
+            raise CommandError(
+                command,
+                result.stderr.decode("utf-8", "replace"),
+                "",
+                result.return_code,
+            )
+
+    def count(self, *params: Union[FilterSpec, Q], **dictparams: Any) -> int:
+        q = Q(*params, **dictparams)
+
+        if self._read_backend == "native":
+            try:
+                # Only the status of each matching task is read
+                return self._count_tasks(
+                    data.get("status") for data in self._iter_native_export(q)
+                )
+            except UnsupportedFilter:
+                pass
+
+        stdout = self._execute_cached(q.serialize(), "count")
 
         return int(stdout)
 
-    def get(
-        self, *params: Sequence[Union[FilterSpec, Q]], **dictparams: DictFilterSpec
-    ) -> Task:
-        result = self.filter(*params, **dictparams)
+    def get(self, *params: Union[FilterSpec, Q], **dictparams: Any) -> Task:
+        q = Q(*params, **dictparams)
 
-        if len(result) == 1:
-            return result[0]
-        else:
-            q = Q(*params, **dictparams)
-            if len(result) == 0:
-                raise NotFound(q.serialize())
-            else:
-                raise MultipleObjectsFound(q.serialize())
+        return self._get_single(self.filter(q), q)
 
-    def __repr__(self):
-        return f"Client({self._config_filename})"
+    def session(self, chunk_size: int = DEFAULT_IMPORT_CHUNK_SIZE) -> Session:
+        """Returns a `Session` collecting changes to write them in batches.
+
+        See `taskwarrior.session.Session`.
+
+        """
+        from .session import Session
+
+        return Session(self, chunk_size=chunk_size)
+
+    def watch(
+        self, debounce: Optional[float] = None, parse_undo: bool = False
+    ) -> ChangeFeed:
+        """Returns a `ChangeFeed` reporting changes to this data location.
+
+        See `taskwarrior.watch.ChangeFeed`; Linux only.
+
+        """
+        from .watch import DEFAULT_DEBOUNCE
+        from .watch import ChangeFeed
+
+        return ChangeFeed.from_client(
+            self,
+            debounce=DEFAULT_DEBOUNCE if debounce is None else debounce,
+            parse_undo=parse_undo,
+        )
+
+    def get_write_queue(self) -> WriteQueue:
+        """Returns the write queue shared by clients of this data location."""
+        if self._write_queue is None:
+            from .writes import get_write_queue
+
+            self._write_queue = get_write_queue(self.get_data_location())
+
+        return self._write_queue
+
+    def get_many(
+        self,
+        uuids: Iterable[Union[str, uuid.UUID]],
+        chunk_size: int = DEFAULT_GET_MANY_CHUNK_SIZE,
+        validate: Validation = "eager",
+        fields: Optional[Collection[str]] = None,
+    ) -> Dict[uuid.UUID, Optional[Task]]:
+        """Returns the tasks having each of the provided UUIDs.
+
+        Tasks are fetched using one query per `chunk_size` UUIDs rather
+        than one per task.  The returned dictionary has an entry for every
+        requested UUID; its value is `None` if no such task exists.
+
+        """
+        requested = list(
+            dict.fromkeys(
+                value if isinstance(value, uuid.UUID) else uuid.UUID(value)
+                for value in uuids
+            )
+        )
+        if fields is not None:
+            fields = {"uuid", *fields}
+
+        found: Dict[uuid.UUID, Optional[Task]] = {}
+        for chunk in chunked(requested, chunk_size):
+            # Bare UUIDs in a filter match any of them
+            for task in self.filter(
+                " ".join(str(value) for value in chunk),
+                validate=validate,
+                fields=fields,
+            ):
+                found[cast(uuid.UUID, task.uuid)] = task
+
+        return {value: found.get(value) for value in requested}
+
+    def resolve_depends(
+        self,
+        tasks: Iterable[Task],
+        depth: Optional[int] = None,
+        chunk_size: int = DEFAULT_GET_MANY_CHUNK_SIZE,
+    ) -> Dict[uuid.UUID, Optional[Task]]:
+        """Returns the tasks that `tasks` depend upon, directly or indirectly.
+
+        Dependencies are followed breadth-first using one `get_many` call
+        per level.  If `depth` is set, only that many levels are followed
+        (`depth=1` returns only direct dependencies).  The value for a
+        dependency that does not exist is `None`.
+
+        """
+        tasks = list(tasks)
+        known: Dict[uuid.UUID, Optional[Task]] = {
+            task.uuid: task for task in tasks if task.uuid
+        }
+        resolved: Dict[uuid.UUID, Optional[Task]] = {}
+
+        level = tasks
+        levels = 0
+        while level and (depth is None or levels < depth):
+            wanted = [
+                dependency
+                for dependency in dict.fromkeys(
+                    dependency for task in level for dependency in task.depends or []
+                )
+                if dependency not in resolved
+            ]
+            fetched = self.get_many(
+                [dependency for dependency in wanted if dependency not in known],
+                chunk_size=chunk_size,
+            )
+            known.update(fetched)
+
+            for dependency in wanted:
+                resolved[dependency] = known[dependency]
+
+            level = [task for task in fetched.values() if task is not None]
+            levels += 1
+
+        return resolved
 
 
 class Groupable:
@@ -181,6 +1058,28 @@ class Groupable:
             f"{self._logical_operands[1].serialize()})"
         )
 
+    def compile(self, udas: Optional[Dict[str, str]] = None) -> Predicate:
+        """Compiles this filter into a function evaluating it locally.
+
+        See `taskwarrior.evaluate` for which filters can be evaluated without
+        Taskwarrior; `UnsupportedFilter` is raised for any others.
+
+        """
+        from .evaluate import compile_filter
+
+        return compile_filter(self, udas=udas)
+
+    def matches(self, task: Task, udas: Optional[Dict[str, str]] = None) -> bool:
+        return self.compile(udas=udas)(task)
+
+    def filter_tasks(
+        self, tasks: Iterable[Task], udas: Optional[Dict[str, str]] = None
+    ) -> List[Task]:
+        """Returns the tasks in `tasks` matching this filter."""
+        predicate = self.compile(udas=udas)
+
+        return [task for task in tasks if predicate(task)]
+
     def __str__(self):
         return self.serialize()
 
@@ -191,9 +1090,7 @@ class Groupable:
 class Q(Groupable):
     _params: List[Union[FilterSpec, Q]]
 
-    def __init__(
-        self, *params: Iterable[Union[FilterSpec, Q]], **dictparams: DictFilterSpec
-    ):
+    def __init__(self, *params: Union[FilterSpec, Q], **dictparams: Any):
         self._params = cast(List[Union[FilterSpec, Q]], list(params)) + [dictparams]
 
     def serialize(self):
@@ -231,14 +1128,56 @@ def dictfilterspec_to_string(spec: DictFilterSpec) -> str:
     return f"({' '.join(parts)})"
 
 
+def get_projecting_hook(
+    fields: Collection[str],
+) -> Callable[[List[Tuple[str, Any]]], Dict[str, Any]]:
+    """Returns a `json.loads` hook keeping only `fields` of each exported task.
+
+    Unwanted values are discarded as each task is decoded, rather than
+    being held until the entire export has been decoded.
+
+    """
+    wanted = frozenset(fields)
+
+    def project(pairs: List[Tuple[str, Any]]) -> Dict[str, Any]:
+        # Annotations, the only objects nested in tasks, have no UUID
+        for name, _ in pairs:
+            if name == "uuid":
+                return {name: value for name, value in pairs if name in wanted}
+        return dict(pairs)
+
+    return project
+
+
+def modification_value_to_string(value: Any) -> str:
+    if value is None:
+        return ""
+    elif isinstance(value, (list, tuple, set)):
+        return ",".join(str(item) for item in value)
+    return dictfilterspec_value_to_string(value)
+
+
+def quote_modification_value(value: Any) -> str:
+    """Quotes a modification value so Taskwarrior reads it as a single word."""
+    string = modification_value_to_string(value)
+    if not string:
+        return ""
+    escaped = string.replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
+
+
 def dictfilterspec_value_to_string(value: Any) -> str:
     if isinstance(value, str):
         return value
     elif isinstance(value, float):
         return str(value)
-    elif isinstance(value, datetime.date):
-        return value.strftime("%Y-%m-%d")
     elif isinstance(value, datetime.datetime):
+        if value.tzinfo is not None:
+            return value.astimezone(datetime.timezone.utc).strftime(
+                "%Y-%m-%dT%H:%M:%SZ"
+            )
         return value.strftime("%Y-%m-%dT%H:%M:%S")
+    elif isinstance(value, datetime.date):
+        return value.strftime("%Y-%m-%d")
     else:
         return str(value)
@@ -0,0 +1,375 @@
+"""Converts exported tasks into typed columns for analysis.
+
+`Client.to_columns` builds columns directly from `task export` output,
+without creating a `Task` for each exported task::
+
+    columns = client.to_columns(status="completed", fields=["end", "project"])
+    columns["end"]  # a `numpy.ndarray` of `datetime64[s]`
+    columns.to_pandas()
+
+Requires NumPy (`pip install taskwarrior[columns]`); `Columns.to_arrow` also
+requires PyArrow (`taskwarrior[arrow]`) and `Columns.to_pandas` pandas
+(`taskwarrior[pandas]`).
+
+Each field becomes a column whose representation depends on its type:
+
+* date fields (including date UDAs): `datetime64[s]` arrays in UTC, with
+  `NaT` for missing values;
+* `urgency`, `imask`, and numeric UDAs: `float64` arrays, with `NaN` for
+  missing values; `id`: an `int64` array, with 0 for missing values;
+* `project`, `status`, `priority`, `recur`, and string UDAs: a
+  `DictionaryColumn` of integer codes into a list of distinct values;
+* `tags`, `depends`, and `annotations` (their descriptions): a
+  `ListColumn` of each task's values, which can be exploded into one row
+  per value;
+* anything else: an `object` array of the exported values.
+
+"""
+from __future__ import annotations
+
+import abc
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from .client import DEFAULT_COLUMN_CHUNK_SIZE
+from .exceptions import ClientUsageError
+from .task import DATE_FIELDS
+from .utils import chunked
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+FLOAT_FIELDS = frozenset(["imask", "urgency"])
+DICTIONARY_FIELDS = frozenset(["priority", "project", "recur", "status"])
+LIST_FIELDS = frozenset(["annotations", "depends", "tags"])
+
+
+class DictionaryColumn:
+    """Dictionary-encoded values: `categories[codes[i]]` is row `i`'s value.
+
+    Missing values have the code -1.
+
+    """
+
+    def __init__(self, codes: np.ndarray, categories: List[Any]):
+        self.codes = codes
+        self.categories = categories
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int) -> Any:
+        code = self.codes[index]
+        return None if code == -1 else self.categories[code]
+
+    def to_numpy(self) -> np.ndarray:
+        """Returns the decoded values as an `object` array."""
+        lookup = np.empty(len(self.categories) + 1, dtype=object)
+        lookup[:-1] = self.categories
+        # Code -1 wraps around to the `None` at the end
+        return lookup[self.codes]
+
+    def to_arrow(self):
+        import pyarrow
+
+        return pyarrow.DictionaryArray.from_arrays(
+            pyarrow.array(self.codes, mask=self.codes == -1),
+            pyarrow.array(self.categories, type=pyarrow.string()),
+        )
+
+    def to_pandas(self):
+        import pandas
+
+        return pandas.Categorical.from_codes(self.codes, self.categories)
+
+    def __repr__(self):
+        return f"DictionaryColumn(rows={len(self)}, categories={len(self.categories)})"
+
+
+class ListColumn:
+    """A list of values per row, stored as one flat sequence of values.
+
+    Row `i`'s values are `values[offsets[i]:offsets[i + 1]]`, as in Arrow.
+
+    """
+
+    def __init__(self, offsets: np.ndarray, values: Any):
+        self.offsets = offsets
+        self.values = values
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> List[Any]:
+        return [
+            self.values[position]
+            for position in range(self.offsets[index], self.offsets[index + 1])
+        ]
+
+    def lengths(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    def explode(self) -> Tuple[np.ndarray, Any]:
+        """Returns the row index of each value, and the values themselves."""
+        return np.repeat(np.arange(len(self)), self.lengths()), self.values
+
+    def to_arrow(self):
+        import pyarrow
+
+        values = self.values
+        if isinstance(values, DictionaryColumn):
+            values = values.to_arrow()
+        return pyarrow.ListArray.from_arrays(pyarrow.array(self.offsets), values)
+
+    def to_pandas(self):
+        import pandas
+
+        return pandas.Series([self[index] for index in range(len(self))], dtype=object)
+
+    def __repr__(self):
+        return f"ListColumn(rows={len(self)}, values={self.offsets[-1]})"
+
+
+class Columns(Mapping[str, Any]):
+    """The columns built from an export, keyed by field name."""
+
+    def __init__(self, columns: Dict[str, Any], length: int):
+        self._columns = columns
+        self._length = length
+
+    def __getitem__(self, field: str) -> Any:
+        return self._columns[field]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._columns)
+
+    def __len__(self) -> int:
+        return len(self._columns)
+
+    @property
+    def rows(self) -> int:
+        return self._length
+
+    def to_arrow(self):
+        """Returns a `pyarrow.Table`; requires PyArrow."""
+        import pyarrow
+
+        return pyarrow.table(
+            {
+                field: (
+                    column.to_arrow()
+                    if isinstance(column, (DictionaryColumn, ListColumn))
+                    else pyarrow.array(column, from_pandas=True)
+                )
+                for field, column in self._columns.items()
+            }
+        )
+
+    def to_pandas(self):
+        """Returns a `pandas.DataFrame`; requires pandas.
+
+        Dictionary-encoded columns become categoricals, and list columns
+        hold a list per row; use `ListColumn.explode` for one row per value.
+
+        """
+        import pandas
+
+        return pandas.DataFrame(
+            {
+                field: (
+                    column.to_pandas()
+                    if isinstance(column, (DictionaryColumn, ListColumn))
+                    else column
+                )
+                for field, column in self._columns.items()
+            }
+        )
+
+    def __repr__(self):
+        return f"Columns(rows={self.rows}, fields={list(self._columns)})"
+
+
+class ColumnBuilder(abc.ABC):
+    """Converts the values of a field, chunk by chunk, into a column."""
+
+    @abc.abstractmethod
+    def add(self, values: List[Any]) -> None: ...
+
+    @abc.abstractmethod
+    def build(self) -> Any: ...
+
+
+class ArrayBuilder(ColumnBuilder):
+    def __init__(self, dtype: Any, missing: Any):
+        self.dtype = dtype
+        self.missing = missing
+        self.chunks: List[np.ndarray] = []
+
+    def add(self, values: List[Any]) -> None:
+        missing = self.missing
+        self.chunks.append(
+            np.array(
+                [missing if value is None else value for value in values],
+                dtype=self.dtype,
+            )
+        )
+
+    def build(self) -> np.ndarray:
+        return _concatenate(self.chunks, self.dtype)
+
+
+class DateBuilder(ArrayBuilder):
+    def __init__(self):
+        super().__init__("datetime64[s]", "NaT")
+
+    def add(self, values: List[Any]) -> None:
+        # NumPy parses ISO 8601 timestamps, but not Taskwarrior's
+        # `20200101T000000Z`; missing values become `NaT`.
+        super().add(
+            [
+                (
+                    f"{value[0:4]}-{value[4:6]}-{value[6:8]}T"
+                    f"{value[9:11]}:{value[11:13]}:{value[13:15]}"
+                    if value is not None and len(value) == 16
+                    else value
+                )
+                for value in values
+            ]
+        )
+
+
+class ObjectBuilder(ArrayBuilder):
+    def __init__(self):
+        super().__init__(object, None)
+
+    def add(self, values: List[Any]) -> None:
+        # Assigned element by element so that lists are not made dimensions
+        chunk = np.empty(len(values), dtype=object)
+        for index, value in enumerate(values):
+            chunk[index] = value
+        self.chunks.append(chunk)
+
+
+class DictionaryBuilder(ColumnBuilder):
+    def __init__(self):
+        self.codes: Dict[Any, int] = {}
+        self.chunks: List[np.ndarray] = []
+
+    def add(self, values: List[Any]) -> None:
+        codes = self.codes
+        chunk = np.empty(len(values), dtype=np.int32)
+        for index, value in enumerate(values):
+            if value is None:
+                chunk[index] = -1
+                continue
+            code = codes.get(value)
+            if code is None:
+                code = codes[value] = len(codes)
+            chunk[index] = code
+        self.chunks.append(chunk)
+
+    def build(self) -> DictionaryColumn:
+        return DictionaryColumn(_concatenate(self.chunks, np.int32), list(self.codes))
+
+
+class ListBuilder(ColumnBuilder):
+    def __init__(self, values: ColumnBuilder):
+        self.values = values
+        self.lengths: List[np.ndarray] = []
+
+    def add(self, values: List[Any]) -> None:
+        lengths = np.empty(len(values), dtype=np.int64)
+        flattened: List[Any] = []
+        for index, value in enumerate(values):
+            value = value or ()
+            lengths[index] = len(value)
+            flattened.extend(value)
+        self.lengths.append(lengths)
+        self.values.add(flattened)
+
+    def build(self) -> ListColumn:
+        lengths = _concatenate(self.lengths, np.int64)
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+
+        return ListColumn(offsets, self.values.build())
+
+
+def get_column_builder(field: str, udas: Mapping[str, str]) -> ColumnBuilder:
+    """Returns a builder for `field`'s column, given the configured UDAs."""
+    uda_type = udas.get(field)
+
+    if field in DATE_FIELDS or uda_type == "date":
+        return DateBuilder()
+    elif field in FLOAT_FIELDS or uda_type == "numeric":
+        return ArrayBuilder(np.float64, np.nan)
+    elif field == "id":
+        return ArrayBuilder(np.int64, 0)
+    elif field in DICTIONARY_FIELDS or uda_type == "string":
+        return DictionaryBuilder()
+    elif field == "tags":
+        return ListBuilder(DictionaryBuilder())
+    elif field in LIST_FIELDS:
+        return ListBuilder(ObjectBuilder())
+    return ObjectBuilder()
+
+
+def build_columns(
+    exported: Iterable[Dict[str, Any]],
+    fields: Sequence[str],
+    udas: Optional[Mapping[str, str]] = None,
+    chunk_size: int = DEFAULT_COLUMN_CHUNK_SIZE,
+) -> Columns:
+    """Builds columns of `fields` from exported tasks (as decoded JSON).
+
+    Tasks are converted `chunk_size` at a time, so no more than that many
+    exported tasks need be held in memory at once.
+
+    """
+    if np is None:
+        raise ClientUsageError(
+            "NumPy is required to build columns; "
+            "install it using `pip install taskwarrior[columns]`."
+        )
+    if not fields:
+        raise ClientUsageError("No fields were requested.")
+
+    builders = {field: get_column_builder(field, udas or {}) for field in fields}
+    length = 0
+
+    for chunk in chunked(exported, chunk_size):
+        length += len(chunk)
+        for field, builder in builders.items():
+            if field == "annotations":
+                builder.add(
+                    [
+                        [
+                            annotation.get("description")
+                            for annotation in data.get("annotations") or ()
+                        ]
+                        for data in chunk
+                    ]
+                )
+            else:
+                builder.add([data.get(field) for data in chunk])
+
+    return Columns(
+        {field: builder.build() for field, builder in builders.items()}, length
+    )
+
+
+def _concatenate(chunks: List[np.ndarray], dtype: Any) -> np.ndarray:
+    if not chunks:
+        return np.empty(0, dtype=dtype)
+    elif len(chunks) == 1:
+        return chunks[0]
+    return np.concatenate(chunks)
@@ -0,0 +1,367 @@
+"""A memory-efficient collection for holding very many tasks.
+
+Each `Task` is a pydantic model with its own `__dict__`, `UUID` objects,
+timezone-aware datetimes, and copies of strings shared by many tasks
+(e.g. `project`, `status`, or tags); holding hundreds of thousands of them
+takes gigabytes.  A `CompactTaskList` instead stores tasks column by
+column::
+
+    tasks = client.to_compact(status="pending")
+    tasks[0]  # a `Task`, created on access
+    tasks.get("a39ea0fa-682a-4815-9556-8b6785ee301c")
+    tasks.values("project")
+
+* UUIDs are held as 16 bytes each in one `bytearray`, and indexed;
+* dates (including date UDAs) are held as integer seconds since the epoch
+  in `array`s;
+* `project`, `status`, and string UDAs are held as integer codes into a
+  single table of distinct strings, as are tags;
+* numbers (`imask`, numeric UDAs) are held as floats in `array`s;
+* descriptions are held UTF-8 encoded in one `bytearray`;
+* anything else (e.g. `annotations`, `depends`, or `parent`) is kept as
+  exported, for the tasks having it.
+
+`Task`s are created from these columns only when accessed, and are not
+kept; changes made to them do not affect the collection.
+
+"""
+from __future__ import annotations
+
+import datetime
+import json
+import math
+import time
+import uuid
+from array import array
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Sequence
+from typing import Union
+from typing import overload
+
+from .client import Q
+from .exceptions import NotFound
+from .task import DATE_FIELDS
+from .task import DATETIME_FORMAT
+from .task import LazyTask
+from .task import Task
+from .types import Validation
+
+MISSING_TIMESTAMP = -(2**63)
+MISSING_CODE = -1
+
+EPOCH = datetime.datetime(1970, 1, 1)
+SECOND = datetime.timedelta(seconds=1)
+
+NIL_UUID = bytes(16)
+UUID_SIZE = 16
+
+# Fields stored in their own, dedicated columns
+DEDICATED_FIELDS = frozenset(["description", "id", "tags", "urgency", "uuid"])
+# String fields whose values are shared by many tasks, and so stored as codes
+CODED_FIELDS = frozenset(["project", "status"])
+
+
+class CompactTaskList(Sequence[Task]):
+    """A read-only sequence of tasks stored in compact columns.
+
+    * `udas`: the types of your UDAs, keyed by name, as returned by
+      `Client.get_config`; date UDAs are then stored as timestamps, and
+      string UDAs as codes.
+    * `validate`: how tasks are created when accessed; `"lazy"` creates
+      `LazyTask`s, validating each field only when it is first used.
+
+    """
+
+    def __init__(
+        self, udas: Optional[Dict[str, str]] = None, validate: Validation = "eager"
+    ):
+        self.validate = validate
+        self._date_fields = frozenset(
+            [
+                *DATE_FIELDS,
+                *(name for name, type_ in (udas or {}).items() if type_ == "date"),
+            ]
+        )
+        self._coded_fields = frozenset(
+            [
+                *CODED_FIELDS,
+                *(name for name, type_ in (udas or {}).items() if type_ == "string"),
+            ]
+        )
+
+        self._length = 0
+        self._uuids = bytearray()
+        self._uuid_rows: Dict[bytes, int] = {}
+        self._ids = array("q")
+        self._urgency = array("d")
+        self._descriptions = bytearray()
+        self._description_ends = array("q")
+        self._tag_codes = array("i")
+        self._tag_ends = array("q")
+        self._timestamps: Dict[str, array] = {}
+        self._codes: Dict[str, array] = {}
+        self._numbers: Dict[str, array] = {}
+        self._extras: Dict[int, Dict[str, Any]] = {}
+
+        self._strings: List[str] = []
+        self._string_codes: Dict[str, int] = {}
+
+    @classmethod
+    def from_export(
+        cls,
+        exported: Iterable[Dict[str, Any]],
+        udas: Optional[Dict[str, str]] = None,
+        validate: Validation = "eager",
+    ) -> CompactTaskList:
+        """Builds a collection from decoded `task export` output."""
+        tasks = cls(udas=udas, validate=validate)
+        tasks.extend(exported)
+        return tasks
+
+    @classmethod
+    def from_tasks(
+        cls,
+        tasks: Iterable[Task],
+        udas: Optional[Dict[str, str]] = None,
+        validate: Validation = "eager",
+    ) -> CompactTaskList:
+        """Builds a collection from tasks, e.g. those returned by `filter`."""
+        return cls.from_export(
+            (json.loads(task.json(exclude_unset=True)) for task in tasks),
+            udas=udas,
+            validate=validate,
+        )
+
+    def extend(self, exported: Iterable[Dict[str, Any]]) -> None:
+        for data in exported:
+            self.append(data)
+
+    def append(self, data: Dict[str, Any]) -> None:
+        """Adds a task, given as a single object of `task export` output."""
+        row = self._length
+
+        task_uuid = data.get("uuid")
+        if task_uuid:
+            uuid_bytes = uuid.UUID(str(task_uuid)).bytes
+            self._uuids += uuid_bytes
+            self._uuid_rows.setdefault(uuid_bytes, row)
+        else:
+            self._uuids += NIL_UUID
+        self._ids.append(data.get("id") or 0)
+        urgency = data.get("urgency")
+        self._urgency.append(math.nan if urgency is None else urgency)
+        self._descriptions += (data.get("description") or "").encode("utf-8")
+        self._description_ends.append(len(self._descriptions))
+        self._tag_codes.extend(self._intern(tag) for tag in data.get("tags") or ())
+        self._tag_ends.append(len(self._tag_codes))
+
+        for column in self._timestamps.values():
+            column.append(MISSING_TIMESTAMP)
+        for column in self._codes.values():
+            column.append(MISSING_CODE)
+        for column in self._numbers.values():
+            column.append(math.nan)
+
+        extras: Dict[str, Any] = {}
+        for name, value in data.items():
+            if name in DEDICATED_FIELDS or value is None:
+                continue
+
+            if name in self._date_fields and isinstance(value, str):
+                timestamp = _parse_timestamp(value)
+                if timestamp is not None:
+                    column = self._get_column(
+                        self._timestamps, name, "q", MISSING_TIMESTAMP
+                    )
+                    column[row] = timestamp
+                    continue
+            elif name in self._coded_fields and isinstance(value, str):
+                column = self._get_column(self._codes, name, "i", MISSING_CODE)
+                column[row] = self._intern(value)
+                continue
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                column = self._get_column(self._numbers, name, "d", math.nan)
+                column[row] = value
+                continue
+
+            extras[name] = value
+
+        if extras:
+            self._extras[row] = extras
+
+        self._length += 1
+
+    def iter_export(self) -> Iterator[Dict[str, Any]]:
+        """Yields each task as it would appear in `task export` output."""
+        for row in range(self._length):
+            yield self._get_export(row)
+
+    def uuids(self) -> Iterator[Optional[uuid.UUID]]:
+        uuids = bytes(self._uuids)
+        for start in range(0, len(uuids), UUID_SIZE):
+            end = start + UUID_SIZE
+            value = uuids[start:end]
+            yield None if value == NIL_UUID else uuid.UUID(bytes=value)
+
+    def index_of(self, task_uuid: Union[str, uuid.UUID]) -> int:
+        """Returns the position of the task having `task_uuid`.
+
+        Raises `ValueError` if there is no such task.
+
+        """
+        row = self._uuid_rows.get(uuid.UUID(str(task_uuid)).bytes)
+        if row is None:
+            raise ValueError(f"No task has the UUID {task_uuid}.")
+        return row
+
+    def get(self, task_uuid: Union[str, uuid.UUID]) -> Task:
+        try:
+            row = self.index_of(task_uuid)
+        except ValueError:
+            raise NotFound(Q(uuid=str(task_uuid)).serialize()) from None
+
+        return self[row]
+
+    def values(self, field: str) -> List[Any]:
+        """Returns the exported value of `field` for each task.
+
+        Dates are returned as integer seconds since the epoch.  Tasks not
+        having the field have a value of `None`.
+
+        """
+        if field in self._timestamps:
+            return [
+                None if value == MISSING_TIMESTAMP else value
+                for value in self._timestamps[field]
+            ]
+        elif field in self._codes:
+            strings = self._strings
+            return [
+                None if code == MISSING_CODE else strings[code]
+                for code in self._codes[field]
+            ]
+        elif field in self._numbers:
+            return [_get_number(value) for value in self._numbers[field]]
+        return [self._get_export(row).get(field) for row in range(self._length)]
+
+    def __len__(self) -> int:
+        return self._length
+
+    @overload
+    def __getitem__(self, index: int) -> Task: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Task]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[row] for row in range(*index.indices(self._length))]
+
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("Task index out of range.")
+
+        data = self._get_export(index)
+        if self.validate == "lazy":
+            return LazyTask.from_export(data)
+        return Task.parse_obj(data)
+
+    def _get_export(self, row: int) -> Dict[str, Any]:
+        data: Dict[str, Any] = {}
+
+        start = row * UUID_SIZE
+        end = start + UUID_SIZE
+        if self._uuids[start:end] != NIL_UUID:
+            data["uuid"] = str(uuid.UUID(bytes=bytes(self._uuids[start:end])))
+        if self._ids[row]:
+            data["id"] = self._ids[row]
+        if not math.isnan(self._urgency[row]):
+            data["urgency"] = self._urgency[row]
+
+        start = self._description_ends[row - 1] if row else 0
+        end = self._description_ends[row]
+        if end > start:
+            data["description"] = self._descriptions[start:end].decode("utf-8")
+
+        start = self._tag_ends[row - 1] if row else 0
+        end = self._tag_ends[row]
+        if end > start:
+            data["tags"] = [self._strings[code] for code in self._tag_codes[start:end]]
+
+        for name, timestamps in self._timestamps.items():
+            if timestamps[row] != MISSING_TIMESTAMP:
+                data[name] = time.strftime(
+                    DATETIME_FORMAT, time.gmtime(timestamps[row])
+                )
+        for name, codes in self._codes.items():
+            if codes[row] != MISSING_CODE:
+                data[name] = self._strings[codes[row]]
+        for name, numbers in self._numbers.items():
+            if not math.isnan(numbers[row]):
+                data[name] = _get_number(numbers[row])
+
+        data.update(self._extras.get(row, {}))
+
+        return data
+
+    def _get_column(
+        self,
+        columns: Dict[str, array],
+        name: str,
+        typecode: str,
+        missing: Union[int, float],
+    ) -> array:
+        column = columns.get(name)
+        if column is None:
+            # Tasks added before the field was first seen do not have it
+            column = columns[name] = array(typecode, [missing]) * (self._length + 1)
+        return column
+
+    def _intern(self, value: str) -> int:
+        code = self._string_codes.get(value)
+        if code is None:
+            code = self._string_codes[value] = len(self._strings)
+            self._strings.append(value)
+        return code
+
+    def __repr__(self):
+        return (
+            f"CompactTaskList(tasks={self._length}, "
+            f"distinct_strings={len(self._strings)})"
+        )
+
+
+def _get_number(value: float) -> Union[int, float, None]:
+    if math.isnan(value):
+        return None
+    # Whole numbers are exported by Taskwarrior without a fractional part
+    return int(value) if value.is_integer() else value
+
+
+def _parse_timestamp(value: str) -> Optional[int]:
+    """Converts a `DATETIME_FORMAT` timestamp into seconds since the epoch.
+
+    Returns `None` for values in any other format, which are then kept as
+    exported.
+
+    """
+    if len(value) != 16 or value[8] != "T" or value[15] != "Z":
+        return None
+    try:
+        parsed = datetime.datetime(
+            int(value[0:4]),
+            int(value[4:6]),
+            int(value[6:8]),
+            int(value[9:11]),
+            int(value[11:13]),
+            int(value[13:15]),
+        )
+    except ValueError:
+        return None
+    return (parsed - EPOCH) // SECOND
@@ -0,0 +1,193 @@
+"""Reads tasks directly from Taskwarrior's data files.
+
+Taskwarrior 2.x stores tasks one-per-line in `pending.data` and
+`completed.data` using its "FF4" format::
+
+    [description:"Wake up" entry:"1642998491" status:"pending" uuid:"..."]
+
+Reading these files directly avoids starting a Taskwarrior process, but
+Taskwarrior's own housekeeping (e.g. generating recurring task instances,
+or computing urgency) does not happen.
+
+"""
+
+import datetime
+import json
+import os
+import re
+from typing import Any
+from typing import Dict
+from typing import Iterator
+from typing import List
+from typing import Optional
+
+from .task import DATE_FIELDS
+from .task import DATETIME_FORMAT
+from .task import Task
+
+DATA_FILES = ("pending.data", "completed.data")
+
+DATE_ATTRIBUTES = frozenset(DATE_FIELDS)
+NUMERIC_ATTRIBUTES = frozenset(["imask"])
+WORKING_SET_STATUSES = frozenset(["pending", "waiting", "recurring"])
+
+ATTRIBUTE_RE = re.compile(r'([^\s:"]+):"((?:[^"\\]|\\.)*)"')
+
+
+def parse_line(line: str) -> Dict[str, str]:
+    """Parses a single FF4-format line into a dictionary of raw attributes."""
+    line = line.strip()
+    if not (line.startswith("[") and line.endswith("]")):
+        raise ValueError(f"Unrecognized data file line: {line!r}")
+
+    return {
+        name: decode_value(value) for name, value in ATTRIBUTE_RE.findall(line[1:-1])
+    }
+
+
+def decode_value(value: str) -> str:
+    value = (
+        value.replace("&open;", "[").replace("&close;", "]").replace("&dquot;", '\\"')
+    )
+    if "\\" in value:
+        value = json.loads(f'"{value}"')
+    return value
+
+
+def format_line(attributes: Dict[str, str]) -> str:
+    """Formats raw attributes as a single FF4-format line (without newline).
+
+    The inverse of `parse_line`; like Taskwarrior, attributes are written in
+    order of their names.
+
+    """
+    return (
+        "["
+        + " ".join(
+            f'{name}:"{encode_value(value)}"'
+            for name, value in sorted(attributes.items())
+        )
+        + "]"
+    )
+
+
+def encode_value(value: str) -> str:
+    return (
+        json.dumps(value, ensure_ascii=False)[1:-1]
+        .replace("[", "&open;")
+        .replace("]", "&close;")
+    )
+
+
+def parse_timestamp(value: str) -> datetime.datetime:
+    return datetime.datetime.fromtimestamp(int(value), tz=datetime.timezone.utc)
+
+
+def format_timestamp(value: str) -> str:
+    return parse_timestamp(value).strftime(DATETIME_FORMAT)
+
+
+def format_number(value: str) -> Any:
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def attributes_to_export(
+    attributes: Dict[str, str],
+    uda_types: Optional[Dict[str, str]] = None,
+    id: int = 0,
+    now: Optional[datetime.datetime] = None,
+) -> Dict[str, Any]:
+    """Converts raw data file attributes into the form `task export` emits.
+
+    * `uda_types` maps the name of each configured UDA to its `uda.*.type`.
+    * `id` is the task's working-set ID, or zero if it has none.
+
+    """
+    uda_types = uda_types or {}
+    now = now or datetime.datetime.now(tz=datetime.timezone.utc)
+
+    exported: Dict[str, Any] = {"id": id}
+    annotations: List[Dict[str, Any]] = []
+
+    for name, value in attributes.items():
+        if name.startswith("annotation_"):
+            annotations.append(
+                {
+                    "entry": format_timestamp(name.partition("_")[2]),
+                    "description": value,
+                }
+            )
+        elif name.startswith("tags_") or name.startswith("dep_"):
+            # Duplicates of the `tags` and `depends` attributes written by
+            # Taskwarrior 2.6 and newer.
+            continue
+        elif name == "tags" or name == "depends":
+            exported[name] = [item for item in value.split(",") if item]
+        elif name in DATE_ATTRIBUTES or uda_types.get(name) == "date":
+            exported[name] = format_timestamp(value)
+        elif name in NUMERIC_ATTRIBUTES or uda_types.get(name) == "numeric":
+            exported[name] = format_number(value)
+        else:
+            exported[name] = value
+
+    if annotations:
+        exported["annotations"] = sorted(annotations, key=lambda a: a["entry"])
+
+    if (
+        exported.get("status") == "waiting"
+        and "wait" in attributes
+        and parse_timestamp(attributes["wait"]) <= now
+    ):
+        exported["status"] = "pending"
+
+    return exported
+
+
+class DataFileReader:
+    """Reads tasks from the data files stored in a Taskwarrior data location."""
+
+    _data_location: str
+    _uda_types: Dict[str, str]
+
+    def __init__(self, data_location: str, uda_types: Optional[Dict[str, str]] = None):
+        self._data_location = data_location
+        self._uda_types = uda_types or {}
+
+    def iter_export(self) -> Iterator[Dict[str, Any]]:
+        """Yields each task in the form in which `task export` would emit it."""
+        now = datetime.datetime.now(tz=datetime.timezone.utc)
+        next_id = 1
+
+        for filename in DATA_FILES:
+            path = os.path.join(self._data_location, filename)
+            if not os.path.exists(path):
+                continue
+
+            with open(path, encoding="utf-8") as inf:
+                for line in inf:
+                    if not line.strip():
+                        continue
+
+                    attributes = parse_line(line)
+
+                    id = 0
+                    if (
+                        filename == "pending.data"
+                        and attributes.get("status") in WORKING_SET_STATUSES
+                    ):
+                        id = next_id
+                        next_id += 1
+
+                    yield attributes_to_export(
+                        attributes, uda_types=self._uda_types, id=id, now=now
+                    )
+
+    def iter_tasks(self) -> Iterator[Task]:
+        for exported in self.iter_export():
+            yield Task.parse_obj(exported)
+
+    def __repr__(self):
+        return f"DataFileReader({self._data_location})"
@@ -0,0 +1,452 @@
+"""Evaluates filters locally against already-loaded tasks.
+
+Filters are compiled into predicates -- functions accepting a `Task` and
+returning whether it matches -- that mirror how Taskwarrior itself would
+evaluate the same filter.  Filters (or parts of filters) whose meaning
+cannot be reproduced faithfully raise `UnsupportedFilter` when compiled
+rather than silently returning different results than Taskwarrior would.
+
+Supported are:
+
+* Attribute filters, with or without one of the modifiers `is`/`equals`,
+  `isnt`, `not`, `has`/`contains`, `hasnt`, `startswith`/`left`,
+  `endswith`/`right`, `before`/`below`/`under`, `after`/`above`/`over`,
+  `none`, and `any`.
+* Tags (`+tag` and `-tag`), including the virtual tags listed in
+  `SUPPORTED_VIRTUAL_TAGS`.
+* Task IDs and UUIDs (e.g. `1,3-5` or `a39ea0fa`).
+* `and` and `or` combinations of `Q` objects.
+
+Dates must be given as `date` or `datetime` objects or as absolute ISO-8601
+dates; relative dates like `today` or `eom` are not supported.  Like
+Taskwarrior, dates lacking a timezone are interpreted as local time.
+
+"""
+import datetime
+import re
+import uuid
+from typing import Any
+from typing import Callable
+from typing import Collection
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from .exceptions import UnsupportedFilter
+from .task import DATE_FIELDS
+from .task import DATETIME_FORMAT
+from .task import Task
+
+Predicate = Callable[[Task], bool]
+
+LIST_FIELDS = frozenset(["annotations", "depends", "tags"])
+NUMERIC_FIELDS = frozenset(["id", "imask", "urgency"])
+
+MODIFIER_ALIASES = {
+    "equals": "is",
+    "contains": "has",
+    "left": "startswith",
+    "right": "endswith",
+    "below": "before",
+    "under": "before",
+    "above": "after",
+    "over": "after",
+}
+MODIFIERS = frozenset(
+    [
+        "",
+        "is",
+        "isnt",
+        "not",
+        "has",
+        "hasnt",
+        "startswith",
+        "endswith",
+        "before",
+        "after",
+        "none",
+        "any",
+    ]
+)
+
+# Characters that would make Taskwarrior treat a pattern as a regular
+# expression rather than as a literal string.
+REGEX_CHARACTERS = frozenset("\\^$.|?*+()[]{}")
+
+# Virtual tags are computed by Taskwarrior rather than stored on the task.
+VIRTUAL_TAGS = frozenset(
+    [
+        "ACTIVE",
+        "ANNOTATED",
+        "BLOCKED",
+        "BLOCKING",
+        "CHILD",
+        "COMPLETED",
+        "DELETED",
+        "DUE",
+        "DUETODAY",
+        "INSTANCE",
+        "LATEST",
+        "MONTH",
+        "ORPHAN",
+        "OVERDUE",
+        "PARENT",
+        "PENDING",
+        "PRIORITY",
+        "PROJECT",
+        "QUARTER",
+        "READY",
+        "SCHEDULED",
+        "TAGGED",
+        "TEMPLATE",
+        "TODAY",
+        "TOMORROW",
+        "UDA",
+        "UNBLOCKED",
+        "UNTIL",
+        "WAITING",
+        "WEEK",
+        "YEAR",
+        "YESTERDAY",
+    ]
+)
+# Virtual tags that can be computed from a task's own fields.
+SUPPORTED_VIRTUAL_TAGS: Dict[str, Predicate] = {
+    "ANNOTATED": lambda task: bool(task.annotations),
+    "COMPLETED": lambda task: task.status == "completed",
+    "DELETED": lambda task: task.status == "deleted",
+    "PROJECT": lambda task: bool(task.project),
+    "SCHEDULED": lambda task: task.scheduled is not None,
+    "TAGGED": lambda task: bool(task.tags),
+    "UNTIL": lambda task: task.until is not None,
+}
+
+ID_LIST_RE = re.compile(r"^\d+(-\d+)?(,\d+(-\d+)?)*$")
+UUID_RE = re.compile(r"^[0-9a-fA-F]{8}(-[0-9a-fA-F]{4}){0,3}(-[0-9a-fA-F]{12})?$")
+
+
+def compile_filter(
+    q: Any,
+    udas: Optional[Dict[str, str]] = None,
+    unavailable: Collection[str] = (),
+) -> Predicate:
+    """Compiles a `Q` (or `Groupable`) object into a predicate.
+
+    * `udas`: maps the name of each configured UDA to its type (i.e. the
+      value of its `uda.<name>.type` setting).
+    * `unavailable`: fields the tasks will not have even when Taskwarrior
+      would (e.g. `urgency`, for tasks read from the data files); filters
+      on them are unsupported.
+
+    """
+    known: Dict[str, str] = {name: "string" for name in Task.__fields__}
+    known.update({name: "numeric" for name in NUMERIC_FIELDS})
+    known.update({name: "date" for name in DATE_FIELDS})
+    known.update({name: "list" for name in LIST_FIELDS})
+    known.update(udas or {})
+    for name in unavailable:
+        known.pop(name, None)
+
+    id_groups: List[str] = []
+    predicate = _compile(q, known, id_groups)
+
+    # Taskwarrior combines every ID and UUID in a filter into a single set
+    # regardless of where they appear; we support them only in one place.
+    if len(id_groups) > 1:
+        raise UnsupportedFilter(
+            f"IDs and UUIDs may appear in only one filter string: {id_groups!r}"
+        )
+
+    return predicate
+
+
+def _compile(q: Any, known: Dict[str, str], id_groups: List[str]) -> Predicate:
+    operator = getattr(q, "_logical_operator", None)
+    if operator is not None:
+        left = _compile(q._logical_operands[0], known, id_groups)
+        right = _compile(q._logical_operands[1], known, id_groups)
+        if operator == "and":
+            return lambda task: left(task) and right(task)
+        return lambda task: left(task) or right(task)
+
+    predicates: List[Predicate] = []
+    for param in q._params:
+        if hasattr(param, "serialize"):
+            predicates.append(_compile(param, known, id_groups))
+        elif isinstance(param, str):
+            predicates.extend(_compile_string(param, known, id_groups))
+        elif isinstance(param, dict):
+            for key, value in param.items():
+                predicates.append(_compile_attribute(key, value, known))
+        else:
+            raise ValueError(f"Unexpected parameter type: {param}")
+
+    return _all(predicates)
+
+
+def _all(predicates: List[Predicate]) -> Predicate:
+    if len(predicates) == 1:
+        return predicates[0]
+    return lambda task: all(predicate(task) for predicate in predicates)
+
+
+def _compile_string(
+    param: str, known: Dict[str, str], id_groups: List[str]
+) -> List[Predicate]:
+    predicates: List[Predicate] = []
+    identifiers: List[str] = []
+
+    for token in param.split():
+        if ID_LIST_RE.match(token) or UUID_RE.match(token):
+            identifiers.append(token)
+        elif token[0] in "+-" and len(token) > 1:
+            predicates.append(_compile_tag(token[1:], token[0] == "+"))
+        elif ":" in token and not any(c in token for c in "()'\""):
+            key, value = token.split(":", 1)
+            predicates.append(_compile_attribute(key, value, known))
+        else:
+            raise UnsupportedFilter(f"Unsupported filter term: {token!r}")
+
+    if identifiers:
+        id_groups.append(param)
+        predicates.append(_compile_identifiers(identifiers))
+
+    return predicates
+
+
+def _compile_identifiers(identifiers: List[str]) -> Predicate:
+    ids: List[Tuple[int, int]] = []
+    uuids: List[str] = []
+
+    for identifier in identifiers:
+        if ID_LIST_RE.match(identifier):
+            for part in identifier.split(","):
+                low, _, high = part.partition("-")
+                ids.append((int(low), int(high or low)))
+        else:
+            uuids.append(identifier.lower())
+
+    prefixes = tuple(uuids)
+
+    def matches(task: Task) -> bool:
+        if task.id and any(low <= task.id <= high for low, high in ids):
+            return True
+        return bool(prefixes) and str(task.uuid).startswith(prefixes)
+
+    return matches
+
+
+def _compile_tag(tag: str, present: bool) -> Predicate:
+    has_tag: Predicate
+
+    if tag in VIRTUAL_TAGS:
+        if tag not in SUPPORTED_VIRTUAL_TAGS:
+            raise UnsupportedFilter(f"Unsupported virtual tag: {tag!r}")
+        has_tag = SUPPORTED_VIRTUAL_TAGS[tag]
+    else:
+        has_tag = lambda task: tag in (task.tags or [])  # noqa: E731
+
+    if present:
+        return has_tag
+    return lambda task: not has_tag(task)
+
+
+def _compile_attribute(key: str, value: Any, known: Dict[str, str]) -> Predicate:
+    name, _, modifier = key.replace("__", ".").partition(".")
+    modifier = MODIFIER_ALIASES.get(modifier, modifier)
+
+    if name not in known:
+        raise UnsupportedFilter(f"Unknown attribute: {name!r}")
+    if modifier not in MODIFIERS:
+        raise UnsupportedFilter(f"Unsupported attribute modifier: {modifier!r}")
+
+    attribute_type = known[name]
+
+    def get(task: Task) -> Any:
+        return getattr(task, name, None)
+
+    if modifier == "none":
+        return lambda task: _is_empty(get(task))
+    elif modifier == "any":
+        return lambda task: not _is_empty(get(task))
+
+    if attribute_type == "list":
+        if name == "tags" and modifier in ("has", "hasnt") and isinstance(value, str):
+            return _compile_tag(value, modifier == "has")
+        raise UnsupportedFilter(f"Unsupported filter on list attribute {name!r}")
+
+    if value is None or value == "":
+        if modifier in ("", "is"):
+            return lambda task: _is_empty(get(task))
+        elif modifier in ("not", "isnt"):
+            return lambda task: not _is_empty(get(task))
+        raise UnsupportedFilter(f"Unsupported empty value for {key!r}")
+
+    if attribute_type == "date":
+        return _compile_date(get, modifier, value)
+    elif attribute_type == "numeric":
+        return _compile_number(get, modifier, value)
+    elif attribute_type == "string":
+        return _compile_text(get, modifier, value)
+
+    raise UnsupportedFilter(f"Unsupported {attribute_type} attribute: {name!r}")
+
+
+def _compile_text(get: Callable[[Task], Any], modifier: str, value: Any) -> Predicate:
+    if isinstance(value, uuid.UUID):
+        value = str(value)
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        value = str(value)
+    if not isinstance(value, str):
+        raise UnsupportedFilter(f"Unsupported value: {value!r}")
+
+    if modifier in ("has", "hasnt", "startswith", "endswith") and (
+        REGEX_CHARACTERS & set(value)
+    ):
+        raise UnsupportedFilter(f"Unsupported regular expression: {value!r}")
+
+    # Like Taskwarrior, attributes without a modifier match from the left
+    comparisons: Dict[str, Callable[[str], bool]] = {
+        "": lambda actual: actual.startswith(value),
+        "is": lambda actual: actual == value,
+        "has": lambda actual: value in actual,
+        "startswith": lambda actual: actual.startswith(value),
+        "endswith": lambda actual: actual.endswith(value),
+        "before": lambda actual: actual < value,
+        "after": lambda actual: actual > value,
+    }
+    negations = {"not": "", "isnt": "is", "hasnt": "has"}
+
+    negated = modifier in negations
+    compare = comparisons[negations.get(modifier, modifier)]
+
+    def matches(task: Task) -> bool:
+        actual = get(task)
+        if actual is None:
+            return negated
+        return compare(str(actual)) != negated
+
+    return matches
+
+
+def _compile_number(
+    get: Callable[[Task], Any], modifier: str, value: Any
+) -> Predicate:
+    number = _as_number(value)
+    if number is None:
+        raise UnsupportedFilter(f"Unsupported numeric value: {value!r}")
+
+    comparisons: Dict[str, Callable[[float], bool]] = {
+        "": lambda actual: actual == number,
+        "is": lambda actual: actual == number,
+        "not": lambda actual: actual != number,
+        "isnt": lambda actual: actual != number,
+        "before": lambda actual: actual < number,
+        "after": lambda actual: actual > number,
+    }
+    if modifier not in comparisons:
+        raise UnsupportedFilter(f"Unsupported modifier for numbers: {modifier!r}")
+    compare = comparisons[modifier]
+    missing_matches = modifier in ("not", "isnt")
+
+    def matches(task: Task) -> bool:
+        actual = _as_number(get(task))
+        if actual is None:
+            return missing_matches
+        return compare(actual)
+
+    return matches
+
+
+def _compile_date(get: Callable[[Task], Any], modifier: str, value: Any) -> Predicate:
+    start, end = parse_date_value(value)
+
+    def equals(actual: datetime.datetime) -> bool:
+        if end is not None:
+            return start <= actual < end
+        return actual == start
+
+    comparisons: Dict[str, Callable[[datetime.datetime], bool]] = {
+        "": equals,
+        "is": equals,
+        "not": lambda actual: not equals(actual),
+        "isnt": lambda actual: not equals(actual),
+        "before": lambda actual: actual < start,
+        "after": lambda actual: actual > start,
+    }
+    if modifier not in comparisons:
+        raise UnsupportedFilter(f"Unsupported modifier for dates: {modifier!r}")
+    compare = comparisons[modifier]
+    missing_matches = modifier in ("not", "isnt")
+
+    def matches(task: Task) -> bool:
+        actual = get(task)
+        if isinstance(actual, str):
+            # Date UDAs are not converted to `datetime` by `Task`
+            actual = datetime.datetime.strptime(actual, DATETIME_FORMAT).replace(
+                tzinfo=datetime.timezone.utc
+            )
+        if actual is None:
+            return missing_matches
+        return compare(actual)
+
+    return matches
+
+
+def parse_date_value(
+    value: Any,
+) -> Tuple[datetime.datetime, Optional[datetime.datetime]]:
+    """Converts a date used in a filter into a timezone-aware `datetime`.
+
+    Returns a `(start, end)` tuple; `end` is set only if the value refers to
+    a whole day (i.e. a `date` or an ISO-8601 date without a time), in which
+    case it is midnight (local time) of the following day.
+
+    """
+    if isinstance(value, str):
+        value = _parse_date_string(value)
+
+    if isinstance(value, datetime.datetime):
+        # Naive values are interpreted as local time, as Taskwarrior would
+        return value.astimezone(), None
+    elif isinstance(value, datetime.date):
+        start = datetime.datetime.combine(value, datetime.time()).astimezone()
+        end = datetime.datetime.combine(
+            value + datetime.timedelta(days=1), datetime.time()
+        ).astimezone()
+        return start, end
+
+    raise UnsupportedFilter(f"Unsupported date value: {value!r}")
+
+
+def _parse_date_string(value: str) -> Union[datetime.date, datetime.datetime]:
+    try:
+        return datetime.datetime.strptime(value, DATETIME_FORMAT).replace(
+            tzinfo=datetime.timezone.utc
+        )
+    except ValueError:
+        pass
+
+    try:
+        if len(value) == 10:
+            return datetime.date.fromisoformat(value)
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.datetime.fromisoformat(value)
+    except ValueError:
+        raise UnsupportedFilter(f"Unsupported date value: {value!r}")
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or value == []
+
+
+def _as_number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
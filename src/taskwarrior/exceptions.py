@@ -1,3 +1,4 @@
+import uuid
 from typing import List
 
 
@@ -18,6 +19,14 @@ class CommandError(ClientError):
         self.stdout = stdout
         self.return_code = return_code
 
+    def __reduce__(self):
+        # Pickled by its arguments, so that it can be raised in one process
+        # and received in another (e.g. by `ClientPool`).
+        return (
+            type(self),
+            (self.command, self.stderr, self.stdout, self.return_code),
+        )
+
 
 class ClientUsageError(ClientError, ValueError):
     pass
@@ -33,3 +42,24 @@ class NotFound(FilterError):
 
 class MultipleObjectsFound(FilterError):
     pass
+
+
+class UnsupportedFilter(FilterError):
+    pass
+
+
+class CommandTimeout(CommandError):
+    pass
+
+
+class DependencyCycle(ClientError):
+    cycle: List[uuid.UUID]
+
+    def __init__(self, cycle: List[uuid.UUID]):
+        super().__init__(
+            f"Tasks depend upon one another: {', '.join(str(u) for u in cycle)}"
+        )
+        self.cycle = cycle
+
+    def __reduce__(self):
+        return (type(self), (self.cycle,))
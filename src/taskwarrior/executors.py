@@ -0,0 +1,298 @@
+"""Strategies for starting Taskwarrior processes.
+
+`Client` runs each command using an `Executor`, including the exports it
+reads while Taskwarrior is still writing them (see `Executor.open`).
+`SubprocessExecutor` (the default) uses `subprocess.Popen`;
+`PosixSpawnExecutor` uses `os.posix_spawnp`, which avoids copying the
+parent's page tables and so starts processes more quickly from processes
+using a lot of memory.  Tests may provide their own `Executor` to avoid
+starting processes at all.
+
+"""
+
+import abc
+import io
+import os
+import selectors
+import signal
+import subprocess
+import tempfile
+from typing import IO
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover
+    resource = None  # type: ignore[assignment]
+
+
+class ExecutionResult(NamedTuple):
+    return_code: int
+    stdout: bytes
+    stderr: bytes
+    # User and system CPU seconds used by the process, if known
+    cpu_time: Optional[float] = None
+
+
+class StreamingProcess(NamedTuple):
+    # The process's standard output; read it until exhausted before waiting
+    stdout: IO[bytes]
+    # Waits for the process to exit (killing it first if passed `True`) and
+    # returns its result, whose `stdout` is always empty
+    wait: Callable[[bool], ExecutionResult]
+
+
+class Executor(abc.ABC):
+    @abc.abstractmethod
+    def run(
+        self, command: List[str], env: Dict[str, str], stdin: bytes = b""
+    ) -> ExecutionResult:
+        """Runs `command` to completion and returns its result.
+
+        Raises `FileNotFoundError` if the executable does not exist.
+
+        """
+
+    def open(self, command: List[str], env: Dict[str, str]) -> StreamingProcess:
+        """Starts `command` and returns its output as a stream.
+
+        Used to read exports while Taskwarrior is still writing them.  This
+        implementation runs `command` to completion first; subclasses that
+        start real processes should override it.
+
+        Raises `FileNotFoundError` if the executable does not exist.
+
+        """
+        result = self.run(command, env)
+
+        def wait(kill: bool = False) -> ExecutionResult:
+            return result._replace(stdout=b"")
+
+        return StreamingProcess(io.BytesIO(result.stdout), wait)
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+
+class SubprocessExecutor(Executor):
+    def run(
+        self, command: List[str], env: Dict[str, str], stdin: bytes = b""
+    ) -> ExecutionResult:
+        before = _get_children_cpu_time()
+
+        proc = subprocess.Popen(
+            command,
+            env=env,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        raw_stdout, raw_stderr = proc.communicate(stdin)
+
+        # Includes any other child processes that finished meanwhile, e.g.
+        # those started by other threads; `subprocess` offers nothing better.
+        after = _get_children_cpu_time()
+        cpu_time = after - before if after is not None and before is not None else None
+
+        return ExecutionResult(proc.returncode, raw_stdout, raw_stderr, cpu_time)
+
+    def open(self, command: List[str], env: Dict[str, str]) -> StreamingProcess:
+        before = _get_children_cpu_time()
+
+        # Written to a file so that the process never blocks on a full pipe
+        # while we are only reading its standard output.
+        stderr_file = tempfile.TemporaryFile()
+        try:
+            proc = subprocess.Popen(
+                command,
+                env=env,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+            )
+        except BaseException:
+            stderr_file.close()
+            raise
+        assert proc.stdout is not None
+
+        def wait(kill: bool = False) -> ExecutionResult:
+            with stderr_file:
+                if kill:
+                    proc.kill()
+                proc.stdout.close()  # type: ignore[union-attr]
+                proc.wait()
+                stderr_file.seek(0)
+                raw_stderr = stderr_file.read()
+
+            after = _get_children_cpu_time()
+            cpu_time = (
+                after - before if after is not None and before is not None else None
+            )
+
+            return ExecutionResult(proc.returncode, b"", raw_stderr, cpu_time)
+
+        return StreamingProcess(proc.stdout, wait)
+
+
+class PosixSpawnExecutor(Executor):
+    """Starts processes using `posix_spawnp`.
+
+    Available on POSIX systems using Python 3.8 or newer.
+
+    """
+
+    read_size: int = 65536
+
+    def run(
+        self, command: List[str], env: Dict[str, str], stdin: bytes = b""
+    ) -> ExecutionResult:
+        # Pipes are created non-inheritable; only the child's copies (as
+        # duplicated onto its standard streams) survive `exec`.
+        stdin_read, stdin_write = os.pipe()
+        stdout_read, stdout_write = os.pipe()
+        stderr_read, stderr_write = os.pipe()
+
+        try:
+            pid = os.posix_spawnp(
+                command[0],
+                command,
+                env,
+                file_actions=[
+                    (os.POSIX_SPAWN_DUP2, stdin_read, 0),
+                    (os.POSIX_SPAWN_DUP2, stdout_write, 1),
+                    (os.POSIX_SPAWN_DUP2, stderr_write, 2),
+                ],
+            )
+        except BaseException:
+            for fd in (stdin_write, stdout_read, stderr_read):
+                os.close(fd)
+            raise
+        finally:
+            for fd in (stdin_read, stdout_write, stderr_write):
+                os.close(fd)
+
+        try:
+            raw_stdout, raw_stderr = self._communicate(
+                stdin_write, stdout_read, stderr_read, stdin
+            )
+        except BaseException:
+            os.kill(pid, signal.SIGKILL)
+            raise
+        finally:
+            _, status, rusage = os.wait4(pid, 0)
+
+        return ExecutionResult(
+            _get_return_code(status),
+            raw_stdout,
+            raw_stderr,
+            rusage.ru_utime + rusage.ru_stime,
+        )
+
+    def open(self, command: List[str], env: Dict[str, str]) -> StreamingProcess:
+        stdout_read, stdout_write = os.pipe()
+        # See `SubprocessExecutor.open`
+        stderr_file = tempfile.TemporaryFile()
+
+        try:
+            pid = os.posix_spawnp(
+                command[0],
+                command,
+                env,
+                file_actions=[
+                    (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+                    (os.POSIX_SPAWN_DUP2, stdout_write, 1),
+                    (os.POSIX_SPAWN_DUP2, stderr_file.fileno(), 2),
+                ],
+            )
+        except BaseException:
+            os.close(stdout_read)
+            stderr_file.close()
+            raise
+        finally:
+            os.close(stdout_write)
+
+        stdout = os.fdopen(stdout_read, "rb")
+
+        def wait(kill: bool = False) -> ExecutionResult:
+            with stderr_file:
+                if kill:
+                    os.kill(pid, signal.SIGKILL)
+                stdout.close()
+                _, status, rusage = os.wait4(pid, 0)
+                stderr_file.seek(0)
+                raw_stderr = stderr_file.read()
+
+            return ExecutionResult(
+                _get_return_code(status),
+                b"",
+                raw_stderr,
+                rusage.ru_utime + rusage.ru_stime,
+            )
+
+        return StreamingProcess(stdout, wait)
+
+    def _communicate(
+        self, stdin_fd: int, stdout_fd: int, stderr_fd: int, stdin: bytes
+    ) -> List[bytes]:
+        """Writes `stdin` while reading stdout and stderr, without deadlocking."""
+        output: Dict[int, List[bytes]] = {stdout_fd: [], stderr_fd: []}
+        view = memoryview(stdin)
+        open_fds = {stdin_fd, stdout_fd, stderr_fd}
+
+        with selectors.DefaultSelector() as selector:
+            if view:
+                os.set_blocking(stdin_fd, False)
+                selector.register(stdin_fd, selectors.EVENT_WRITE)
+            else:
+                os.close(stdin_fd)
+                open_fds.discard(stdin_fd)
+            selector.register(stdout_fd, selectors.EVENT_READ)
+            selector.register(stderr_fd, selectors.EVENT_READ)
+
+            try:
+                while selector.get_map():
+                    for key, _ in selector.select():
+                        fd = key.fd
+                        if fd == stdin_fd:
+                            try:
+                                written = os.write(fd, view)
+                            except BrokenPipeError:
+                                # The process exited without reading stdin
+                                written = len(view)
+                            view = view[written:]
+                            if not view:
+                                selector.unregister(fd)
+                                os.close(fd)
+                                open_fds.discard(fd)
+                        else:
+                            chunk = os.read(fd, self.read_size)
+                            if chunk:
+                                output[fd].append(chunk)
+                            else:
+                                selector.unregister(fd)
+                                os.close(fd)
+                                open_fds.discard(fd)
+            finally:
+                for fd in open_fds:
+                    os.close(fd)
+
+        return [b"".join(output[stdout_fd]), b"".join(output[stderr_fd])]
+
+
+def _get_return_code(status: int) -> int:
+    # Like `subprocess`, report death by a signal as a negative number
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def _get_children_cpu_time() -> Optional[float]:
+    if resource is None:
+        return None
+
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN)
+    return usage.ru_utime + usage.ru_stime
@@ -0,0 +1,251 @@
+"""Analyses the dependencies between tasks without using Taskwarrior.
+
+`DependencyGraph` indexes the `depends` attribute of a set of tasks in both
+directions.  Dependencies on tasks that are not in the graph are ignored:
+such tasks neither block others nor appear in orderings.
+
+"""
+
+from __future__ import annotations
+
+import uuid
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Union
+from typing import cast
+
+from .client import Client
+from .client import Q
+from .exceptions import DependencyCycle
+from .task import CLOSED_STATUSES
+from .task import Task
+from .types import FilterSpec
+
+TaskOrUUID = Union[Task, uuid.UUID]
+
+
+class DependencyGraph:
+    _tasks: List[Task]
+    _positions: Dict[int, int]
+    _dependencies: List[List[int]]
+    _dependents: List[List[int]]
+    _open: List[bool]
+
+    def __init__(self, tasks: Iterable[Task]):
+        # Tasks are numbered in the order given and the graph is stored using
+        # those numbers.  UUIDs are looked up by their integer value, as
+        # hashing a `UUID` itself is comparatively slow.
+        self._tasks = [task for task in tasks if task.uuid is not None]
+        self._positions = {
+            cast(uuid.UUID, task.uuid).int: position
+            for position, task in enumerate(self._tasks)
+        }
+        self._dependencies = []
+        self._dependents = [[] for _ in self._tasks]
+        self._open = [task.status not in CLOSED_STATUSES for task in self._tasks]
+
+        positions = self._positions
+        for position, task in enumerate(self._tasks):
+            dependencies = list(
+                dict.fromkeys(
+                    positions[dependency.int]
+                    for dependency in task.depends or ()
+                    if dependency.int in positions
+                )
+            )
+            self._dependencies.append(dependencies)
+            for dependency in dependencies:
+                self._dependents[dependency].append(position)
+
+    @classmethod
+    def load(
+        cls,
+        client: Client,
+        *params: Union[FilterSpec, Q],
+        **dictparams: Any,
+    ) -> DependencyGraph:
+        """Creates a graph of the tasks matching the provided filters."""
+        return cls(client.filter(Q(*params, **dictparams)))
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __contains__(self, task_uuid: object) -> bool:
+        return isinstance(task_uuid, uuid.UUID) and task_uuid.int in self._positions
+
+    def __getitem__(self, task_uuid: uuid.UUID) -> Task:
+        return self._tasks[self._positions[task_uuid.int]]
+
+    def dependencies(self, task: TaskOrUUID) -> List[Task]:
+        """Returns the tasks in the graph that `task` directly depends upon."""
+        return self._get_tasks(self._dependencies[self._get_position(task)])
+
+    def dependents(self, task: TaskOrUUID) -> List[Task]:
+        """Returns the tasks in the graph directly depending upon `task`."""
+        return self._get_tasks(self._dependents[self._get_position(task)])
+
+    def is_blocked(self, task: TaskOrUUID) -> bool:
+        """Whether `task` is open and depends upon an open task."""
+        return self._is_blocked(self._get_position(task))
+
+    def is_blocking(self, task: TaskOrUUID) -> bool:
+        """Whether `task` is open and an open task depends upon it."""
+        return self._is_blocking(self._get_position(task))
+
+    def blocked(self) -> List[Task]:
+        """Returns the tasks Taskwarrior would tag `+BLOCKED`."""
+        return self._get_tasks(
+            position
+            for position in range(len(self._tasks))
+            if self._is_blocked(position)
+        )
+
+    def blocking(self) -> List[Task]:
+        """Returns the tasks Taskwarrior would tag `+BLOCKING`."""
+        return self._get_tasks(
+            position
+            for position in range(len(self._tasks))
+            if self._is_blocking(position)
+        )
+
+    def topological_sort(self) -> List[Task]:
+        """Returns every task, ordered such that each follows its dependencies.
+
+        Raises `DependencyCycle` if the dependencies form a cycle.
+
+        """
+        return self._get_tasks(self._topological_order())
+
+    def cycles(self) -> List[List[uuid.UUID]]:
+        """Returns each group of tasks whose dependencies form a cycle.
+
+        Each group is a strongly-connected component of the graph; i.e. every
+        task in a group depends, directly or indirectly, on every other.
+
+        """
+        # An iterative version of Tarjan's algorithm, so that long chains of
+        # dependencies cannot exceed the recursion limit.
+        count = len(self._tasks)
+        index = [-1] * count
+        lowlink = [0] * count
+        on_stack = [False] * count
+        stack: List[int] = []
+        components: List[List[uuid.UUID]] = []
+        next_index = 0
+
+        for root in range(count):
+            if index[root] != -1:
+                continue
+
+            work = [(root, 0)]
+            while work:
+                node, cursor = work.pop()
+                if cursor == 0:
+                    index[node] = lowlink[node] = next_index
+                    next_index += 1
+                    stack.append(node)
+                    on_stack[node] = True
+
+                dependencies = self._dependencies[node]
+                while cursor < len(dependencies):
+                    dependency = dependencies[cursor]
+                    cursor += 1
+                    if index[dependency] == -1:
+                        work.append((node, cursor))
+                        work.append((dependency, 0))
+                        break
+                    elif on_stack[dependency]:
+                        lowlink[node] = min(lowlink[node], index[dependency])
+                else:
+                    if lowlink[node] == index[node]:
+                        component = []
+                        while True:
+                            member = stack.pop()
+                            on_stack[member] = False
+                            component.append(member)
+                            if member == node:
+                                break
+                        if len(component) > 1 or node in dependencies:
+                            components.append(
+                                [
+                                    cast(uuid.UUID, self._tasks[member].uuid)
+                                    for member in reversed(component)
+                                ]
+                            )
+                    if work:
+                        parent = work[-1][0]
+                        lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+        return components
+
+    def critical_path(self) -> List[Task]:
+        """Returns the longest chain of dependencies between open tasks.
+
+        The chain is ordered such that each task is followed by a task
+        depending upon it; its length is the least number of steps in which
+        every open task could be completed.  Raises `DependencyCycle` if the
+        dependencies form a cycle.
+
+        """
+        length = [0] * len(self._tasks)
+        previous = [-1] * len(self._tasks)
+
+        for node in self._topological_order():
+            if not self._open[node]:
+                continue
+
+            length[node] = 1
+            for dependency in self._dependencies[node]:
+                if length[dependency] + 1 > length[node]:
+                    length[node] = length[dependency] + 1
+                    previous[node] = dependency
+
+        if not any(length):
+            return []
+
+        path = [max(range(len(length)), key=length.__getitem__)]
+        while previous[path[-1]] != -1:
+            path.append(previous[path[-1]])
+
+        return self._get_tasks(reversed(path))
+
+    def _topological_order(self) -> List[int]:
+        remaining = [len(dependencies) for dependencies in self._dependencies]
+        ordered = [node for node, count in enumerate(remaining) if not count]
+
+        # `ordered` doubles as the queue of tasks whose dependencies have all
+        # been placed.
+        for node in ordered:
+            for dependent in self._dependents[node]:
+                remaining[dependent] -= 1
+                if not remaining[dependent]:
+                    ordered.append(dependent)
+
+        if len(ordered) < len(self._tasks):
+            raise DependencyCycle(self.cycles()[0])
+
+        return ordered
+
+    def _is_blocked(self, node: int) -> bool:
+        return self._open[node] and any(
+            self._open[dependency] for dependency in self._dependencies[node]
+        )
+
+    def _is_blocking(self, node: int) -> bool:
+        return self._open[node] and any(
+            self._open[dependent] for dependent in self._dependents[node]
+        )
+
+    def _get_position(self, task: TaskOrUUID) -> int:
+        task_uuid = task if isinstance(task, uuid.UUID) else task.uuid
+        assert task_uuid is not None
+
+        return self._positions[task_uuid.int]
+
+    def _get_tasks(self, nodes: Iterable[int]) -> List[Task]:
+        return [self._tasks[node] for node in nodes]
+
+    def __repr__(self):
+        return f"DependencyGraph(tasks={len(self)})"
@@ -0,0 +1,245 @@
+"""Observes the Taskwarrior commands a client runs and the parsing of results.
+
+Pass observers to `Client` to be notified of every command::
+
+    stats = StatsObserver()
+    client = Client(observers=[stats, LoggingObserver()])
+    client.filter("+alarm")
+    stats.get_command_stats()["export"].p50
+
+Clients without observers do not measure anything.
+
+"""
+import logging
+import threading
+from collections import defaultdict
+from collections import deque
+from typing import DefaultDict
+from typing import Deque
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+
+DEFAULT_MAX_SAMPLES = 10000
+
+logger = logging.getLogger(__name__)
+
+
+class CommandEvent(NamedTuple):
+    """Describes a finished Taskwarrior command.
+
+    * `verb`: the Taskwarrior command run (e.g. `export` or `import`).
+    * `filter`: the arguments preceding the verb.
+    * `wall_time`: seconds from starting the process until it exited.
+    * `cpu_time`: user and system CPU seconds used by the process, if known.
+
+    """
+
+    verb: str
+    filter: str
+    command: List[str]
+    wall_time: float
+    cpu_time: Optional[float]
+    stdout_bytes: int
+    stderr_bytes: int
+    return_code: int
+
+
+class ParseEvent(NamedTuple):
+    """Describes the conversion of exported JSON into tasks."""
+
+    wall_time: float
+    task_count: int
+    input_bytes: int
+    validate: str
+
+
+class Observer:
+    """Receives events; override the methods for the events you need."""
+
+    def command_started(self, command: List[str]) -> None:
+        pass
+
+    def command_finished(self, event: CommandEvent) -> None:
+        pass
+
+    def command_failed(self, command: List[str], error: BaseException) -> None:
+        """Called instead of `command_finished` if running `command` raised."""
+        pass
+
+    def parse_started(self, input_bytes: int) -> None:
+        pass
+
+    def parse_finished(self, event: ParseEvent) -> None:
+        pass
+
+
+class TimingStats(NamedTuple):
+    calls: int
+    errors: int
+    total_time: float
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+
+class StatsObserver(Observer):
+    """Aggregates events in memory.
+
+    Percentiles are computed from (at most) the `max_samples` most recent
+    events of each kind; counts and totals include every event.
+
+    """
+
+    def __init__(self, max_samples: int = DEFAULT_MAX_SAMPLES):
+        self.max_samples = max_samples
+
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._samples: DefaultDict[str, Deque[float]] = defaultdict(
+                lambda: deque(maxlen=self.max_samples)
+            )
+            self._counts: DefaultDict[str, int] = defaultdict(int)
+            self._errors: DefaultDict[str, int] = defaultdict(int)
+            self._totals: DefaultDict[str, float] = defaultdict(float)
+
+            self.cpu_time = 0.0
+            self.stdout_bytes = 0
+            self.stderr_bytes = 0
+            self.tasks_parsed = 0
+            self.failed_commands = 0
+
+    def command_finished(self, event: CommandEvent) -> None:
+        with self._lock:
+            self._record(event.verb, event.wall_time, event.return_code != 0)
+            self.cpu_time += event.cpu_time or 0.0
+            self.stdout_bytes += event.stdout_bytes
+            self.stderr_bytes += event.stderr_bytes
+
+    def command_failed(self, command: List[str], error: BaseException) -> None:
+        with self._lock:
+            self.failed_commands += 1
+
+    def parse_finished(self, event: ParseEvent) -> None:
+        with self._lock:
+            self._record("parse", event.wall_time, False)
+            self.tasks_parsed += event.task_count
+
+    def get_command_stats(self) -> Dict[str, TimingStats]:
+        """Returns timings of commands, keyed by their verb."""
+        with self._lock:
+            return {
+                verb: self._get_stats(verb) for verb in self._counts if verb != "parse"
+            }
+
+    def get_parse_stats(self) -> Optional[TimingStats]:
+        with self._lock:
+            if not self._counts["parse"]:
+                return None
+            return self._get_stats("parse")
+
+    def _record(self, key: str, wall_time: float, error: bool) -> None:
+        self._samples[key].append(wall_time)
+        self._counts[key] += 1
+        self._totals[key] += wall_time
+        if error:
+            self._errors[key] += 1
+
+    def _get_stats(self, key: str) -> TimingStats:
+        samples = sorted(self._samples[key])
+
+        return TimingStats(
+            calls=self._counts[key],
+            errors=self._errors[key],
+            total_time=self._totals[key],
+            p50=percentile(samples, 50),
+            p90=percentile(samples, 90),
+            p99=percentile(samples, 99),
+            max=samples[-1] if samples else 0.0,
+        )
+
+    def __repr__(self):
+        commands = sum(stats.calls for stats in self.get_command_stats().values())
+        return f"StatsObserver(commands={commands}, tasks_parsed={self.tasks_parsed})"
+
+
+class LoggingObserver(Observer):
+    """Logs a structured record of each event.
+
+    Event fields are attached to each record as attributes (via `extra`) for
+    use by structured log handlers, and are also included in its message.
+
+    """
+
+    def __init__(self, logger: logging.Logger = logger, level: int = logging.DEBUG):
+        self.logger = logger
+        self.level = level
+
+    def command_finished(self, event: CommandEvent) -> None:
+        if not self.logger.isEnabledFor(self.level):
+            return
+
+        self.logger.log(
+            self.level,
+            "task %s %s: %.1fms, %d bytes, returned %d",
+            event.verb,
+            event.filter,
+            event.wall_time * 1000,
+            event.stdout_bytes,
+            event.return_code,
+            extra={
+                "taskwarrior_event": "command",
+                **{
+                    f"taskwarrior_{name}": value
+                    for name, value in event._asdict().items()
+                },
+            },
+        )
+
+    def command_failed(self, command: List[str], error: BaseException) -> None:
+        if not self.logger.isEnabledFor(self.level):
+            return
+
+        self.logger.log(
+            self.level,
+            "%s failed: %r",
+            " ".join(command),
+            error,
+            extra={
+                "taskwarrior_event": "command_failed",
+                "taskwarrior_command": command,
+            },
+        )
+
+    def parse_finished(self, event: ParseEvent) -> None:
+        if not self.logger.isEnabledFor(self.level):
+            return
+
+        self.logger.log(
+            self.level,
+            "parsed %d tasks: %.1fms",
+            event.task_count,
+            event.wall_time * 1000,
+            extra={
+                "taskwarrior_event": "parse",
+                **{
+                    f"taskwarrior_{name}": value
+                    for name, value in event._asdict().items()
+                },
+            },
+        )
+
+
+def percentile(ordered: Sequence[float], percent: float) -> float:
+    """Returns the nearest-rank percentile of already-sorted values."""
+    if not ordered:
+        return 0.0
+
+    rank = max(1, -(-len(ordered) * percent // 100))
+    return ordered[int(rank) - 1]
@@ -0,0 +1,191 @@
+"""Keeps a copy of every task up to date by exporting only changed tasks.
+
+Rather than exporting every task each time they are needed, a `Mirror`
+exports every task once, and from then on only those modified since the
+latest modification it has seen::
+
+    mirror = Mirror(client, snapshot_path="tasks.mirror")
+    mirror.refresh()
+    mirror.store.filter(project="Home", status="pending")
+
+If a snapshot path is given, the mirror is saved there after each refresh
+that changed it and loaded from there when created, so that a restarted
+process does not need to export every task again.
+
+"""
+from __future__ import annotations
+
+import datetime
+import json
+import logging
+import os
+import tempfile
+from typing import List
+from typing import Optional
+
+from .client import Client
+from .store import TaskStore
+from .task import Task
+
+SNAPSHOT_VERSION = 1
+
+# Taskwarrior records modification times to the second, so a task may be
+# changed again during the second in which it was last exported.  Tasks
+# modified up to this long before the latest modification seen are
+# therefore exported again.
+DEFAULT_OVERLAP = datetime.timedelta(seconds=1)
+
+logger = logging.getLogger(__name__)
+
+
+class Mirror:
+    """A `TaskStore` holding every task, refreshed incrementally.
+
+    Completing or deleting a task changes its modification time, so such
+    tasks are exported by the next refresh and updated in the mirror like
+    any other change.  Two kinds of change cannot be seen this way:
+
+    * tasks removed from the data files entirely (e.g. by `task purge`)
+      remain in the mirror until the next full refresh;
+    * task IDs change without changing the modification time (e.g. when
+      other tasks are completed), so the `id` of mirrored tasks may be
+      outdated; identify tasks by their UUID instead.
+
+    The mirror is read from and written to only using `refresh`; changes
+    made using the store's `add`, `modify`, or `delete` methods are seen by
+    the next refresh, like changes made by any other Taskwarrior client.
+
+    """
+
+    _client: Client
+    _snapshot_path: Optional[str]
+    _overlap: datetime.timedelta
+    _data_location: str
+
+    _store: TaskStore
+    _high_water_mark: Optional[datetime.datetime]
+
+    def __init__(
+        self,
+        client: Client,
+        snapshot_path: Optional[str] = None,
+        overlap: datetime.timedelta = DEFAULT_OVERLAP,
+    ):
+        self._client = client
+        self._snapshot_path = snapshot_path
+        self._overlap = overlap
+        self._data_location = os.path.abspath(client.get_data_location())
+
+        self._store = TaskStore(client)
+        self._high_water_mark = None
+
+        if snapshot_path is not None:
+            self._load_snapshot(snapshot_path)
+
+    @property
+    def store(self) -> TaskStore:
+        return self._store
+
+    @property
+    def high_water_mark(self) -> Optional[datetime.datetime]:
+        """The latest modification time of any mirrored task."""
+        return self._high_water_mark
+
+    def refresh(self, full: bool = False) -> List[Task]:
+        """Brings the mirror up to date and returns the tasks that changed.
+
+        Every task is exported if `full` is set or nothing has been mirrored
+        yet; otherwise only tasks modified since the high-water mark are.
+
+        """
+        if full or self._high_water_mark is None:
+            changed = self._client.filter()
+            self._store = TaskStore(self._client, changed)
+            self._high_water_mark = None
+        else:
+            changed = [
+                task
+                for task in self._client.filter(
+                    modified__after=self._high_water_mark - self._overlap
+                )
+                if self._is_changed(task)
+            ]
+            for task in changed:
+                self._store._index(task)
+
+        self._update_high_water_mark(changed)
+        if changed and self._snapshot_path is not None:
+            self.save(self._snapshot_path)
+
+        return changed
+
+    def save(self, path: str) -> None:
+        """Writes a snapshot of the mirror to `path`, replacing it atomically."""
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temporary_path = tempfile.mkstemp(
+            dir=directory, prefix=f".{os.path.basename(path)}."
+        )
+
+        header = {"version": SNAPSHOT_VERSION, "data_location": self._data_location}
+
+        try:
+            # One line holding the header, then one line per task
+            with os.fdopen(fd, "w", encoding="utf-8") as outf:
+                outf.write(json.dumps(header))
+                outf.write("\n")
+                for task in self._store:
+                    outf.write(task.json(exclude_unset=True))
+                    outf.write("\n")
+                outf.flush()
+                os.fsync(outf.fileno())
+            os.replace(temporary_path, path)
+        except BaseException:
+            try:
+                os.unlink(temporary_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def _load_snapshot(self, path: str) -> None:
+        """Loads a snapshot written by `save`, if it can be used."""
+        try:
+            with open(path, encoding="utf-8") as inf:
+                header = json.loads(next(inf, "null"))
+                if not isinstance(header, dict):
+                    raise ValueError("Missing header")
+                elif header.get("version") != SNAPSHOT_VERSION:
+                    raise ValueError(f"Unknown version {header.get('version')!r}")
+                elif header.get("data_location") != self._data_location:
+                    raise ValueError(
+                        f"Snapshot of tasks in {header.get('data_location')!r}"
+                    )
+
+                tasks = [Task.parse_raw(line) for line in inf if line.strip()]
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            # Including pydantic's `ValidationError` and `json.JSONDecodeError`
+            logger.warning("Ignoring unusable mirror snapshot %s: %s", path, e)
+            return
+
+        self._store = TaskStore(self._client, tasks)
+        self._update_high_water_mark(tasks)
+
+    def _is_changed(self, task: Task) -> bool:
+        # Tasks exported again only because of the overlap are unchanged
+        current = self._store._tasks.get(task.uuid)  # type: ignore[arg-type]
+
+        return current is None or current.dict() != task.dict()
+
+    def _update_high_water_mark(self, tasks: List[Task]) -> None:
+        for task in tasks:
+            if task.modified is not None and (
+                self._high_water_mark is None or task.modified > self._high_water_mark
+            ):
+                self._high_water_mark = task.modified
+
+    def __repr__(self):
+        return (
+            f"Mirror({self._client!r}, tasks={len(self._store)}, "
+            f"high_water_mark={self._high_water_mark})"
+        )
@@ -0,0 +1,305 @@
+"""Runs client methods across many Taskwarrior configurations concurrently.
+
+A `ClientPool` manages one `Client` per tenant -- a name for a taskrc and,
+through it, a data location -- and runs the same call for many tenants at
+once on a bounded pool of threads or processes::
+
+    pool = ClientPool({"alice": "/home/alice/.taskrc", "bob": "/home/bob/.taskrc"})
+    for result in pool.count(status="pending"):
+        if result.error is None:
+            print(result.tenant, result.value)
+
+Results are yielded as each call completes, in no particular order; the
+failure of one tenant's call is reported in its result and does not stop
+the others.
+
+"""
+from __future__ import annotations
+
+import concurrent.futures
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Mapping
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from typing_extensions import Literal
+
+from .client import DEFAULT_IMPORT_CHUNK_SIZE
+from .client import Client
+from .client import Q
+from .exceptions import ClientUsageError
+from .task import Task
+from .types import FilterSpec
+
+DEFAULT_MAX_WORKERS = 8
+
+# Methods that may be called across tenants; their results can be pickled.
+POOL_METHODS = frozenset(
+    [
+        "count",
+        "delete_where",
+        "filter",
+        "get",
+        "get_many",
+        "import_many",
+        "modify_where",
+    ]
+)
+
+# Clients created in worker processes, keyed by configuration
+_worker_clients: Dict[Tuple[str, str], Client] = {}
+
+
+class TenantResult(NamedTuple):
+    """The outcome of a call for one tenant: its `value`, or its `error`."""
+
+    tenant: str
+    value: Any = None
+    error: Optional[Exception] = None
+
+
+class TenantCall(NamedTuple):
+    tenant: str
+    method: str
+    args: Tuple[Any, ...] = ()
+    kwargs: Mapping[str, Any] = {}
+
+
+class ClientPool:
+    """Runs client methods for many tenants on a bounded worker pool.
+
+    * `tenants`: the taskrc path of each tenant, keyed by the tenant's name.
+    * `max_workers`: the number of calls run at once.
+    * `mode`: run calls on threads (`"thread"`) or processes
+      (`"process"`).  Calls spend most of their time waiting for
+      Taskwarrior, so threads usually suffice; processes also parallelise
+      the parsing of large exports, at the cost of pickling each result.
+    * `max_pending`: the number of calls submitted but not yet yielded;
+      when reached, no more calls are submitted until the caller consumes
+      a result.  Defaults to twice `max_workers`.
+    * `client_options`: further keyword arguments for each `Client`; these
+      must be picklable in `"process"` mode.
+
+    """
+
+    _tenants: Dict[str, str]
+    _clients: Dict[str, Client]
+
+    def __init__(
+        self,
+        tenants: Mapping[str, str],
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        mode: Literal["thread", "process"] = "thread",
+        max_pending: Optional[int] = None,
+        client_options: Optional[Dict[str, Any]] = None,
+    ):
+        if max_workers < 1:
+            raise ClientUsageError("The number of workers must be positive.")
+        if mode not in ("thread", "process"):
+            raise ClientUsageError(f"Unknown mode {mode!r}.")
+
+        self.max_workers = max_workers
+        self.mode = mode
+        self.max_pending = max(max_pending or 2 * max_workers, 1)
+        self.client_options = client_options or {}
+
+        self._tenants = dict(tenants)
+        self._clients = {}
+        self._executor: Optional[concurrent.futures.Executor] = None
+
+    @property
+    def tenants(self) -> List[str]:
+        return list(self._tenants)
+
+    def add_tenant(self, tenant: str, config_filename: str) -> None:
+        self._tenants[tenant] = config_filename
+        self._clients.pop(tenant, None)
+
+    def remove_tenant(self, tenant: str) -> None:
+        del self._tenants[tenant]
+        self._clients.pop(tenant, None)
+
+    def get_client(self, tenant: str) -> Client:
+        """Returns the client used for `tenant` in `"thread"` mode."""
+        client = self._clients.get(tenant)
+        if client is None:
+            client = self._clients[tenant] = Client(
+                config_filename=self._tenants[tenant], **self.client_options
+            )
+        return client
+
+    def filter(
+        self,
+        *params: Union[FilterSpec, Q],
+        tenants: Optional[Iterable[str]] = None,
+        **dictparams: Any,
+    ) -> Iterator[TenantResult]:
+        """Yields each tenant's tasks matching the provided filters."""
+        return self.map("filter", *params, tenants=tenants, **dictparams)
+
+    def count(
+        self,
+        *params: Union[FilterSpec, Q],
+        tenants: Optional[Iterable[str]] = None,
+        **dictparams: Any,
+    ) -> Iterator[TenantResult]:
+        """Yields the number of each tenant's tasks matching the filters."""
+        return self.map("count", *params, tenants=tenants, **dictparams)
+
+    def import_many(
+        self,
+        tasks: Mapping[str, Iterable[Task]],
+        chunk_size: int = DEFAULT_IMPORT_CHUNK_SIZE,
+    ) -> Iterator[TenantResult]:
+        """Imports tasks for each tenant, given the tasks keyed by tenant.
+
+        Each result's value is the list of `ImportResult`s for that tenant.
+
+        """
+        self._check_tenants(tasks)
+
+        return self.run(
+            TenantCall(
+                tenant, "import_many", (list(tenant_tasks),), {"chunk_size": chunk_size}
+            )
+            for tenant, tenant_tasks in tasks.items()
+        )
+
+    def map(
+        self,
+        method: str,
+        *args: Any,
+        tenants: Optional[Iterable[str]] = None,
+        **kwargs: Any,
+    ) -> Iterator[TenantResult]:
+        """Yields the result of calling `method` for each tenant.
+
+        Calls `method` for every tenant, or for those in `tenants`.
+
+        """
+        _check_method(method)
+        selected = self.tenants if tenants is None else list(tenants)
+        self._check_tenants(selected)
+
+        return self.run(TenantCall(tenant, method, args, kwargs) for tenant in selected)
+
+    def run(self, calls: Iterable[TenantCall]) -> Iterator[TenantResult]:
+        """Yields the result of each call as it completes.
+
+        `calls` is consumed only as workers become free, so it may be a
+        generator producing calls lazily.  If iteration is stopped early,
+        calls not yet started are cancelled.
+
+        """
+        calls = iter(calls)
+        executor = self._get_executor()
+        pending: Dict[concurrent.futures.Future, str] = {}
+
+        try:
+            while True:
+                while len(pending) < self.max_pending:
+                    call = next(calls, None)
+                    if call is None:
+                        break
+                    pending[self._submit(executor, call)] = call.tenant
+
+                if not pending:
+                    return
+
+                done, _ = concurrent.futures.wait(
+                    pending, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    yield _get_result(pending.pop(future), future)
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def close(self) -> None:
+        """Shuts down the pool's workers, waiting for running calls."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def __enter__(self) -> ClientPool:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _get_executor(self) -> concurrent.futures.Executor:
+        if self._executor is None:
+            if self.mode == "process":
+                self._executor = concurrent.futures.ProcessPoolExecutor(
+                    max_workers=self.max_workers
+                )
+            else:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="taskwarrior-pool"
+                )
+        return self._executor
+
+    def _submit(
+        self, executor: concurrent.futures.Executor, call: TenantCall
+    ) -> concurrent.futures.Future:
+        _check_method(call.method)
+
+        if self.mode == "process":
+            return executor.submit(
+                _call_in_worker,
+                self._tenants[call.tenant],
+                self.client_options,
+                call.method,
+                call.args,
+                dict(call.kwargs),
+            )
+
+        client = self.get_client(call.tenant)
+        return executor.submit(getattr(client, call.method), *call.args, **call.kwargs)
+
+    def _check_tenants(self, tenants: Iterable[str]) -> None:
+        unknown = [tenant for tenant in tenants if tenant not in self._tenants]
+        if unknown:
+            raise ClientUsageError(f"Unknown tenants: {', '.join(map(str, unknown))}")
+
+    def __repr__(self):
+        return (
+            f"ClientPool(tenants={len(self._tenants)}, "
+            f"max_workers={self.max_workers}, mode={self.mode!r})"
+        )
+
+
+def _check_method(method: str) -> None:
+    if method not in POOL_METHODS:
+        raise ClientUsageError(f"Method {method!r} cannot be run in a pool.")
+
+
+def _get_result(tenant: str, future: concurrent.futures.Future) -> TenantResult:
+    try:
+        return TenantResult(tenant, future.result())
+    except Exception as e:
+        return TenantResult(tenant, error=e)
+
+
+def _call_in_worker(
+    config_filename: str,
+    client_options: Dict[str, Any],
+    method: str,
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+) -> Any:
+    """Runs a call in a worker process, reusing that process's clients."""
+    key = (config_filename, repr(sorted(client_options.items())))
+    client = _worker_clients.get(key)
+    if client is None:
+        client = _worker_clients[key] = Client(
+            config_filename=config_filename, **client_options
+        )
+
+    return getattr(client, method)(*args, **kwargs)
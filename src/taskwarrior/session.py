@@ -0,0 +1,217 @@
+"""Collects changes to many tasks and writes them all at once.
+
+Every `Client.add`, `modify`, and `delete` call starts its own Taskwarrior
+process, and each of those rewrites Taskwarrior's data files.  A `Session`
+instead keeps track of the tasks it has loaded and of the changes made to
+them, and writes everything that changed when it is flushed::
+
+    with client.session() as session:
+        for task in session.filter(project="Home"):
+            task.project = "House"
+        session.delete(session.get(uuid=some_uuid))
+
+"""
+from __future__ import annotations
+
+import uuid
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Set
+from typing import Union
+
+from .client import Client
+from .client import Q
+from .exceptions import ClientUsageError
+from .exceptions import CommandError
+from .task import Task
+from .types import FilterSpec
+
+
+class Session:
+    """A unit of work: tracks tasks and writes their changes in batches.
+
+    Tasks retrieved using `filter` or `get` are tracked; retrieving a task
+    the session already tracks returns the tracked instance, so every
+    change made to a task within the session is made to the same object.
+    When the session is flushed, added tasks and tracked tasks whose fields
+    differ from when they were retrieved are written using one
+    `task import` per `chunk_size` tasks; tasks deleted within the session
+    are then deleted using `Client.delete_many`, and are not imported.
+
+    Used as a context manager, the session is flushed on exit unless an
+    exception was raised.
+
+    """
+
+    _client: Client
+    _chunk_size: int
+
+    _tracked: Dict[uuid.UUID, Task]
+    _snapshots: Dict[uuid.UUID, Dict[str, Any]]
+    _added: Dict[uuid.UUID, Task]
+    _modified: Set[uuid.UUID]
+    _deleted: Dict[uuid.UUID, Task]
+
+    def __init__(self, client: Client, chunk_size: int):
+        self._client = client
+        self._chunk_size = chunk_size
+
+        self._tracked = {}
+        self._snapshots = {}
+        self._added = {}
+        self._modified = set()
+        self._deleted = {}
+
+    def filter(self, *params: Union[FilterSpec, Q], **dictparams: Any) -> List[Task]:
+        """Returns tasks matching the provided filters, and tracks them.
+
+        Unflushed changes made within the session are not taken into account
+        when filtering.
+
+        """
+        return [
+            self.track(task) for task in self._client.filter(Q(*params, **dictparams))
+        ]
+
+    def get(self, *params: Union[FilterSpec, Q], **dictparams: Any) -> Task:
+        q = Q(*params, **dictparams)
+
+        return self._client._get_single(self.filter(q), q)
+
+    def track(self, task: Task) -> Task:
+        """Starts tracking changes made to `task` from now on.
+
+        If the session already tracks a task having the same UUID, that
+        task is returned instead and `task` is ignored.
+
+        """
+        if not task.uuid:
+            raise ClientUsageError(
+                "Task has no UUID set.  You may want to use `add` instead."
+            )
+
+        tracked = self._tracked.get(task.uuid)
+        if tracked is not None:
+            return tracked
+
+        self._tracked[task.uuid] = task
+        self._snapshots[task.uuid] = task.dict()
+
+        return task
+
+    def add(self, task: Task) -> None:
+        self._client._prepare_add(task)
+        self._client._check_import(task)
+
+        self._added[task.uuid] = task  # type: ignore[index]
+
+    def modify(self, task: Task) -> None:
+        """Marks `task` to be written even if it is not tracked.
+
+        Changes to tracked tasks are detected when the session is flushed,
+        so calling this for them is not necessary.  If a different task
+        having the same UUID is tracked, `task` replaces it.
+
+        """
+        self._client._check_modify(task)
+        self._client._check_import(task)
+
+        assert task.uuid is not None
+        if task.uuid in self._added:
+            self._added[task.uuid] = task
+            return
+
+        self._tracked[task.uuid] = task
+        self._modified.add(task.uuid)
+
+    def delete(self, task: Task) -> None:
+        self._client._check_delete(task)
+
+        assert task.uuid is not None
+        if self._added.pop(task.uuid, None) is not None:
+            # Never written, so there is nothing to delete
+            return
+
+        self._deleted[task.uuid] = task
+
+    def get_changed_fields(self, task: Task) -> Set[str]:
+        """Returns the names of the fields of `task` changed since tracked."""
+        assert task.uuid is not None
+        snapshot = self._snapshots.get(task.uuid)
+        if snapshot is None:
+            return set(task.dict())
+
+        current = task.dict()
+
+        return {
+            name
+            for name in snapshot.keys() | current.keys()
+            if snapshot.get(name) != current.get(name)
+        }
+
+    def get_dirty(self) -> List[Task]:
+        """Returns the tasks that would be imported if flushed now."""
+        dirty = list(self._added.values())
+
+        for task_uuid, task in self._tracked.items():
+            if task_uuid in self._deleted:
+                continue
+            if task_uuid in self._modified or self.get_changed_fields(task):
+                dirty.append(task)
+
+        return dirty
+
+    def flush(self) -> None:
+        """Writes all pending changes.
+
+        Each batch of tasks is imported by a single Taskwarrior process and so
+        is written entirely or not at all.  If a batch fails, its
+        `CommandError` is raised after the other batches have been written;
+        changes that were not written remain pending, so `flush` may be
+        called again.  Deletions are made once every batch has been
+        imported; if they fail, they all remain pending.
+
+        """
+        error: Optional[CommandError] = None
+
+        dirty = self.get_dirty()
+        if dirty:
+            for result in self._client.import_many(dirty, chunk_size=self._chunk_size):
+                if result.error is not None:
+                    error = error or result.error
+                    continue
+
+                task_uuid = result.task.uuid
+                assert task_uuid is not None
+                self._added.pop(task_uuid, None)
+                self._modified.discard(task_uuid)
+                self.track(result.task)
+                self._snapshots[task_uuid] = result.task.dict()
+
+        if error is None and self._deleted:
+            # Tasks already deleted are skipped, so if this fails, flushing
+            # again deletes only those that remain.
+            self._client.delete_many(list(self._deleted))
+
+            for task_uuid in self._deleted:
+                self._tracked.pop(task_uuid, None)
+                self._snapshots.pop(task_uuid, None)
+            self._deleted = {}
+
+        if error is not None:
+            raise error
+
+    def __enter__(self) -> Session:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.flush()
+
+    def __repr__(self):
+        return (
+            f"Session(tracked={len(self._tracked)}, added={len(self._added)}, "
+            f"deleted={len(self._deleted)})"
+        )
@@ -0,0 +1,353 @@
+"""An in-memory, indexed collection of tasks.
+
+`TaskStore` answers `get`, `filter`, and `count` without starting a
+Taskwarrior process.  Filters are evaluated using `taskwarrior.evaluate`;
+indexes are used only to narrow down which tasks need to be evaluated, so
+results are the same as if every task had been checked.
+
+"""
+from __future__ import annotations
+
+import bisect
+import datetime
+import uuid
+from collections import defaultdict
+from typing import Any
+from typing import DefaultDict
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Set
+from typing import Tuple
+from typing import Union
+
+from .client import Client
+from .client import Q
+from .evaluate import MODIFIER_ALIASES
+from .evaluate import VIRTUAL_TAGS
+from .evaluate import compile_filter
+from .evaluate import parse_date_value
+from .exceptions import UnsupportedFilter
+from .task import Task
+from .types import FilterSpec
+from .types import StdoutStderr
+
+SORTED_FIELDS = ("due", "scheduled")
+
+
+class IndexedValues(NamedTuple):
+    """The values a task was indexed under."""
+
+    project: Optional[str]
+    status: Optional[str]
+    tags: Tuple[str, ...]
+    dates: Tuple[Optional[float], ...]
+
+
+class SortedIndex:
+    """Task UUIDs ordered by a timestamp, for answering range queries."""
+
+    def __init__(self):
+        self._keys: List[float] = []
+        self._uuids: List[uuid.UUID] = []
+
+    def add(self, key: float, task_uuid: uuid.UUID) -> None:
+        position = bisect.bisect_right(self._keys, key)
+        self._keys.insert(position, key)
+        self._uuids.insert(position, task_uuid)
+
+    def remove(self, key: float, task_uuid: uuid.UUID) -> None:
+        position = bisect.bisect_left(self._keys, key)
+        while self._uuids[position] != task_uuid:
+            position += 1
+        del self._keys[position]
+        del self._uuids[position]
+
+    def range(
+        self, low: Optional[float] = None, high: Optional[float] = None
+    ) -> Set[uuid.UUID]:
+        """Returns the UUIDs whose key is in `[low, high]`."""
+        start = 0 if low is None else bisect.bisect_left(self._keys, low)
+        end = len(self._keys) if high is None else bisect.bisect_right(self._keys, high)
+
+        return set(self._uuids[start:end])
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+class TaskStore:
+    """Holds tasks in memory and answers queries against them.
+
+    Load a store using `TaskStore.load`, which accepts the same filters as
+    `Client.filter`.  Changes made through `add`, `modify`, and `delete` are
+    written using the client and reflected in the store's indexes; tasks
+    changed in other ways (including by other Taskwarrior clients) are not
+    noticed until the store is loaded again.
+
+    """
+
+    _client: Client
+    _udas: Dict[str, str]
+
+    def __init__(self, client: Client, tasks: Iterable[Task] = ()):
+        self._client = client
+        self._udas = client._get_uda_types(client.get_config())
+
+        self._tasks: Dict[uuid.UUID, Task] = {}
+        self._positions: Dict[uuid.UUID, int] = {}
+        self._indexed: Dict[uuid.UUID, IndexedValues] = {}
+        self._by_project: DefaultDict[Optional[str], Set[uuid.UUID]] = defaultdict(set)
+        self._by_status: DefaultDict[Optional[str], Set[uuid.UUID]] = defaultdict(set)
+        self._by_tag: DefaultDict[str, Set[uuid.UUID]] = defaultdict(set)
+        self._by_date: Dict[str, SortedIndex] = {
+            field: SortedIndex() for field in SORTED_FIELDS
+        }
+        self._next_position = 0
+
+        for task in tasks:
+            self._index(task)
+
+    @classmethod
+    def load(
+        cls,
+        client: Client,
+        *params: Union[FilterSpec, Q],
+        **dictparams: Any,
+    ) -> TaskStore:
+        """Creates a store holding the tasks matching the provided filters."""
+        return cls(client, client.filter(Q(*params, **dictparams)))
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __iter__(self) -> Iterator[Task]:
+        return iter(self._tasks.values())
+
+    def __contains__(self, task_uuid: Any) -> bool:
+        return task_uuid in self._tasks
+
+    def filter(
+        self, *params: Union[FilterSpec, Q], **dictparams: Any
+    ) -> List[Task]:
+        """Returns stored tasks matching the provided filters.
+
+        Raises `UnsupportedFilter` for filters that cannot be evaluated
+        without Taskwarrior; see `taskwarrior.evaluate`.
+
+        """
+        q = Q(*params, **dictparams)
+        predicate = compile_filter(q, udas=self._udas)
+        candidates = self._get_candidates(q)
+
+        if candidates is None:
+            tasks: Iterable[Task] = self._tasks.values()
+        else:
+            tasks = [
+                self._tasks[task_uuid]
+                for task_uuid in sorted(candidates, key=self._positions.__getitem__)
+            ]
+
+        return [task for task in tasks if predicate(task)]
+
+    def count(self, *params: Union[FilterSpec, Q], **dictparams: Any) -> int:
+        return self._client._count_tasks(
+            task.status for task in self.filter(*params, **dictparams)
+        )
+
+    def get(self, *params: Union[FilterSpec, Q], **dictparams: Any) -> Task:
+        q = Q(*params, **dictparams)
+
+        return self._client._get_single(self.filter(q), q)
+
+    def add(self, task: Task) -> StdoutStderr:
+        result = self._client.add(task)
+        self._index(task)
+
+        return result
+
+    def modify(self, task: Task) -> StdoutStderr:
+        result = self._client.modify(task)
+        self._index(task)
+
+        return result
+
+    def delete(self, task: Task) -> StdoutStderr:
+        result = self._client.delete(task)
+
+        # Taskwarrior keeps deleted tasks, so we do too.
+        task.status = "deleted"
+        task.end = datetime.datetime.now(tz=datetime.timezone.utc)
+        self._index(task)
+
+        return result
+
+    def _index(self, task: Task) -> None:
+        assert task.uuid is not None
+
+        if task.uuid in self._tasks:
+            self._unindex(task.uuid)
+        else:
+            self._positions[task.uuid] = self._next_position
+            self._next_position += 1
+
+        values = IndexedValues(
+            project=task.project,
+            status=task.status,
+            tags=tuple(task.tags or ()),
+            dates=tuple(
+                _get_timestamp(getattr(task, field)) for field in SORTED_FIELDS
+            ),
+        )
+
+        self._tasks[task.uuid] = task
+        self._indexed[task.uuid] = values
+        self._by_project[values.project].add(task.uuid)
+        self._by_status[values.status].add(task.uuid)
+        for tag in values.tags:
+            self._by_tag[tag].add(task.uuid)
+        for field, key in zip(SORTED_FIELDS, values.dates):
+            if key is not None:
+                self._by_date[field].add(key, task.uuid)
+
+    def _unindex(self, task_uuid: uuid.UUID) -> None:
+        values = self._indexed.pop(task_uuid)
+
+        _discard(self._by_project, values.project, task_uuid)
+        _discard(self._by_status, values.status, task_uuid)
+        for tag in values.tags:
+            _discard(self._by_tag, tag, task_uuid)
+        for field, key in zip(SORTED_FIELDS, values.dates):
+            if key is not None:
+                self._by_date[field].remove(key, task_uuid)
+
+    def _get_candidates(self, q: Any) -> Optional[Set[uuid.UUID]]:
+        """Returns the UUIDs of tasks that might match `q`.
+
+        Returns `None` if the indexes cannot narrow down the tasks at all.
+
+        """
+        operator = getattr(q, "_logical_operator", None)
+        if operator is not None:
+            left = self._get_candidates(q._logical_operands[0])
+            right = self._get_candidates(q._logical_operands[1])
+            if operator == "and":
+                return _intersect([left, right])
+            elif left is None or right is None:
+                return None
+            return left | right
+
+        candidates: List[Optional[Set[uuid.UUID]]] = []
+        for param in q._params:
+            if hasattr(param, "serialize"):
+                candidates.append(self._get_candidates(param))
+            elif isinstance(param, str):
+                for token in param.split():
+                    if token.startswith("+") and token[1:] not in VIRTUAL_TAGS:
+                        candidates.append(self._by_tag.get(token[1:], set()))
+                    elif ":" in token:
+                        candidates.append(
+                            self._get_attribute_candidates(*token.split(":", 1))
+                        )
+            elif isinstance(param, dict):
+                for key, value in param.items():
+                    candidates.append(self._get_attribute_candidates(key, value))
+
+        return _intersect(candidates)
+
+    def _get_attribute_candidates(
+        self, key: str, value: Any
+    ) -> Optional[Set[uuid.UUID]]:
+        name, _, modifier = key.replace("__", ".").partition(".")
+        modifier = MODIFIER_ALIASES.get(modifier, modifier)
+
+        if value is None or value == "":
+            return None
+
+        if name == "uuid" and modifier in ("", "is"):
+            try:
+                task_uuid = value if isinstance(value, uuid.UUID) else uuid.UUID(value)
+            except ValueError:
+                # A UUID prefix; these are matched from the left
+                return None
+            return {task_uuid} if task_uuid in self._tasks else set()
+        elif name in ("project", "status") and modifier in ("", "is"):
+            if not isinstance(value, str):
+                return None
+            index = self._by_project if name == "project" else self._by_status
+            # Without a modifier, strings are matched from the left
+            return set().union(
+                *(
+                    uuids
+                    for indexed, uuids in index.items()
+                    if indexed is not None
+                    and (
+                        indexed == value
+                        or (modifier == "" and indexed.startswith(value))
+                    )
+                )
+            )
+        elif name == "tags" and modifier == "has" and isinstance(value, str):
+            return set(self._by_tag.get(value, ()))
+        elif name in self._by_date:
+            return self._get_date_candidates(self._by_date[name], modifier, value)
+
+        return None
+
+    def _get_date_candidates(
+        self, index: SortedIndex, modifier: str, value: Any
+    ) -> Optional[Set[uuid.UUID]]:
+        try:
+            start, end = parse_date_value(value)
+        except UnsupportedFilter:
+            return None
+
+        # Bounds are inclusive here; the filter itself excludes any extras.
+        if modifier == "before":
+            return index.range(high=start.timestamp())
+        elif modifier == "after":
+            return index.range(low=start.timestamp())
+        elif modifier in ("", "is"):
+            return index.range(low=start.timestamp(), high=(end or start).timestamp())
+
+        return None
+
+    def __repr__(self):
+        return f"TaskStore({self._client!r}, tasks={len(self)})"
+
+
+def _get_timestamp(value: Any) -> Optional[float]:
+    if isinstance(value, datetime.datetime):
+        return value.timestamp()
+    return None
+
+
+def _discard(
+    index: DefaultDict[Any, Set[uuid.UUID]], key: Any, task_uuid: uuid.UUID
+) -> None:
+    uuids = index.get(key)
+    if uuids is None:
+        return
+
+    uuids.discard(task_uuid)
+    if not uuids:
+        del index[key]
+
+
+def _intersect(
+    candidates: Iterable[Optional[Set[uuid.UUID]]],
+) -> Optional[Set[uuid.UUID]]:
+    result: Optional[Set[uuid.UUID]] = None
+
+    for uuids in candidates:
+        if uuids is None:
+            continue
+        elif result is None:
+            result = set(uuids)
+        else:
+            result &= uuids
+
+    return result
@@ -1,17 +1,82 @@
 import datetime
+import functools
+from typing import Any
+from typing import Collection
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Type
+from typing import TypeVar
 from uuid import UUID
 
 import dateutil.parser
+import dateutil.tz
 import pytz
 from pydantic import BaseModel
 from pydantic import Extra
+from pydantic import ValidationError
 from pydantic import validator
 from typing_extensions import Literal
 
+from .types import Validation
+
 DATETIME_FORMAT = "%Y%m%dT%H%M%SZ"
 
+# Number of distinct timestamp strings whose parsed value is remembered
+DATETIME_CACHE_SIZE = 65536
+
+DATE_FIELDS = (
+    "due",
+    "end",
+    "entry",
+    "modified",
+    "scheduled",
+    "start",
+    "until",
+    "wait",
+)
+
+# Like Taskwarrior, tasks with these statuses neither block nor are blocked
+# by the tasks they depend on (or that depend on them).
+CLOSED_STATUSES = frozenset(["completed", "deleted"])
+
+
+@functools.lru_cache(maxsize=DATETIME_CACHE_SIZE)
+def _parse_datetime_string(value: str) -> datetime.datetime:
+    # Taskwarrior always emits timestamps in `DATETIME_FORMAT`; parsing
+    # those by hand is far cheaper than using dateutil's general parser.
+    if len(value) == 16 and value[8] == "T" and value[15] == "Z":
+        try:
+            return datetime.datetime(
+                int(value[0:4]),
+                int(value[4:6]),
+                int(value[6:8]),
+                int(value[9:11]),
+                int(value[11:13]),
+                int(value[13:15]),
+                tzinfo=dateutil.tz.UTC,
+            )
+        except ValueError:
+            pass
+
+    return dateutil.parser.parse(value)
+
+
+def parse_datetime(value: Any) -> Optional[datetime.datetime]:
+    """Parses a timestamp received from Taskwarrior.
+
+    Timestamps in Taskwarrior's own format are parsed directly; any other
+    string is parsed using `dateutil.parser.parse`.  Parsed values are
+    memoized, and `datetime` objects and `None` are returned unchanged.
+
+    """
+    if value is None or isinstance(value, datetime.datetime):
+        return value
+    elif isinstance(value, str):
+        return _parse_datetime_string(value)
+
+    return dateutil.parser.parse(value)
+
 
 class TaskwarriorJsonModel(BaseModel):
     class Config:
@@ -32,8 +97,8 @@ class Annotation(TaskwarriorJsonModel):
         pre=True,
     )
     @classmethod
-    def datetime_validator(cls, v) -> datetime.datetime:
-        return dateutil.parser.parse(v)
+    def datetime_validator(cls, v) -> Optional[datetime.datetime]:
+        return parse_datetime(v)
 
 
 class Task(TaskwarriorJsonModel, extra=Extra.allow):  # type: ignore[call-arg]
@@ -59,20 +124,10 @@ class Task(TaskwarriorJsonModel, extra=Extra.allow):  # type: ignore[call-arg]
     uuid: Optional[UUID]
     wait: Optional[datetime.datetime]
 
-    @validator(
-        "due",
-        "end",
-        "entry",
-        "modified",
-        "scheduled",
-        "start",
-        "until",
-        "wait",
-        pre=True,
-    )
+    @validator(*DATE_FIELDS, pre=True)
     @classmethod
-    def datetime_validator(cls, v) -> datetime.datetime:
-        return dateutil.parser.parse(v)
+    def datetime_validator(cls, v) -> Optional[datetime.datetime]:
+        return parse_datetime(v)
 
     def add_annotation(self, description: str, entry: datetime.datetime = None):
         annotation = Annotation()
@@ -81,3 +136,143 @@ class Task(TaskwarriorJsonModel, extra=Extra.allow):  # type: ignore[call-arg]
 
         self.annotations = self.annotations or []
         self.annotations.append(annotation)
+
+
+# Fields whose values in `task export` output need conversion to their type
+LAZY_FIELDS = frozenset([*DATE_FIELDS, "annotations", "depends", "parent", "uuid"])
+
+
+LazyTaskT = TypeVar("LazyTaskT", bound="LazyTask")
+
+
+class LazyTask(Task):
+    """A `Task` whose fields are validated only when first accessed.
+
+    Fields whose values arrive from Taskwarrior already having the right
+    type (e.g. `description`, `status`, or `tags`) are stored as-is and
+    never validated; the remaining fields (dates, UUIDs, and annotations)
+    are validated the first time they are accessed and the result stored on
+    the task.  Those not yet accessed are validated before the task is
+    serialized, copied, or compared.
+
+    """
+
+    __slots__ = ("_unvalidated",)
+
+    _unvalidated: Dict[str, Any]
+
+    @classmethod
+    def from_export(cls: Type[LazyTaskT], data: Dict[str, Any]) -> LazyTaskT:
+        """Builds a task from a single object of `task export` output."""
+        values: Dict[str, Any] = {}
+        unvalidated: Dict[str, Any] = {}
+        for name, value in data.items():
+            if name in LAZY_FIELDS:
+                unvalidated[name] = value
+            else:
+                values[name] = value
+
+        for name, field in cls.__fields__.items():
+            if name not in data:
+                values[name] = field.get_default()
+
+        task = cls.__new__(cls)
+        object.__setattr__(task, "__dict__", values)
+        object.__setattr__(task, "__fields_set__", set(data))
+        object.__setattr__(task, "_unvalidated", unvalidated)
+
+        return task
+
+    def _get_unvalidated(self) -> Dict[str, Any]:
+        # Copies made by pydantic are created without calling `from_export`
+        try:
+            return object.__getattribute__(self, "_unvalidated")
+        except AttributeError:
+            object.__setattr__(self, "_unvalidated", {})
+            return self._unvalidated
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__") or name not in self._get_unvalidated():
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+
+        return self._validate_field(name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        self._get_unvalidated().pop(name, None)
+
+        super().__setattr__(name, value)
+
+    def _validate_field(self, name: str) -> Any:
+        raw = self._unvalidated[name]
+
+        value, errors = self.__fields__[name].validate(
+            raw, self.__dict__, loc=name, cls=type(self)
+        )
+        if errors:
+            raise ValidationError([errors], type(self))
+
+        self.__dict__[name] = value
+        del self._unvalidated[name]
+
+        return value
+
+    def validate_all(self) -> None:
+        """Validates every field not yet having been validated."""
+        unvalidated = self._get_unvalidated()
+        if not unvalidated:
+            return
+
+        for name in list(unvalidated):
+            self._validate_field(name)
+
+        # Restore the field order a fully-validated `Task` would have
+        values = {name: self.__dict__[name] for name in self.__fields__}
+        values.update(self.__dict__)
+        object.__setattr__(self, "__dict__", values)
+
+    def _iter(self, *args, **kwargs):
+        self.validate_all()
+
+        return super()._iter(*args, **kwargs)
+
+    def __repr_args__(self):
+        self.validate_all()
+
+        return super().__repr_args__()
+
+    def __getstate__(self):
+        self.validate_all()
+
+        return super().__getstate__()
+
+    def __setstate__(self, state):
+        object.__setattr__(self, "_unvalidated", {})
+
+        super().__setstate__(state)
+
+
+class ProjectedTask(LazyTask):
+    """A `Task` holding only a subset of its fields.
+
+    Fields that were not requested are `None` (or missing, for UDAs).
+    Because writing a projected task back to Taskwarrior would erase the
+    fields it lacks, projected tasks cannot be imported.
+
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_export_fields(
+        cls,
+        data: Dict[str, Any],
+        fields: Collection[str],
+        validate: Validation = "eager",
+    ) -> "ProjectedTask":
+        task = cls.from_export({name: data[name] for name in fields if name in data})
+        if validate == "eager":
+            task.validate_all()
+
+        return task
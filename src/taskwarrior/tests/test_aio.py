@@ -0,0 +1,164 @@
+import asyncio
+import os
+import tempfile
+import time
+from unittest import TestCase
+
+import pytest
+
+from ..aio import AsyncClient
+from ..exceptions import ClientError
+from ..exceptions import CommandError
+from ..exceptions import CommandTimeout
+from ..exceptions import MultipleObjectsFound
+from ..exceptions import NotFound
+from ..task import Task
+from .test_client import TestClient
+from .test_executors import make_task_bin
+from .test_instrumentation import RecordingObserver
+
+
+class TestAsyncClient(TestClient):
+    def setUp(self):
+        super().setUp()
+
+        self.async_client = AsyncClient(config_filename=self.taskrc_path)
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.loop.close()
+
+        super().tearDown()
+
+    def run_async(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def test_filter(self):
+        results = self.run_async(self.async_client.filter("+alarm"))
+
+        assert len(results) == 1
+        assert results[0].uuid == self.TASK_UUID_WAKE_UP
+
+    def test_count(self):
+        assert self.run_async(self.async_client.count()) == 2
+
+    def test_get(self):
+        assert (
+            self.run_async(self.async_client.get(uuid=self.TASK_UUID_SLEEP)).uuid
+            == self.TASK_UUID_SLEEP
+        )
+
+    def test_get_not_found(self):
+        with pytest.raises(NotFound):
+            self.run_async(self.async_client.get(description="This doesn't exist"))
+
+    def test_get_multiple(self):
+        with pytest.raises(MultipleObjectsFound):
+            self.run_async(self.async_client.get())
+
+    def test_add_modify_delete(self):
+        new = Task(description="New Task")
+        self.run_async(self.async_client.add(new))
+
+        new.project = "Home"
+        self.run_async(self.async_client.modify(new))
+        assert self.client.get(uuid=new.uuid).project == "Home"
+
+        self.run_async(self.async_client.delete(new))
+        assert self.client.get(uuid=new.uuid).status == "deleted"
+
+    def test_concurrent_reads(self):
+        async def read_many():
+            return await asyncio.gather(*[self.async_client.count() for _ in range(20)])
+
+        assert self.run_async(read_many()) == [2] * 20
+
+
+class TestAsyncClientProcess(TestCase):
+    def setUp(self):
+        self.bin_dir = tempfile.mkdtemp()
+        self.loop = asyncio.new_event_loop()
+
+        super().setUp()
+
+    def tearDown(self):
+        self.loop.close()
+        for filename in os.listdir(self.bin_dir):
+            os.unlink(os.path.join(self.bin_dir, filename))
+        os.rmdir(self.bin_dir)
+
+        super().tearDown()
+
+    def make_task_bin(self, script: str) -> str:
+        return make_task_bin(self.bin_dir, script)
+
+    def run_async(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def test_timeout_kills_process(self):
+        client = AsyncClient(task_bin=self.make_task_bin("exec sleep 30"), timeout=0.2)
+
+        started = time.monotonic()
+        with pytest.raises(CommandTimeout):
+            self.run_async(client.count())
+
+        assert time.monotonic() - started < 5
+
+    def test_command_error(self):
+        client = AsyncClient(task_bin=self.make_task_bin("echo oops >&2; exit 2"))
+
+        with pytest.raises(CommandError) as excinfo:
+            self.run_async(client.count())
+
+        assert excinfo.value.return_code == 2
+        assert excinfo.value.stderr.strip() == "oops"
+
+    def test_concurrency_limit(self):
+        client = AsyncClient(
+            task_bin=self.make_task_bin("sleep 0.2; echo 1"), concurrency=2
+        )
+
+        async def count_many():
+            return await asyncio.gather(*[client.count() for _ in range(4)])
+
+        started = time.monotonic()
+        assert self.run_async(count_many()) == [1] * 4
+        assert time.monotonic() - started >= 0.4
+
+    def test_observers(self):
+        observer = RecordingObserver()
+        client = AsyncClient(
+            task_bin=self.make_task_bin("echo '[]'"), observers=[observer]
+        )
+
+        assert self.run_async(client.filter("+alarm")) == []
+
+        names = [name for name, _ in observer.events]
+        assert names == [
+            "command_started",
+            "command_finished",
+            "parse_started",
+            "parse_finished",
+        ]
+        assert observer.events[1][1].verb == "export"
+        assert observer.events[1][1].filter == "(+alarm)"
+
+    def test_observers_timeout(self):
+        observer = RecordingObserver()
+        client = AsyncClient(
+            task_bin=self.make_task_bin("exec sleep 30"),
+            timeout=0.2,
+            observers=[observer],
+        )
+
+        with pytest.raises(CommandTimeout):
+            self.run_async(client.count())
+
+        names = [name for name, _ in observer.events]
+        assert names == ["command_started", "command_failed"]
+
+    def test_missing_binary(self):
+        client = AsyncClient(task_bin=os.path.join(self.bin_dir, "missing"))
+
+        with pytest.raises(ClientError):
+            self.run_async(client.count())
@@ -0,0 +1,99 @@
+from unittest import TestCase
+
+from ..cache import ResultCache
+from ..client import Client
+from ..task import Task
+from .test_client import TestClient
+
+
+class TestResultCache(TestCase):
+    def test_hit(self):
+        cache = ResultCache()
+        cache.set("key", 1, "value")
+
+        assert cache.get("key", 1) == "value"
+        assert cache.hits == 1
+        assert cache.misses == 0
+
+    def test_miss(self):
+        cache = ResultCache()
+
+        assert cache.get("key", 1) is None
+        assert cache.misses == 1
+
+    def test_fingerprint_changed(self):
+        cache = ResultCache()
+        cache.set("key", 1, "value")
+
+        assert cache.get("key", 2) is None
+        assert cache.invalidations == 1
+        assert len(cache) == 0
+
+    def test_ttl(self):
+        cache = ResultCache(ttl=-1)
+        cache.set("key", 1, "value")
+
+        assert cache.get("key", 1) is None
+
+    def test_lru_eviction(self):
+        first = "a" * 1000
+        cache = ResultCache(max_bytes=2 * 1100)
+        cache.set("first", 1, first)
+        cache.set("second", 1, "b" * 1000)
+        cache.get("first", 1)
+        cache.set("third", 1, "c" * 1000)
+
+        assert cache.get("first", 1) == first
+        assert cache.get("second", 1) is None
+        assert cache.evictions == 1
+        assert cache.size <= cache.max_bytes
+
+    def test_too_large(self):
+        cache = ResultCache(max_bytes=10)
+        cache.set("key", 1, "a" * 100)
+
+        assert len(cache) == 0
+
+    def test_clear(self):
+        cache = ResultCache()
+        cache.set("key", 1, "value")
+        cache.clear()
+
+        assert cache.get("key", 1) is None
+        assert cache.size == 0
+
+
+class TestClientCache(TestClient):
+    def setUp(self):
+        super().setUp()
+
+        self.client = Client(config_filename=self.taskrc_path, cache=ResultCache())
+
+    def test_repeated_filter(self):
+        first = self.client.filter("+alarm")
+        second = self.client.filter("+alarm")
+
+        assert first == second
+        assert self.client.cache.hits == 1
+        assert self.client.cache.misses == 1
+
+    def test_different_filters(self):
+        self.client.filter("+alarm")
+        self.client.filter("-alarm")
+
+        assert self.client.cache.hits == 0
+        assert self.client.cache.misses == 2
+
+    def test_invalidated_by_write(self):
+        assert self.client.count() == 2
+
+        self.client.add(Task(description="New Task"))
+
+        assert self.client.count() == 3
+
+    def test_invalidated_by_other_writer(self):
+        assert self.client.count() == 2
+
+        Client(config_filename=self.taskrc_path).add(Task(description="New Task"))
+
+        assert self.client.count() == 3
@@ -1,4 +1,5 @@
 import datetime
+import json
 import os
 import shutil
 import tempfile
@@ -10,9 +11,11 @@ import pytz
 
 from ..client import Client
 from ..client import Q
+from ..client import get_projecting_hook
 from ..exceptions import ClientUsageError
 from ..exceptions import MultipleObjectsFound
 from ..exceptions import NotFound
+from ..task import LazyTask
 from ..task import Task
 
 
@@ -98,6 +101,74 @@ class TestFilter(TestClient):
             ]
         )
 
+    def test_lazy(self):
+        results = self.client.filter("+alarm", validate="lazy")
+
+        assert len(results) == 1
+        assert isinstance(results[0], LazyTask)
+        assert results[0] == self.client.get(uuid=self.TASK_UUID_WAKE_UP)
+
+    def test_lazy_round_trip(self):
+        wake_up = self.client.filter(uuid=self.TASK_UUID_WAKE_UP, validate="lazy")[0]
+        wake_up.project = "Morning"
+
+        self.client.modify(wake_up)
+
+        retrieved = self.client.get(uuid=self.TASK_UUID_WAKE_UP)
+        assert retrieved.project == "Morning"
+        assert retrieved.entry == wake_up.entry
+
+    def test_fields(self):
+        results = self.client.filter("+alarm", fields=["uuid", "tags"])
+
+        assert len(results) == 1
+        assert results[0].uuid == self.TASK_UUID_WAKE_UP
+        assert results[0].tags == ["alarm"]
+        assert results[0].description is None
+
+    def test_fields_cannot_be_imported(self):
+        wake_up = self.client.filter(uuid=self.TASK_UUID_WAKE_UP, fields=["uuid"])[0]
+
+        with pytest.raises(ClientUsageError):
+            self.client.modify(wake_up)
+
+
+class TestProjectingHook(TestCase):
+    def test_keeps_fields_and_nested_objects(self):
+        exported = json.dumps(
+            [
+                {
+                    "uuid": "a39ea0fa-682a-4815-9556-8b6785ee301c",
+                    "description": "Wake up",
+                    "tags": ["alarm"],
+                    "annotations": [
+                        {"entry": "20220124T060000Z", "description": "Late"}
+                    ],
+                }
+            ]
+        )
+
+        decoded = json.loads(
+            exported, object_pairs_hook=get_projecting_hook(["uuid", "annotations"])
+        )
+
+        assert decoded == [
+            {
+                "uuid": "a39ea0fa-682a-4815-9556-8b6785ee301c",
+                "annotations": [{"entry": "20220124T060000Z", "description": "Late"}],
+            }
+        ]
+
+
+class TestReadOptions(TestCase):
+    def test_shadowed_udas(self):
+        client = Client(task_bin="/nonexistent/task")
+
+        with pytest.raises(ClientUsageError):
+            client.filter(validate="yes")
+        with pytest.raises(ClientUsageError):
+            list(client.iter_filter(fields="all"))
+
 
 class TestGet(TestClient):
     def test_get_single(self):
@@ -241,3 +312,157 @@ class TestModify(TestClient):
 
         retrieved = self.client.get(uuid=self.TASK_UUID_WAKE_UP)
         assert retrieved.orphaned == task_with_orphaned_uda.orphaned
+
+
+class TestImportMany(TestClient):
+    def test_import_many(self):
+        wake_up = self.client.get(uuid=self.TASK_UUID_WAKE_UP)
+        wake_up.project = "Morning"
+        new = Task(description="New Task")
+
+        results = self.client.import_many([wake_up, new])
+
+        assert [result.task for result in results] == [wake_up, new]
+        assert all(result.error is None for result in results)
+        assert new.uuid
+        assert self.client.count() == 3
+        assert self.client.get(uuid=self.TASK_UUID_WAKE_UP).project == "Morning"
+
+    def test_import_many_chunked(self):
+        tasks = [Task(description=f"Task {i}") for i in range(5)]
+
+        results = self.client.import_many(tasks, chunk_size=2)
+
+        assert len(results) == 5
+        assert self.client.count() == 7
+
+    def test_add_many(self):
+        tasks = [Task(description=f"Task {i}") for i in range(3)]
+
+        self.client.add_many(tasks)
+
+        assert self.client.count() == 5
+
+    def test_add_many_existing(self):
+        existing = self.client.get(uuid=self.TASK_UUID_SLEEP)
+
+        with pytest.raises(ClientUsageError):
+            self.client.add_many([Task(description="New Task"), existing])
+
+    def test_modify_many_new(self):
+        with pytest.raises(ClientUsageError):
+            self.client.modify_many([Task(description="New Task")])
+
+
+class TestIterFilter(TestClient):
+    def test_sanity(self):
+        results = list(self.client.iter_filter())
+
+        assert len(results) == 2
+        assert all(isinstance(result, Task) for result in results)
+
+    def test_matches_filter(self):
+        assert [task.uuid for task in self.client.iter_filter("+alarm")] == [
+            task.uuid for task in self.client.filter("+alarm")
+        ]
+
+    def test_stop_early(self):
+        results = self.client.iter_filter()
+
+        assert next(results).uuid
+
+        results.close()
+
+
+class TestGetMany(TestClient):
+    def test_get_many(self):
+        missing = uuid.uuid4()
+
+        results = self.client.get_many(
+            [self.TASK_UUID_WAKE_UP, str(self.TASK_UUID_SLEEP), missing]
+        )
+
+        assert list(results) == [self.TASK_UUID_WAKE_UP, self.TASK_UUID_SLEEP, missing]
+        assert results[self.TASK_UUID_WAKE_UP].description == "Wake up"
+        assert results[self.TASK_UUID_SLEEP].description == "Go to sleep"
+        assert results[missing] is None
+
+    def test_get_many_chunked(self):
+        results = self.client.get_many(
+            [self.TASK_UUID_WAKE_UP, self.TASK_UUID_SLEEP], chunk_size=1
+        )
+
+        assert all(results.values())
+
+    def test_get_many_empty(self):
+        assert self.client.get_many([]) == {}
+
+    def test_get_many_native(self):
+        client = Client(config_filename=self.taskrc_path, read_backend="native")
+
+        results = client.get_many([self.TASK_UUID_SLEEP], fields=["description"])
+
+        assert results[self.TASK_UUID_SLEEP].description == "Go to sleep"
+
+    def test_resolve_depends(self):
+        first = Task(description="First")
+        self.client.add(first)
+        second = Task(description="Second", depends=[first.uuid])
+        self.client.add(second)
+
+        sleep = self.client.get(uuid=self.TASK_UUID_SLEEP)
+        sleep.depends = [second.uuid, self.TASK_UUID_WAKE_UP]
+        self.client.modify(sleep)
+
+        resolved = self.client.resolve_depends([sleep])
+
+        assert set(resolved) == {second.uuid, first.uuid, self.TASK_UUID_WAKE_UP}
+        assert resolved[first.uuid].description == "First"
+
+        direct = self.client.resolve_depends([sleep], depth=1)
+
+        assert set(direct) == {second.uuid, self.TASK_UUID_WAKE_UP}
+
+
+class TestMassOperations(TestClient):
+    def test_delete_many(self):
+        wake_up = self.client.get(uuid=self.TASK_UUID_WAKE_UP)
+
+        deleted = self.client.delete_many(
+            [wake_up, str(self.TASK_UUID_SLEEP), uuid.uuid4()], chunk_size=1
+        )
+
+        assert deleted == 2
+        assert self.client.count(status="deleted") == 2
+        assert self.client.delete_many([wake_up]) == 0
+
+    def test_delete_where(self):
+        assert self.client.delete_where(Q("+alarm")) == 1
+        assert self.client.get(uuid=self.TASK_UUID_WAKE_UP).status == "deleted"
+        assert self.client.get(uuid=self.TASK_UUID_SLEEP).status == "pending"
+
+    def test_modify_where(self):
+        assert self.client.modify_where(Q(status="pending"), project="Home") == 2
+        assert self.client.count(project="Home") == 2
+
+        assert self.client.modify_where(Q("+alarm"), project=None, tags=["a", "b"])
+        wake_up = self.client.get(uuid=self.TASK_UUID_WAKE_UP)
+        assert wake_up.project is None
+        assert wake_up.tags == ["a", "b"]
+
+    def test_modify_where_quoted(self):
+        self.client.modify_where(Q("+alarm"), description='two "quoted" words')
+
+        wake_up = self.client.get(uuid=self.TASK_UUID_WAKE_UP)
+        assert wake_up.description == 'two "quoted" words'
+
+    def test_empty_filter(self):
+        with pytest.raises(ClientUsageError):
+            self.client.delete_where(Q())
+
+        with pytest.raises(ClientUsageError):
+            self.client.modify_where(Q(), project="Home")
+
+    def test_no_changes(self):
+        with pytest.raises(ClientUsageError):
+            self.client.modify_where(Q("+alarm"))
@@ -0,0 +1,138 @@
+from unittest import TestCase
+
+import pytest
+
+from ..exceptions import ClientUsageError
+from .test_client import TestClient
+
+np = pytest.importorskip("numpy")
+
+from ..columns import DictionaryColumn  # noqa: E402
+from ..columns import ListColumn  # noqa: E402
+from ..columns import build_columns  # noqa: E402
+
+EXPORTED = [
+    {
+        "id": 1,
+        "description": "Wake up",
+        "due": "20300101T060000Z",
+        "project": "Home",
+        "status": "pending",
+        "tags": ["alarm", "early"],
+        "urgency": 8.9,
+        "estimate": 30,
+        "size": "small",
+        "annotations": [{"entry": "20220101T000000Z", "description": "Snooze"}],
+    },
+    {
+        "id": 0,
+        "description": "Go to sleep",
+        "project": "Home",
+        "status": "completed",
+        "tags": ["bedtime"],
+        "urgency": 0.0,
+    },
+    {"id": 2, "description": "Read", "status": "pending"},
+]
+
+UDAS = {"estimate": "numeric", "size": "string"}
+
+
+class TestBuildColumns(TestCase):
+    def build(self, fields, chunk_size=2):
+        return build_columns(EXPORTED, fields, udas=UDAS, chunk_size=chunk_size)
+
+    def test_types(self):
+        columns = self.build(["id", "due", "urgency", "estimate", "description"])
+
+        assert columns.rows == 3
+        assert columns["id"].tolist() == [1, 0, 2]
+        assert columns["due"].dtype == np.dtype("datetime64[s]")
+        assert columns["due"][0] == np.datetime64("2030-01-01T06:00:00")
+        assert np.isnat(columns["due"][1:]).all()
+        assert columns["urgency"].dtype == np.float64
+        assert np.isnan(columns["urgency"][2])
+        assert np.isnan(columns["estimate"][1:]).all()
+        assert columns["description"].tolist() == ["Wake up", "Go to sleep", "Read"]
+
+    def test_dictionary(self):
+        columns = self.build(["project", "status", "size"])
+
+        assert isinstance(columns["project"], DictionaryColumn)
+        assert columns["project"].categories == ["Home"]
+        assert columns["project"].codes.tolist() == [0, 0, -1]
+        assert columns["status"].to_numpy().tolist() == [
+            "pending",
+            "completed",
+            "pending",
+        ]
+        assert columns["size"][0] == "small"
+        assert columns["size"][1] is None
+
+    def test_lists(self):
+        columns = self.build(["tags", "annotations"])
+        tags = columns["tags"]
+
+        assert isinstance(tags, ListColumn)
+        assert tags.offsets.tolist() == [0, 2, 3, 3]
+        assert [tags[row] for row in range(3)] == [["alarm", "early"], ["bedtime"], []]
+        rows, values = tags.explode()
+        assert rows.tolist() == [0, 0, 1]
+        assert values.to_numpy().tolist() == ["alarm", "early", "bedtime"]
+        assert columns["annotations"][0] == ["Snooze"]
+
+    def test_chunk_size(self):
+        fields = ["due", "project", "tags"]
+        whole = self.build(fields, chunk_size=100)
+        chunked = self.build(fields, chunk_size=1)
+
+        assert (whole["due"].astype("int64") == chunked["due"].astype("int64")).all()
+        assert whole["project"].codes.tolist() == chunked["project"].codes.tolist()
+        assert whole["tags"].offsets.tolist() == chunked["tags"].offsets.tolist()
+
+    def test_empty(self):
+        columns = build_columns([], ["due", "project", "tags"])
+
+        assert columns.rows == 0
+        assert len(columns["due"]) == 0
+        assert len(columns["tags"]) == 0
+
+    def test_no_fields(self):
+        with pytest.raises(ClientUsageError):
+            build_columns(EXPORTED, [])
+
+    def test_to_pandas(self):
+        pytest.importorskip("pandas")
+
+        frame = self.build(["due", "project", "tags", "urgency"]).to_pandas()
+
+        assert len(frame) == 3
+        assert str(frame["project"].dtype) == "category"
+        assert frame["tags"][0] == ["alarm", "early"]
+        assert frame["project"].isna().tolist() == [False, False, True]
+
+    def test_to_arrow(self):
+        pa = pytest.importorskip("pyarrow")
+
+        table = self.build(["due", "project", "tags", "description"]).to_arrow()
+
+        assert table.num_rows == 3
+        assert pa.types.is_dictionary(table.schema.field("project").type)
+        assert pa.types.is_list(table.schema.field("tags").type)
+        assert table.column("project").null_count == 1
+        assert table.column("tags").to_pylist()[1] == ["bedtime"]
+
+
+class TestToColumns(TestClient):
+    def test_sanity(self):
+        columns = self.client.to_columns(fields=["uuid", "tags", "entry"])
+
+        assert columns.rows == 2
+        assert sorted(columns["uuid"].tolist()) == sorted(
+            str(task.uuid) for task in self.client.filter()
+        )
+
+    def test_filter(self):
+        columns = self.client.to_columns("+alarm", fields=["description"])
+
+        assert columns["description"].tolist() == ["Wake up"]
@@ -0,0 +1,161 @@
+import datetime
+import uuid
+from unittest import TestCase
+
+import pytest
+import pytz
+
+from ..compact import CompactTaskList
+from ..exceptions import NotFound
+from ..task import LazyTask
+from ..task import Task
+from .test_client import TestClient
+
+EXPORT = [
+    {
+        "id": 1,
+        "description": "Wake up",
+        "entry": "20220124T042811Z",
+        "modified": "20220124T042851Z",
+        "project": "Home",
+        "status": "pending",
+        "tags": ["alarm", "morning"],
+        "urgency": 1.8,
+        "uuid": "a39ea0fa-682a-4815-9556-8b6785ee301c",
+    },
+    {
+        "id": 0,
+        "description": "Write report ☕",
+        "end": "20220125T090000Z",
+        "entry": "20220124T050000Z",
+        "project": "Work",
+        "status": "completed",
+        "tags": ["morning"],
+        "urgency": 0,
+        "uuid": "0189becf-a28b-497e-bd67-d04fa1ee3fa8",
+        "annotations": [{"entry": "20220124T060000Z", "description": "Draft"}],
+        "depends": ["a39ea0fa-682a-4815-9556-8b6785ee301c"],
+        "estimate": 3,
+        "reviewed": "20220126T000000Z",
+    },
+    {
+        "id": 2,
+        "description": "Call Bob",
+        "entry": "20220124T060000Z",
+        "project": "Work",
+        "status": "pending",
+        "urgency": 4.5,
+        "uuid": "6e1f4d1c-2b7b-4c9a-8a47-3a2f0c5d9e10",
+        "size": "large",
+    },
+]
+
+
+class TestCompactTaskList(TestCase):
+    def setUp(self):
+        self.tasks = CompactTaskList.from_export(
+            EXPORT, udas={"reviewed": "date", "size": "string", "estimate": "numeric"}
+        )
+
+    def test_round_trip(self):
+        # Like Taskwarrior, tasks without an ID have none exported
+        expected = [
+            {name: value for name, value in data.items() if (name, value) != ("id", 0)}
+            for data in EXPORT
+        ]
+
+        assert list(self.tasks.iter_export()) == expected
+
+    def test_tasks(self):
+        task = self.tasks[0]
+
+        assert isinstance(task, Task)
+        assert task.uuid == uuid.UUID(EXPORT[0]["uuid"])
+        assert task.entry == datetime.datetime(2022, 1, 24, 4, 28, 11, tzinfo=pytz.utc)
+        assert task.tags == ["alarm", "morning"]
+        assert self.tasks[-1].description == "Call Bob"
+        assert [task.description for task in self.tasks[1:]] == [
+            "Write report ☕",
+            "Call Bob",
+        ]
+        with pytest.raises(IndexError):
+            self.tasks[3]
+
+    def test_lazy(self):
+        tasks = CompactTaskList.from_export(EXPORT, validate="lazy")
+
+        assert isinstance(tasks[1], LazyTask)
+        assert tasks[1].depends == [uuid.UUID(EXPORT[0]["uuid"])]
+
+    def test_interned(self):
+        assert len(self.tasks) == 3
+        # Projects, statuses, tags, and the "size" UDA
+        assert self.tasks._strings == [
+            "alarm",
+            "morning",
+            "Home",
+            "pending",
+            "Work",
+            "completed",
+            "large",
+        ]
+
+    def test_raw_strings(self):
+        parent = "a39ea0fa-682a-4815-9556-8b6785ee301c"
+        tasks = CompactTaskList.from_export(
+            [{"status": "pending", "parent": parent, "mask": "--", "note": "Hi"}]
+        )
+
+        # Only statuses, projects, tags, and string UDAs are coded
+        assert tasks._strings == ["pending"]
+        assert tasks.values("parent") == [parent]
+        assert tasks.values("note") == ["Hi"]
+
+    def test_get(self):
+        assert self.tasks.get(EXPORT[2]["uuid"]).description == "Call Bob"
+        assert self.tasks.index_of(uuid.UUID(EXPORT[1]["uuid"])) == 1
+        with pytest.raises(NotFound):
+            self.tasks.get(uuid.uuid4())
+
+    def test_get_unaligned(self):
+        first = uuid.UUID(bytes=bytes(range(16)))
+        second = uuid.UUID(bytes=bytes(range(16, 32)))
+        # Spans the end of the first UUID and the start of the second
+        spanning = uuid.UUID(bytes=bytes(range(8, 24)))
+        tasks = CompactTaskList.from_export(
+            [{"uuid": str(first)}, {"uuid": str(second)}, {"uuid": str(spanning)}]
+        )
+
+        assert tasks.index_of(spanning) == 2
+        assert list(tasks.uuids()) == [first, second, spanning]
+
+    def test_values(self):
+        assert self.tasks.values("project") == ["Home", "Work", "Work"]
+        assert self.tasks.values("end") == [None, 1643101200, None]
+        assert self.tasks.values("estimate") == [None, 3, None]
+        assert self.tasks.values("size") == [None, None, "large"]
+
+    def test_from_tasks(self):
+        task = Task(description="New", project="Home", tags=["a"])
+        task.due = datetime.datetime(2030, 1, 1, tzinfo=pytz.utc)
+
+        tasks = CompactTaskList.from_tasks([task])
+
+        assert tasks.values("due") == [1893456000]
+        assert list(tasks.uuids()) == [None]
+        assert tasks[0].dict() == task.dict()
+
+
+class TestToCompact(TestClient):
+    def test_sanity(self):
+        tasks = self.client.to_compact()
+
+        assert len(tasks) == 2
+        assert sorted(str(task_uuid) for task_uuid in tasks.uuids()) == sorted(
+            str(task.uuid) for task in self.client.filter()
+        )
+
+    def test_filter(self):
+        tasks = self.client.to_compact("+alarm", validate="lazy")
+
+        assert [task.description for task in tasks] == ["Wake up"]
@@ -0,0 +1,198 @@
+import datetime
+import os
+import uuid
+from unittest import TestCase
+
+import pytest
+import pytz
+
+from ..client import Client
+from ..client import Q
+from ..datafile import DataFileReader
+from ..datafile import attributes_to_export
+from ..datafile import format_line
+from ..datafile import parse_line
+from ..exceptions import UnsupportedFilter
+from ..task import Task
+from .test_client import TestClient
+
+
+class TestParseLine(TestCase):
+    def test_simple(self):
+        assert parse_line(
+            '[description:"Wake up" status:"pending" tags:"alarm,early"]\n'
+        ) == {"description": "Wake up", "status": "pending", "tags": "alarm,early"}
+
+    def test_escapes(self):
+        assert parse_line(
+            r'[description:"Say \"&open;hi&close;\"\nplease" uuid:"abc"]'
+        ) == {"description": 'Say "[hi]"\nplease', "uuid": "abc"}
+
+    def test_round_trip(self):
+        attributes = {
+            "description": 'Say "[hi]"\nplease \\ thanks',
+            "tags": "a,b",
+            "uuid": "abc",
+        }
+
+        line = format_line(attributes)
+
+        assert line.startswith('[description:"Say \\"&open;hi&close;\\"\\n')
+        assert parse_line(line) == attributes
+
+    def test_legacy_quotes(self):
+        assert parse_line('[description:"Say &dquot;hi&dquot;"]') == {
+            "description": 'Say "hi"'
+        }
+
+
+class TestAttributesToExport(TestCase):
+    def test_conversions(self):
+        exported = attributes_to_export(
+            {
+                "annotation_1643040530": "Second",
+                "annotation_1642998491": "First",
+                "depends": "a39ea0fa-682a-4815-9556-8b6785ee301c",
+                "dep_a39ea0fa-682a-4815-9556-8b6785ee301c": "x",
+                "due": "1893484800",
+                "estimate": "2.5",
+                "expires": "1893484800",
+                "tags": "alarm",
+                "tags_alarm": "x",
+            },
+            uda_types={"estimate": "numeric", "expires": "date"},
+            id=3,
+        )
+
+        assert exported == {
+            "id": 3,
+            "annotations": [
+                {"entry": "20220124T042811Z", "description": "First"},
+                {"entry": "20220124T160850Z", "description": "Second"},
+            ],
+            "depends": ["a39ea0fa-682a-4815-9556-8b6785ee301c"],
+            "due": "20300101T080000Z",
+            "estimate": 2.5,
+            "expires": "20300101T080000Z",
+            "tags": ["alarm"],
+        }
+
+    def test_expired_wait(self):
+        exported = attributes_to_export(
+            {"status": "waiting", "wait": "1642998491"},
+        )
+
+        assert exported["status"] == "pending"
+
+
+class TestDataFileReader(TestCase):
+    def test_fixture(self):
+        reader = DataFileReader(
+            os.path.join(os.path.dirname(__file__), "fixtures"),
+            uda_types={"estimate": "numeric", "expires": "date"},
+        )
+
+        tasks = list(reader.iter_tasks())
+
+        assert [task.id for task in tasks] == [1, 2]
+        assert tasks[0].uuid == uuid.UUID("a39ea0fa-682a-4815-9556-8b6785ee301c")
+        assert tasks[0].tags == ["alarm"]
+        assert tasks[1].estimate == 224
+
+
+class TestNativeBackend(TestClient):
+    def setUp(self):
+        super().setUp()
+
+        self.native_client = Client(
+            config_filename=self.taskrc_path, read_backend="native"
+        )
+
+        project_task = Task(
+            description="Water the garden",
+            project="Home.Garden",
+            tags=["outside"],
+        )
+        project_task.due = datetime.datetime(2030, 1, 1, tzinfo=pytz.utc)
+        project_task.add_annotation("Use the hose")
+        self.client.add(project_task)
+
+        completed_task = Task(
+            description="Buy groceries",
+            project="Errands",
+            depends=[self.TASK_UUID_SLEEP],
+        )
+        self.client.add(completed_task)
+        completed_task.status = "completed"
+        self.client.modify(completed_task)
+
+    def assert_same_results(self, *params, **dictparams):
+        expected = self.client.filter(*params, **dictparams)
+        actual = self.native_client._filter_native(Q(*params, **dictparams))
+
+        assert len(actual) == len(expected)
+        for left, right in zip(
+            sorted(actual, key=lambda t: str(t.uuid)),
+            sorted(expected, key=lambda t: str(t.uuid)),
+        ):
+            assert left.dict(exclude={"urgency"}) == right.dict(exclude={"urgency"})
+
+    def test_all(self):
+        self.assert_same_results()
+
+    def test_tags(self):
+        self.assert_same_results("+alarm")
+        self.assert_same_results("-alarm")
+
+    def test_status(self):
+        self.assert_same_results(status="pending")
+        self.assert_same_results(status="completed")
+
+    def test_project(self):
+        self.assert_same_results(project="Home")
+        self.assert_same_results(project="Errands")
+
+    def test_uuid(self):
+        self.assert_same_results(uuid=self.TASK_UUID_SLEEP)
+
+    def test_uda(self):
+        self.assert_same_results(estimate=224)
+        self.assert_same_results(size="medium")
+
+    def test_or(self):
+        self.assert_same_results(Q(project="Home") | Q("+alarm"))
+
+    def test_count(self):
+        assert self.native_client.count() == self.client.count()
+        assert self.native_client.count(status="pending") == self.client.count(
+            status="pending"
+        )
+
+    def test_modifiers(self):
+        self.assert_same_results(description__contains="sleep")
+        self.assert_same_results(description__startswith="Wake")
+        self.assert_same_results(project__isnt="Home")
+        self.assert_same_results(project__none="")
+        self.assert_same_results(tags__has="outside")
+
+    def test_dates(self):
+        self.assert_same_results(due__before=datetime.date(2031, 1, 1))
+        self.assert_same_results(due__after="2029-12-31")
+        self.assert_same_results(due__any="")
+
+    def test_virtual_tags(self):
+        self.assert_same_results("+ANNOTATED")
+        self.assert_same_results("-PROJECT")
+
+    def test_fallback(self):
+        assert len(self.native_client.filter(due__before="eoy")) == len(
+            self.client.filter(due__before="eoy")
+        )
+
+    def test_urgency(self):
+        with pytest.raises(UnsupportedFilter):
+            self.native_client._filter_native(Q(urgency__over=0))
+
+        assert len(self.native_client.filter(urgency__over=0)) == len(
+            self.client.filter(urgency__over=0)
+        )
@@ -0,0 +1,138 @@
+import datetime
+import uuid
+from unittest import TestCase
+
+import pytest
+import pytz
+
+from ..client import Q
+from ..evaluate import compile_filter
+from ..evaluate import parse_date_value
+from ..exceptions import UnsupportedFilter
+from ..task import Task
+
+
+class TestCompileFilter(TestCase):
+    UUID_WAKE_UP = uuid.UUID("a39ea0fa-682a-4815-9556-8b6785ee301c")
+    UUID_SLEEP = uuid.UUID("0189becf-a28b-497e-bd67-d04fa1ee3fa8")
+
+    def setUp(self):
+        self.wake_up = Task(
+            id=1,
+            uuid=self.UUID_WAKE_UP,
+            description="Wake up",
+            project="Home.Morning",
+            tags=["alarm"],
+            status="pending",
+        )
+        self.wake_up.due = datetime.datetime(2030, 1, 1, 6, tzinfo=pytz.utc)
+        self.sleep = Task(
+            id=2,
+            uuid=self.UUID_SLEEP,
+            description="Go to sleep",
+            status="pending",
+            estimate=224,
+        )
+        self.done = Task(
+            id=0,
+            uuid=uuid.uuid4(),
+            description="Buy groceries",
+            project="Errands",
+            status="completed",
+        )
+        self.tasks = [self.wake_up, self.sleep, self.done]
+
+        super().setUp()
+
+    def assert_matches(self, q, expected):
+        assert q.filter_tasks(self.tasks, udas={"estimate": "numeric"}) == expected
+
+    def test_empty(self):
+        self.assert_matches(Q(), self.tasks)
+
+    def test_attribute(self):
+        self.assert_matches(Q(status="completed"), [self.done])
+        self.assert_matches(Q(project="Home"), [self.wake_up])
+        self.assert_matches(Q(description="Wake"), [self.wake_up])
+
+    def test_text_modifiers(self):
+        self.assert_matches(Q(description__contains="sleep"), [self.sleep])
+        self.assert_matches(Q(description__hasnt="sleep"), [self.wake_up, self.done])
+        self.assert_matches(Q(description__endswith="up"), [self.wake_up])
+        self.assert_matches(Q(project__is="Home"), [])
+        self.assert_matches(Q(project__isnt="Home"), self.tasks)
+        self.assert_matches(Q(project__not="Home"), [self.sleep, self.done])
+        self.assert_matches(Q(project__none=""), [self.sleep])
+        self.assert_matches(Q(project__any=""), [self.wake_up, self.done])
+
+    def test_tags(self):
+        self.assert_matches(Q("+alarm"), [self.wake_up])
+        self.assert_matches(Q("-alarm"), [self.sleep, self.done])
+        self.assert_matches(Q(tags__has="alarm"), [self.wake_up])
+
+    def test_virtual_tags(self):
+        self.assert_matches(Q("+COMPLETED"), [self.done])
+        self.assert_matches(Q("+PROJECT", "-TAGGED"), [self.done])
+
+        with pytest.raises(UnsupportedFilter):
+            compile_filter(Q("+OVERDUE"))
+
+    def test_identifiers(self):
+        self.assert_matches(Q("1-2"), [self.wake_up, self.sleep])
+        self.assert_matches(Q("0189becf"), [self.sleep])
+        self.assert_matches(Q(uuid=self.UUID_WAKE_UP), [self.wake_up])
+
+    def test_numeric(self):
+        self.assert_matches(Q(id__above=1), [self.sleep])
+        self.assert_matches(Q(estimate=224), [self.sleep])
+        self.assert_matches(Q(estimate__below="300"), [self.sleep])
+
+    def test_dates(self):
+        self.assert_matches(Q(due__before=datetime.date(2031, 1, 1)), [self.wake_up])
+        self.assert_matches(Q(due__after="2030-01-02"), [])
+        self.assert_matches(Q(due="2030-01-01T06:00:00Z"), [self.wake_up])
+        self.assert_matches(Q(due__none=""), [self.sleep, self.done])
+
+    def test_combinations(self):
+        self.assert_matches(
+            Q("+alarm") | Q(status="completed"), [self.wake_up, self.done]
+        )
+        self.assert_matches(Q(status="pending") & Q(project="Home"), [self.wake_up])
+
+    def test_matches(self):
+        assert Q("+alarm").matches(self.wake_up)
+        assert not Q("+alarm").matches(self.sleep)
+
+    def test_unknown_attribute(self):
+        with pytest.raises(UnsupportedFilter):
+            compile_filter(Q(estimate=224))
+
+    def test_unavailable_attribute(self):
+        compile_filter(Q(urgency__over=5))
+
+        with pytest.raises(UnsupportedFilter):
+            compile_filter(Q(urgency__over=5), unavailable=["urgency"])
+
+    def test_unsupported(self):
+        for q in [
+            Q(due__before="today"),
+            Q(description__contains="sle.p"),
+            Q(description__word="sleep"),
+            Q("1", "2"),
+        ]:
+            with pytest.raises(UnsupportedFilter):
+                compile_filter(q)
+
+
+class TestParseDateValue(TestCase):
+    def test_date(self):
+        start, end = parse_date_value("2030-01-01")
+
+        assert start.date() == datetime.date(2030, 1, 1)
+        assert end - start == datetime.timedelta(days=1)
+
+    def test_datetime(self):
+        start, end = parse_date_value("2030-01-01T06:00:00Z")
+
+        assert start == datetime.datetime(2030, 1, 1, 6, tzinfo=datetime.timezone.utc)
+        assert end is None
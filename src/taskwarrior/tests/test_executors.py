@@ -0,0 +1,172 @@
+import os
+import stat
+from typing import Dict
+from typing import List
+from unittest import TestCase
+
+import pytest
+
+from ..client import Client
+from ..exceptions import ClientError
+from ..exceptions import ClientUsageError
+from ..exceptions import CommandError
+from ..executors import ExecutionResult
+from ..executors import Executor
+from ..executors import PosixSpawnExecutor
+from ..executors import SubprocessExecutor
+
+
+class FakeExecutor(Executor):
+    def __init__(self, result: ExecutionResult):
+        self.result = result
+        self.calls: List[List[str]] = []
+        self.envs: List[Dict[str, str]] = []
+
+    def run(self, command, env, stdin=b""):
+        self.calls.append(command)
+        self.envs.append(env)
+        return self.result
+
+
+def make_task_bin(directory: str, script: str) -> str:
+    """Writes a `task` shell script running `script` and returns its path.
+
+    For tests that need real processes, e.g. to check how they are run;
+    others can pass a `FakeExecutor` to the client instead.
+
+    """
+    path = os.path.join(directory, "task")
+    with open(path, "w") as outf:
+        outf.write(f"#!/bin/sh\n{script}\n")
+    os.chmod(path, os.stat(path).st_mode | stat.S_IEXEC)
+    return path
+
+
+class ExecutorTests:
+    executor: Executor
+
+    def test_output(self):
+        result = self.executor.run(
+            ["sh", "-c", 'cat; echo "oops" >&2; exit 3'], dict(os.environ), b"hello"
+        )
+
+        assert result[:3] == (3, b"hello", b"oops\n")
+        assert result.cpu_time is not None and result.cpu_time >= 0
+
+    def test_large_input(self):
+        data = b"x" * (4 * 1024 * 1024)
+
+        result = self.executor.run(["cat"], dict(os.environ), data)
+
+        assert result.return_code == 0
+        assert result.stdout == data
+
+    def test_unread_input(self):
+        result = self.executor.run(["true"], dict(os.environ), b"x" * (4 * 1024 * 1024))
+
+        assert result.return_code == 0
+
+    def test_environment(self):
+        result = self.executor.run(
+            ["sh", "-c", "echo $EXECUTOR_TEST"],
+            {**os.environ, "EXECUTOR_TEST": "yes"},
+        )
+
+        assert result.stdout == b"yes\n"
+
+    def test_missing_binary(self):
+        with pytest.raises(FileNotFoundError):
+            self.executor.run(["/nonexistent/task"], dict(os.environ))
+
+    def test_open(self):
+        process = self.executor.open(
+            ["sh", "-c", 'echo "hello"; echo "oops" >&2; exit 3'], dict(os.environ)
+        )
+
+        assert process.stdout.read() == b"hello\n"
+        result = process.wait(False)
+        assert result[:3] == (3, b"", b"oops\n")
+        assert result.cpu_time is not None and result.cpu_time >= 0
+
+    def test_open_kill(self):
+        process = self.executor.open(
+            ["sh", "-c", "echo 1; exec sleep 60"], dict(os.environ)
+        )
+
+        assert process.stdout.readline() == b"1\n"
+        assert process.wait(True).return_code < 0
+
+    def test_open_missing_binary(self):
+        with pytest.raises(FileNotFoundError):
+            self.executor.open(["/nonexistent/task"], dict(os.environ))
+
+
+class TestSubprocessExecutor(ExecutorTests, TestCase):
+    executor = SubprocessExecutor()
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "posix_spawnp"), reason="posix_spawnp is unavailable"
+)
+class TestPosixSpawnExecutor(ExecutorTests, TestCase):
+    executor = PosixSpawnExecutor()
+
+
+class TestClientExecutor(TestCase):
+    def test_fake_executor(self):
+        executor = FakeExecutor(ExecutionResult(0, b"2\n", b""))
+        client = Client(config_filename="/tmp/taskrc", executor=executor)
+
+        assert client.count("+alarm") == 2
+
+        (command,) = executor.calls
+        assert command[0] == "task"
+        assert command[-2:] == ["(+alarm)", "count"]
+        assert executor.envs[0]["TASKRC"] == "/tmp/taskrc"
+
+    def test_iter_filter(self):
+        executor = FakeExecutor(ExecutionResult(0, b'[{"id": 1}]', b""))
+        client = Client(executor=executor)
+
+        assert [task.id for task in client.iter_filter(fields=["id"])] == [1]
+        assert executor.calls[0][-1] == "export"
+
+    def test_iter_filter_checks_options_eagerly(self):
+        executor = FakeExecutor(ExecutionResult(0, b"[]", b""))
+        client = Client(executor=executor)
+
+        with pytest.raises(ClientUsageError):
+            client.iter_filter(validate="bogus")
+        assert executor.calls == []
+
+    def test_command_error(self):
+        client = Client(executor=FakeExecutor(ExecutionResult(1, b"", b"Oops")))
+
+        with pytest.raises(CommandError) as error:
+            client.count()
+        assert error.value.stderr == "Oops"
+
+    def test_missing_binary(self):
+        client = Client(task_bin="/nonexistent/task", executor=PosixSpawnExecutor())
+
+        with pytest.raises(ClientError):
+            client.count()
+
+    def test_overrides_are_per_client(self):
+        executor = FakeExecutor(ExecutionResult(0, b"0", b""))
+        Client(config_overrides={"color": "on"}, executor=executor).count()
+        Client(executor=executor).count()
+
+        assert "rc.color=on" in executor.calls[0]
+        assert "rc.color=on" not in executor.calls[1]
+
+    def test_update_overrides(self):
+        executor = FakeExecutor(ExecutionResult(0, b"0", b""))
+        client = Client(executor=executor)
+        client.count()
+
+        client.update_config_overrides({"color": "on"})
+        client.count()
+
+        assert "rc.color=on" not in executor.calls[0]
+        assert "rc.color=on" in executor.calls[1]
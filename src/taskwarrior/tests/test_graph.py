@@ -0,0 +1,97 @@
+import uuid
+from unittest import TestCase
+
+import pytest
+
+from ..exceptions import DependencyCycle
+from ..graph import DependencyGraph
+from ..task import Task
+
+
+def make_task(description, *depends, status="pending"):
+    return Task(
+        uuid=uuid.uuid4(),
+        description=description,
+        status=status,
+        depends=[dependency.uuid for dependency in depends],
+    )
+
+
+class TestDependencyGraph(TestCase):
+    def setUp(self):
+        self.buy_seeds = make_task("Buy seeds", status="completed")
+        self.dig = make_task("Dig beds")
+        self.plant = make_task("Plant seeds", self.buy_seeds, self.dig)
+        self.water = make_task("Water", self.plant)
+        self.rest = make_task("Rest")
+
+        self.graph = DependencyGraph(
+            [self.water, self.plant, self.rest, self.dig, self.buy_seeds]
+        )
+
+        super().setUp()
+
+    def test_edges(self):
+        assert self.graph.dependencies(self.plant) == [self.buy_seeds, self.dig]
+        assert self.graph.dependents(self.plant.uuid) == [self.water]
+        assert self.graph.dependents(self.rest) == []
+
+    def test_blocked(self):
+        assert self.graph.blocked() == [self.water, self.plant]
+
+    def test_blocking(self):
+        # Completed tasks block nothing
+        assert self.graph.blocking() == [self.plant, self.dig]
+
+    def test_recurring_dependency(self):
+        # Only completed and deleted tasks are closed
+        template = make_task("Water weekly", status="recurring")
+        harvest = make_task("Harvest", template)
+        graph = DependencyGraph([template, harvest])
+
+        assert graph.is_blocked(harvest)
+        assert graph.is_blocking(template)
+
+    def test_missing_dependency(self):
+        orphan = make_task("Orphan")
+        orphan.depends = [uuid.uuid4()]
+        graph = DependencyGraph([orphan])
+
+        assert graph.blocked() == []
+        assert graph.topological_sort() == [orphan]
+
+    def test_topological_sort(self):
+        ordered = self.graph.topological_sort()
+        positions = {task.uuid: i for i, task in enumerate(ordered)}
+
+        assert len(ordered) == 5
+        for task in ordered:
+            for dependency in self.graph.dependencies(task):
+                assert positions[dependency.uuid] < positions[task.uuid]
+
+    def test_critical_path(self):
+        assert self.graph.critical_path() == [self.dig, self.plant, self.water]
+        assert DependencyGraph([]).critical_path() == []
+
+    def test_no_cycles(self):
+        assert self.graph.cycles() == []
+
+    def test_cycles(self):
+        self.dig.depends = [self.water.uuid]
+        self.rest.depends = [self.rest.uuid]
+        graph = DependencyGraph([self.water, self.plant, self.rest, self.dig])
+
+        assert sorted(len(cycle) for cycle in graph.cycles()) == [1, 3]
+
+        with pytest.raises(DependencyCycle) as error:
+            graph.topological_sort()
+        assert error.value.cycle
+
+    def test_long_chain(self):
+        tasks = [make_task("Task 0")]
+        for i in range(1, 5000):
+            tasks.append(make_task(f"Task {i}", tasks[-1]))
+        graph = DependencyGraph(reversed(tasks))
+
+        assert graph.critical_path() == tasks
+        assert graph.cycles() == []
@@ -0,0 +1,86 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from typing import Dict
+from unittest import TestCase
+
+import taskwarrior
+
+from .test_executors import make_task_bin
+
+# Modules that `import taskwarrior` and simple commands should not load
+DEFERRED_MODULES = frozenset(
+    ["asyncio", "dateutil", "pydantic", "pytz", "taskwarrior.task"]
+)
+
+
+def get_imported_modules(code: str) -> Dict[str, int]:
+    """Returns the cumulative import time, in microseconds, of each module
+    imported when running `code`, as reported by `python -X importtime`.
+
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+        env={
+            **os.environ,
+            "PYTHONPATH": os.path.dirname(os.path.dirname(taskwarrior.__file__)),
+        },
+    )
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+class TestImportTime(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.task_bin = make_task_bin(self.root, "echo 1")
+        self.taskrc = os.path.join(self.root, "taskrc")
+        with open(self.taskrc, "w") as outf:
+            outf.write(f"data.location = {self.root}\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def assert_deferred(self, modules):
+        loaded = {
+            name
+            for name in modules
+            if name in DEFERRED_MODULES or name.split(".")[0] in DEFERRED_MODULES
+        }
+        assert not loaded
+
+    def test_import(self):
+        modules = get_imported_modules("import taskwarrior")
+
+        assert "taskwarrior" in modules
+        self.assert_deferred(modules)
+
+    def test_count_and_delete(self):
+        modules = get_imported_modules(
+            "import datetime\n"
+            "from taskwarrior import Client, Q\n"
+            f"client = Client({self.taskrc!r}, task_bin={self.task_bin!r})\n"
+            "today = datetime.date.today()\n"
+            "client.count('+next', Q(project='Home') | Q(due__before=today))\n"
+            "client.delete_many(['a39ea0fa-682a-4815-9556-8b6785ee301c'])\n"
+        )
+
+        self.assert_deferred(modules)
+
+    def test_loaded_on_use(self):
+        modules = get_imported_modules("from taskwarrior import Task")
+
+        assert "pydantic" in modules
+        assert "taskwarrior.task" in modules
@@ -0,0 +1,162 @@
+import json
+import logging
+from unittest import TestCase
+
+from ..client import Client
+from ..exceptions import ClientError
+from ..executors import ExecutionResult
+from ..instrumentation import LoggingObserver
+from ..instrumentation import Observer
+from ..instrumentation import StatsObserver
+from ..instrumentation import percentile
+from .test_executors import FakeExecutor
+
+EXPORT = json.dumps(
+    [
+        {
+            "description": "Wake up",
+            "entry": "20220124T042811Z",
+            "status": "pending",
+            "uuid": "a39ea0fa-682a-4815-9556-8b6785ee301c",
+        }
+    ]
+).encode("utf-8")
+
+
+class RecordingObserver(Observer):
+    def __init__(self):
+        self.events = []
+
+    def command_started(self, command):
+        self.events.append(("command_started", command))
+
+    def command_finished(self, event):
+        self.events.append(("command_finished", event))
+
+    def command_failed(self, command, error):
+        self.events.append(("command_failed", error))
+
+    def parse_started(self, input_bytes):
+        self.events.append(("parse_started", input_bytes))
+
+    def parse_finished(self, event):
+        self.events.append(("parse_finished", event))
+
+
+class TestObservers(TestCase):
+    def setUp(self):
+        self.executor = FakeExecutor(ExecutionResult(0, EXPORT, b"", 0.25))
+
+        super().setUp()
+
+    def test_events(self):
+        observer = RecordingObserver()
+        client = Client(executor=self.executor, observers=[observer])
+
+        client.filter("+alarm")
+
+        names = [name for name, _ in observer.events]
+        assert names == [
+            "command_started",
+            "command_finished",
+            "parse_started",
+            "parse_finished",
+        ]
+
+        command_event = observer.events[1][1]
+        assert command_event.verb == "export"
+        assert command_event.filter == "(+alarm)"
+        assert command_event.cpu_time == 0.25
+        assert command_event.stdout_bytes == len(EXPORT)
+        assert command_event.return_code == 0
+        assert command_event.wall_time >= 0
+
+        parse_event = observer.events[3][1]
+        assert parse_event.task_count == 1
+        assert parse_event.validate == "eager"
+
+    def test_iter_filter_events(self):
+        observer = RecordingObserver()
+        client = Client(executor=self.executor, observers=[observer])
+
+        assert len(list(client.iter_filter("+alarm", validate="lazy"))) == 1
+
+        names = [name for name, _ in observer.events]
+        assert names == ["command_started", "command_finished", "parse_finished"]
+
+        command_event = observer.events[1][1]
+        assert command_event.verb == "export"
+        assert command_event.filter == "(+alarm)"
+        assert command_event.stdout_bytes == len(EXPORT)
+        assert command_event.return_code == 0
+
+        parse_event = observer.events[2][1]
+        assert parse_event.task_count == 1
+        assert parse_event.input_bytes == len(EXPORT)
+        assert parse_event.validate == "lazy"
+
+    def test_command_failed(self):
+        observer = RecordingObserver()
+        client = Client(task_bin="/nonexistent/task", observers=[observer])
+
+        with self.assertRaises(ClientError):
+            client.count()
+        with self.assertRaises(ClientError):
+            list(client.iter_filter())
+
+        names = [name for name, _ in observer.events]
+        assert names == ["command_started", "command_failed"] * 2
+        assert isinstance(observer.events[1][1], FileNotFoundError)
+
+    def test_remove_observer(self):
+        observer = RecordingObserver()
+        client = Client(executor=self.executor)
+        client.add_observer(observer)
+        client.remove_observer(observer)
+
+        client.filter()
+
+        assert observer.events == []
+
+    def test_stats(self):
+        stats = StatsObserver()
+        client = Client(executor=self.executor, observers=[stats])
+
+        for _ in range(3):
+            client.filter()
+
+        export = stats.get_command_stats()["export"]
+        assert export.calls == 3
+        assert export.errors == 0
+        assert export.p50 <= export.p99 <= export.max
+        assert stats.get_parse_stats().calls == 3
+        assert stats.tasks_parsed == 3
+        assert stats.cpu_time == 0.75
+        assert stats.stdout_bytes == 3 * len(EXPORT)
+
+        stats.reset()
+
+        assert stats.get_command_stats() == {}
+        assert stats.get_parse_stats() is None
+
+    def test_logging(self):
+        client = Client(executor=self.executor, observers=[LoggingObserver()])
+
+        with self.assertLogs("taskwarrior.instrumentation", logging.DEBUG) as logs:
+            client.filter()
+
+        command_record, parse_record = logs.records
+        assert command_record.taskwarrior_event == "command"
+        assert command_record.taskwarrior_verb == "export"
+        assert parse_record.taskwarrior_task_count == 1
+
+
+class TestPercentile(TestCase):
+    def test_percentile(self):
+        values = [float(value) for value in range(1, 101)]
+
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 99) == 99.0
+        assert percentile(values, 100) == 100.0
+        assert percentile([3.0], 90) == 3.0
+        assert percentile([], 50) == 0.0
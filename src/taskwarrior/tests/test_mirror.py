@@ -0,0 +1,164 @@
+import json
+import os
+import re
+import shutil
+import tempfile
+import uuid
+from typing import Any
+from typing import Dict
+from typing import List
+from unittest import TestCase
+
+from ..client import Client
+from ..executors import ExecutionResult
+from ..executors import Executor
+from ..mirror import Mirror
+
+
+class ExportExecutor(Executor):
+    """Answers `task export`, optionally filtered by `modified.after`."""
+
+    def __init__(self):
+        self.tasks: Dict[str, Dict[str, Any]] = {}
+        self.calls: List[List[str]] = []
+
+    def set(self, description: str, modified: str, **attributes: Any) -> str:
+        task_uuid = attributes.pop("uuid", None) or str(uuid.uuid4())
+        self.tasks[task_uuid] = {
+            "uuid": task_uuid,
+            "description": description,
+            "entry": "20200101T000000Z",
+            "modified": modified,
+            "status": "pending",
+            **attributes,
+        }
+        return task_uuid
+
+    def run(self, command, env, stdin=b""):
+        self.calls.append(command)
+        assert command[-1] == "export"
+
+        # e.g. `((modified.after:2020-01-01T21:59:59Z))`
+        after = [
+            match.replace("-", "").replace(":", "")
+            for argument in command
+            for match in re.findall(r"modified\.after:([\d\-T:]+Z)", argument)
+        ]
+        tasks = [
+            task
+            for task in self.tasks.values()
+            if not after or task["modified"] > after[0]
+        ]
+
+        return ExecutionResult(0, json.dumps(tasks).encode(), b"")
+
+
+class TestMirror(TestCase):
+    def setUp(self):
+        self.task_data = tempfile.mkdtemp()
+        self.taskrc_path = os.path.join(self.task_data, "taskrc")
+        with open(self.taskrc_path, "w") as outf:
+            outf.write(f"data.location = {self.task_data}\n")
+
+        self.snapshot_path = os.path.join(self.task_data, "mirror")
+        self.executor = ExportExecutor()
+        self.client = Client(self.taskrc_path, executor=self.executor)
+
+        self.wake_up = self.executor.set("Wake up", "20200101T060000Z")
+        self.sleep = self.executor.set("Go to sleep", "20200101T220000Z")
+
+    def tearDown(self):
+        shutil.rmtree(self.task_data)
+
+    def assert_exported_after(self, timestamp: str) -> None:
+        assert f"modified.after:{timestamp}" in " ".join(self.executor.calls[-1])
+
+    def test_incremental(self):
+        mirror = Mirror(self.client)
+
+        assert len(mirror.refresh()) == 2
+        assert "modified.after" not in " ".join(self.executor.calls[-1])
+
+        self.executor.set(
+            "Wake up late", "20200102T090000Z", uuid=self.wake_up, status="completed"
+        )
+        added = self.executor.set("Get up", "20200102T093000Z")
+
+        changed = mirror.refresh()
+
+        # Tasks modified in the second before the high-water mark are included
+        self.assert_exported_after("2020-01-01T21:59:59Z")
+        assert {str(task.uuid) for task in changed} == {self.wake_up, added}
+        assert mirror.store.get(uuid=self.wake_up).status == "completed"
+        assert mirror.store.count(status="pending") == 2
+        assert len(mirror.store) == 3
+
+    def test_overlap_unchanged(self):
+        mirror = Mirror(self.client)
+        mirror.refresh()
+
+        assert mirror.refresh() == []
+        assert mirror.high_water_mark is not None
+        assert mirror.high_water_mark.hour == 22
+
+    def test_deleted(self):
+        mirror = Mirror(self.client)
+        mirror.refresh()
+
+        self.executor.set(
+            "Go to sleep", "20200102T000000Z", uuid=self.sleep, status="deleted"
+        )
+        mirror.refresh()
+
+        assert [str(task.uuid) for task in mirror.store.filter(status="pending")] == [
+            self.wake_up
+        ]
+
+    def test_full(self):
+        mirror = Mirror(self.client)
+        mirror.refresh()
+
+        del self.executor.tasks[self.sleep]
+
+        assert mirror.refresh() == []
+        assert len(mirror.store) == 2
+        assert len(mirror.refresh(full=True)) == 1
+        assert len(mirror.store) == 1
+
+    def test_snapshot(self):
+        mirror = Mirror(self.client, snapshot_path=self.snapshot_path)
+        mirror.refresh()
+
+        assert os.path.exists(self.snapshot_path)
+        # Only the snapshot itself; its temporary file was renamed
+        assert sorted(os.listdir(self.task_data)) == ["mirror", "taskrc"]
+
+        calls = len(self.executor.calls)
+        restored = Mirror(self.client, snapshot_path=self.snapshot_path)
+
+        assert len(self.executor.calls) == calls
+        assert len(restored.store) == 2
+        assert restored.high_water_mark == mirror.high_water_mark
+        assert restored.store.get(uuid=self.sleep).description == "Go to sleep"
+
+        self.executor.set("Get up", "20200102T093000Z")
+
+        assert len(restored.refresh()) == 1
+        self.assert_exported_after("2020-01-01T21:59:59Z")
+        assert len(Mirror(self.client, snapshot_path=self.snapshot_path).store) == 3
+
+    def test_unusable_snapshot(self):
+        with open(self.snapshot_path, "w") as outf:
+            outf.write('{"version": 1, "data_location": "/elsewhere"}\n')
+
+        with self.assertLogs("taskwarrior.mirror", level="WARNING"):
+            mirror = Mirror(self.client, snapshot_path=self.snapshot_path)
+
+        assert len(mirror.store) == 0
+        assert len(mirror.refresh()) == 2
+
+        with open(self.snapshot_path, "w") as outf:
+            outf.write("not json")
+
+        with self.assertLogs("taskwarrior.mirror", level="WARNING"):
+            assert len(Mirror(self.client, snapshot_path=self.snapshot_path).store) == 0
@@ -0,0 +1,149 @@
+import json
+import os
+import pickle
+import shutil
+import tempfile
+from unittest import TestCase
+
+import pytest
+
+from ..exceptions import ClientUsageError
+from ..exceptions import CommandError
+from ..pool import ClientPool
+from ..pool import TenantCall
+from ..task import Task
+from .test_executors import make_task_bin
+
+# Answers from files in the directory of the tenant's taskrc, and logs
+# each invocation; a missing file makes the command fail.
+FAKE_TASK = """dir=$(dirname "$TASKRC")
+for verb; do :; done
+echo "$verb" >> "{log_path}"
+case "$verb" in
+    count) cat "$dir/count" ;;
+    export) cat "$dir/export.json" ;;
+    import) cat > "$dir/imported.json" ;;
+esac
+"""
+
+
+class TestClientPool(TestCase):
+    mode = "thread"
+
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.log_path = os.path.join(self.root, "log")
+        self.task_bin = make_task_bin(
+            self.root, FAKE_TASK.format(log_path=self.log_path)
+        )
+
+        self.tenants = {}
+        for index in range(6):
+            tenant = f"tenant{index}"
+            directory = os.path.join(self.root, tenant)
+            os.mkdir(directory)
+            self.tenants[tenant] = os.path.join(directory, "taskrc")
+            with open(self.tenants[tenant], "w") as outf:
+                outf.write(f"data.location = {directory}\n")
+            # The last tenant has no count, so counting fails
+            if index < 5:
+                with open(os.path.join(directory, "count"), "w") as outf:
+                    outf.write(f"{index}\n")
+            with open(os.path.join(directory, "export.json"), "w") as outf:
+                json.dump([{"description": f"{tenant}'s task"}], outf)
+
+        self.pool = ClientPool(
+            self.tenants,
+            max_workers=2,
+            mode=self.mode,
+            client_options={"task_bin": self.task_bin},
+        )
+
+    def tearDown(self):
+        self.pool.close()
+        shutil.rmtree(self.root)
+
+    def get_invocations(self):
+        with open(self.log_path) as inf:
+            return inf.read().split()
+
+    def test_count(self):
+        results = {result.tenant: result for result in self.pool.count()}
+
+        assert {
+            tenant: result.value
+            for tenant, result in results.items()
+            if result.error is None
+        } == {f"tenant{index}": index for index in range(5)}
+        assert isinstance(results["tenant5"].error, CommandError)
+        assert results["tenant5"].value is None
+
+    def test_subset(self):
+        results = list(self.pool.filter(tenants=["tenant1", "tenant3"]))
+
+        assert sorted(
+            (result.tenant, result.value[0].description) for result in results
+        ) == [("tenant1", "tenant1's task"), ("tenant3", "tenant3's task")]
+
+    def test_unknown(self):
+        with pytest.raises(ClientUsageError):
+            self.pool.count(tenants=["tenant1", "nobody"])
+        with pytest.raises(ClientUsageError):
+            self.pool.map("iter_filter")
+
+    def test_import_many(self):
+        results = list(
+            self.pool.import_many(
+                {
+                    "tenant0": [Task(description="First")],
+                    "tenant2": [Task(description="Second"), Task(description="Third")],
+                }
+            )
+        )
+
+        assert sorted((result.tenant, len(result.value)) for result in results) == [
+            ("tenant0", 1),
+            ("tenant2", 2),
+        ]
+        with open(os.path.join(self.root, "tenant2", "imported.json")) as inf:
+            imported = json.load(inf)
+        assert [task["description"] for task in imported] == ["Second", "Third"]
+
+    def test_backpressure(self):
+        consumed = []
+
+        def calls():
+            for tenant in self.tenants:
+                consumed.append(tenant)
+                yield TenantCall(tenant, "count")
+
+        pool = ClientPool(
+            self.tenants,
+            max_workers=1,
+            mode=self.mode,
+            max_pending=1,
+            client_options={"task_bin": self.task_bin},
+        )
+        with pool:
+            results = pool.run(calls())
+            next(results)
+            results.close()
+
+        assert len(consumed) == 1
+        assert self.get_invocations() == ["count"]
+
+
+class TestProcessClientPool(TestClientPool):
+    mode = "process"
+
+
+class TestCommandErrorPickling(TestCase):
+    def test_round_trip(self):
+        error = pickle.loads(pickle.dumps(CommandError(["task"], "err", "out", 2)))
+
+        assert (error.command, error.stderr, error.stdout, error.return_code) == (
+            ["task"],
+            "err",
+            "out",
+            2,
+        )
@@ -0,0 +1,164 @@
+import json
+import os
+import shutil
+import tempfile
+import uuid
+from unittest import TestCase
+
+import pytest
+
+from ..client import Client
+from ..exceptions import CommandError
+from ..task import Task
+from .test_client import TestClient
+from .test_executors import make_task_bin
+
+
+class TestSession(TestClient):
+    def test_modify(self):
+        with self.client.session() as session:
+            wake_up = session.get(uuid=self.TASK_UUID_WAKE_UP)
+            wake_up.project = "Morning"
+
+            assert session.get(uuid=self.TASK_UUID_WAKE_UP) is wake_up
+
+        assert self.client.get(uuid=self.TASK_UUID_WAKE_UP).project == "Morning"
+
+    def test_add_and_delete(self):
+        with self.client.session() as session:
+            new = Task(description="New Task")
+            session.add(new)
+            session.delete(session.get(uuid=self.TASK_UUID_SLEEP))
+
+        assert self.client.get(uuid=new.uuid).description == "New Task"
+        assert self.client.get(uuid=self.TASK_UUID_SLEEP).status == "deleted"
+
+
+class TestSessionBatching(TestCase):
+    def setUp(self):
+        self.bin_dir = tempfile.mkdtemp()
+        self.log_path = os.path.join(self.bin_dir, "log")
+
+        self.tasks = [
+            Task(uuid=uuid.uuid4(), description=f"Task {i}", status="pending")
+            for i in range(3)
+        ]
+
+        super().setUp()
+
+    def tearDown(self):
+        shutil.rmtree(self.bin_dir)
+
+        super().tearDown()
+
+    def make_client(self, script: str = "") -> Client:
+        # Logs the arguments and input of each invocation
+        path = make_task_bin(
+            self.bin_dir,
+            f'echo "$@" >> {self.log_path}\n'
+            f"cat >> {self.log_path}\n"
+            f"echo >> {self.log_path}\n"
+            f"{script}",
+        )
+
+        return Client(config_filename=os.devnull, task_bin=path)
+
+    def get_invocations(self):
+        if not os.path.exists(self.log_path):
+            return []
+        with open(self.log_path) as inf:
+            lines = inf.read().splitlines()
+        return list(zip(lines[::2], lines[1::2]))
+
+    def test_coalesces_changes(self):
+        session = self.make_client().session()
+        for task in self.tasks:
+            session.track(task)
+
+        self.tasks[0].description = "Changed"
+        self.tasks[0].description = "Changed again"
+        session.modify(self.tasks[0])
+        self.tasks[1].tags = ["changed"]
+
+        assert session.get_changed_fields(self.tasks[1]) == {"tags"}
+
+        session.flush()
+
+        ((args, stdin),) = self.get_invocations()
+        assert args.endswith(" import")
+        assert [task["uuid"] for task in json.loads(stdin)] == [
+            str(self.tasks[0].uuid),
+            str(self.tasks[1].uuid),
+        ]
+        assert session.get_dirty() == []
+
+    def list_uuids(self, tasks) -> str:
+        # Answers `task _uuids` as Taskwarrior would for `tasks`
+        uuids = " ".join(str(task.uuid) for task in tasks)
+        return f'case "$*" in *_uuids*) echo {uuids} ;; esac'
+
+    def test_deletes_at_once(self):
+        session = self.make_client(self.list_uuids(self.tasks)).session()
+        for task in self.tasks:
+            session.delete(session.track(task))
+
+        session.flush()
+
+        _, (args, _) = self.get_invocations()
+        assert args.endswith(
+            " ".join(str(task.uuid) for task in self.tasks)
+            + " status.not:deleted delete"
+        )
+        assert repr(session) == "Session(tracked=0, added=0, deleted=0)"
+
+    def test_deleted_not_imported(self):
+        session = self.make_client(self.list_uuids(self.tasks)).session()
+        session.track(self.tasks[0])
+        self.tasks[0].description = "Changed"
+        session.delete(self.tasks[0])
+
+        assert session.get_dirty() == []
+        session.flush()
+
+        assert [args.split()[-1] for args, _ in self.get_invocations()] == [
+            "_uuids",
+            "delete",
+        ]
+
+    def test_failed_delete_stays_pending(self):
+        session = self.make_client(
+            self.list_uuids(self.tasks) + '\ncase "$*" in *delete) exit 1 ;; esac'
+        ).session()
+        session.delete(session.track(self.tasks[0]))
+
+        with pytest.raises(CommandError):
+            session.flush()
+
+        assert repr(session) == "Session(tracked=1, added=0, deleted=1)"
+
+    def test_nothing_to_do(self):
+        with self.make_client().session() as session:
+            session.track(self.tasks[0])
+            new = Task(description="Never written")
+            session.add(new)
+            session.delete(new)
+
+        assert self.get_invocations() == []
+
+    def test_failure_keeps_changes(self):
+        session = self.make_client("exit 1").session()
+        session.track(self.tasks[0])
+        self.tasks[0].description = "Changed"
+
+        with pytest.raises(CommandError):
+            session.flush()
+
+        assert session.get_dirty() == [self.tasks[0]]
+
+    def test_exception_discards(self):
+        with pytest.raises(RuntimeError):
+            with self.make_client().session() as session:
+                session.add(Task(description="New Task"))
+                raise RuntimeError()
+
+        assert self.get_invocations() == []
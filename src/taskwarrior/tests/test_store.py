@@ -0,0 +1,169 @@
+import datetime
+import os
+import shutil
+import tempfile
+import uuid
+from unittest import TestCase
+
+import pytest
+import pytz
+
+from ..client import Client
+from ..client import Q
+from ..exceptions import MultipleObjectsFound
+from ..exceptions import NotFound
+from ..exceptions import UnsupportedFilter
+from ..store import SortedIndex
+from ..store import TaskStore
+from ..task import Task
+from .test_client import TestClient
+
+
+class TestSortedIndex(TestCase):
+    def test_range(self):
+        index = SortedIndex()
+        first, second, third = uuid.uuid4(), uuid.uuid4(), uuid.uuid4()
+        index.add(20.0, second)
+        index.add(10.0, first)
+        index.add(20.0, third)
+
+        assert index.range(high=10.0) == {first}
+        assert index.range(low=15.0) == {second, third}
+        assert index.range(low=10.0, high=20.0) == {first, second, third}
+
+        index.remove(20.0, second)
+
+        assert index.range(low=15.0) == {third}
+        assert len(index) == 2
+
+
+class TestTaskStore(TestCase):
+    def setUp(self):
+        self.task_data = tempfile.mkdtemp()
+        taskrc_path = os.path.join(self.task_data, "taskrc")
+        with open(taskrc_path, "w") as outf:
+            outf.write("uda.estimate.type = numeric\n")
+
+        self.wake_up = Task(
+            uuid=uuid.uuid4(),
+            description="Wake up",
+            project="Home.Morning",
+            tags=["alarm", "early"],
+            status="pending",
+        )
+        self.wake_up.due = datetime.datetime(2030, 1, 1, 6, tzinfo=pytz.utc)
+        self.sleep = Task(
+            uuid=uuid.uuid4(),
+            description="Go to sleep",
+            project="Home",
+            tags=["bedtime"],
+            status="pending",
+            estimate=224,
+        )
+        self.sleep.due = datetime.datetime(2030, 1, 2, 22, tzinfo=pytz.utc)
+        self.done = Task(
+            uuid=uuid.uuid4(),
+            description="Buy groceries",
+            project="Errands",
+            status="completed",
+        )
+
+        self.store = TaskStore(
+            Client(config_filename=taskrc_path), [self.wake_up, self.sleep, self.done]
+        )
+
+        super().setUp()
+
+    def tearDown(self):
+        shutil.rmtree(self.task_data)
+
+        super().tearDown()
+
+    def test_get_uuid(self):
+        assert self.store.get(uuid=self.sleep.uuid) is self.sleep
+
+        with pytest.raises(NotFound):
+            self.store.get(uuid=uuid.uuid4())
+
+    def test_get_multiple(self):
+        with pytest.raises(MultipleObjectsFound):
+            self.store.get(project="Home")
+
+    def test_project(self):
+        assert self.store.filter(project="Home") == [self.wake_up, self.sleep]
+        assert self.store.filter(project__is="Home") == [self.sleep]
+
+    def test_tags(self):
+        assert self.store.filter("+alarm") == [self.wake_up]
+        assert self.store.filter("+alarm", "+bedtime") == []
+        assert self.store.filter(Q("+alarm") | Q("+bedtime")) == [
+            self.wake_up,
+            self.sleep,
+        ]
+        assert self.store.filter("-alarm") == [self.sleep, self.done]
+
+    def test_status(self):
+        assert self.store.filter(status="completed") == [self.done]
+        assert self.store.count(status="pending") == 2
+
+    def test_dates(self):
+        assert self.store.filter(due__before="2030-01-02") == [self.wake_up]
+        assert self.store.filter(due__after="2030-01-01T06:00:00Z") == [self.sleep]
+        assert self.store.filter(due=datetime.date(2030, 1, 2)) == [self.sleep]
+        assert self.store.filter(due__none="") == [self.done]
+
+    def test_uda(self):
+        assert self.store.filter(estimate__above=200) == [self.sleep]
+
+    def test_unsupported(self):
+        with pytest.raises(UnsupportedFilter):
+            self.store.filter(due__before="today")
+
+    def test_reindex(self):
+        self.wake_up.project = "Errands"
+        self.wake_up.tags = ["late"]
+        self.store._index(self.wake_up)
+
+        assert self.store.filter(project="Home") == [self.sleep]
+        assert self.store.filter("+alarm") == []
+        assert self.store.filter("+late") == [self.wake_up]
+        assert len(self.store) == 3
+
+
+class TestTaskStoreWrites(TestClient):
+    def setUp(self):
+        super().setUp()
+
+        self.store = TaskStore.load(self.client, status="pending")
+
+    def test_load(self):
+        assert len(self.store) == 2
+        assert self.TASK_UUID_SLEEP in self.store
+
+    def test_add(self):
+        new = Task(description="New Task", tags=["new"])
+
+        self.store.add(new)
+
+        assert self.store.get("+new") is new
+        assert self.client.get(uuid=new.uuid).description == "New Task"
+
+    def test_modify(self):
+        wake_up = self.store.get(uuid=self.TASK_UUID_WAKE_UP)
+        wake_up.project = "Morning"
+
+        self.store.modify(wake_up)
+
+        assert self.store.get(project="Morning") is wake_up
+        assert self.client.get(uuid=self.TASK_UUID_WAKE_UP).project == "Morning"
+
+    def test_delete(self):
+        sleep = self.store.get(uuid=self.TASK_UUID_SLEEP)
+
+        self.store.delete(sleep)
+
+        assert self.store.filter(status="pending") == [
+            self.store.get(uuid=self.TASK_UUID_WAKE_UP)
+        ]
+        assert self.store.get(status="deleted") is sleep
+        assert self.client.get(uuid=self.TASK_UUID_SLEEP).status == "deleted"
@@ -0,0 +1,133 @@
+import datetime
+import uuid
+from unittest import TestCase
+
+import pytz
+from pydantic import ValidationError
+
+from ..task import LazyTask
+from ..task import ProjectedTask
+from ..task import Task
+from ..task import parse_datetime
+
+
+class TestParseDatetime(TestCase):
+    def test_taskwarrior_format(self):
+        assert parse_datetime("20220124T042811Z") == datetime.datetime(
+            2022, 1, 24, 4, 28, 11, tzinfo=pytz.utc
+        )
+
+    def test_other_format(self):
+        assert parse_datetime("2022-01-24T05:28:11+01:00") == datetime.datetime(
+            2022, 1, 24, 4, 28, 11, tzinfo=pytz.utc
+        )
+
+    def test_passthrough(self):
+        value = datetime.datetime(2022, 1, 24, 4, 28, 11, tzinfo=pytz.utc)
+
+        assert parse_datetime(value) is value
+        assert parse_datetime(None) is None
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            parse_datetime("20221324T042811Z")
+
+
+class TestTask(TestCase):
+    def test_parse_datetimes(self):
+        task = Task.parse_obj(
+            {
+                "description": "Wake up",
+                "entry": "20220124T042811Z",
+                "annotations": [{"entry": "20220124T042811Z", "description": "x"}],
+            }
+        )
+
+        assert task.entry == datetime.datetime(
+            2022, 1, 24, 4, 28, 11, tzinfo=pytz.utc
+        )
+        assert task.annotations[0].entry == task.entry
+
+    def test_construct_with_datetime(self):
+        due = datetime.datetime(2030, 1, 1, tzinfo=pytz.utc)
+
+        assert Task(description="New Task", due=due).due == due
+
+    def test_json_round_trip(self):
+        task = Task.parse_obj({"description": "x", "due": "20300101T000000Z"})
+
+        assert Task.parse_raw(task.json()).due == task.due
+
+
+class TestLazyTask(TestCase):
+    DATA = {
+        "id": 1,
+        "description": "Wake up",
+        "due": "20300101T000000Z",
+        "uuid": "a39ea0fa-682a-4815-9556-8b6785ee301c",
+        "tags": ["alarm"],
+        "annotations": [{"entry": "20220124T042811Z", "description": "Early"}],
+        "orphaned": "somevalue",
+    }
+
+    def test_fields_validated_on_access(self):
+        task = LazyTask.from_export(self.DATA)
+
+        assert "due" not in task.__dict__
+        assert task.due == datetime.datetime(2030, 1, 1, tzinfo=pytz.utc)
+        assert "due" in task.__dict__
+
+    def test_equal_to_eager(self):
+        lazy = LazyTask.from_export(self.DATA)
+
+        assert isinstance(lazy, Task)
+        assert lazy == Task.parse_obj(self.DATA)
+        assert lazy.orphaned == "somevalue"
+
+    def test_json(self):
+        lazy = LazyTask.from_export(self.DATA)
+
+        assert lazy.json(exclude_unset=True) == Task.parse_obj(self.DATA).json(
+            exclude_unset=True
+        )
+
+    def test_assignment(self):
+        lazy = LazyTask.from_export(self.DATA)
+        lazy.due = None
+
+        assert lazy.due is None
+        assert Task.parse_raw(lazy.json()).due is None
+
+    def test_copy(self):
+        copied = LazyTask.from_export(self.DATA).copy()
+        copied.project = "Home"
+
+        assert copied.uuid == uuid.UUID(self.DATA["uuid"])
+
+    def test_invalid_value(self):
+        task = LazyTask.from_export({"description": "x", "due": "not a date"})
+
+        with self.assertRaises(ValidationError):
+            task.due
+
+
+class TestProjectedTask(TestCase):
+    DATA = TestLazyTask.DATA
+
+    def test_only_requested_fields(self):
+        task = ProjectedTask.from_export_fields(self.DATA, ["uuid", "due", "size"])
+
+        assert task.uuid == uuid.UUID(self.DATA["uuid"])
+        assert task.due == datetime.datetime(2030, 1, 1, tzinfo=pytz.utc)
+        assert task.description is None
+        assert task.__fields_set__ == {"uuid", "due"}
+
+    def test_eager_validation(self):
+        with self.assertRaises(ValidationError):
+            ProjectedTask.from_export_fields({"due": "not a date"}, ["due"])
+
+    def test_lazy_validation(self):
+        task = ProjectedTask.from_export_fields(self.DATA, ["due"], validate="lazy")
+
+        assert "due" not in task.__dict__
+        assert task.due == datetime.datetime(2030, 1, 1, tzinfo=pytz.utc)
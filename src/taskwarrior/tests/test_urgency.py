@@ -0,0 +1,191 @@
+import datetime
+import uuid
+from unittest import TestCase
+
+import pytest
+import pytz
+
+from ..task import Task
+from .test_client import TestClient
+
+np = pytest.importorskip("numpy")
+
+from ..urgency import UrgencyModel  # noqa: E402
+
+NOW = datetime.datetime(2024, 1, 1, tzinfo=pytz.utc)
+
+
+def days(count: float) -> datetime.datetime:
+    return NOW + datetime.timedelta(days=count)
+
+
+class TestUrgencyModel(TestCase):
+    def setUp(self):
+        self.model = UrgencyModel()
+
+        self.busy = Task(
+            uuid=uuid.uuid4(),
+            description="Call the office",
+            project="Work.Reports",
+            tags=["next", "phone"],
+            status="pending",
+            priority="H",
+        )
+        self.busy.due = days(-10)
+        self.busy.entry = days(-400)
+        self.busy.start = days(-1)
+        self.busy.add_annotation("Ask for Bob", days(-2))
+
+        self.waiting = Task(uuid=uuid.uuid4(), description="Wait", status="waiting")
+        self.waiting.entry = days(-73)
+        self.waiting.due = NOW
+        self.waiting.scheduled = days(-1)
+        self.waiting.wait = days(1)
+
+        self.blocking = Task(uuid=uuid.uuid4(), description="First", status="pending")
+        self.blocked = Task(
+            uuid=uuid.uuid4(),
+            description="Second",
+            status="pending",
+            depends=[self.blocking.uuid],
+        )
+        self.done = Task(
+            uuid=uuid.uuid4(),
+            description="Third",
+            status="completed",
+            depends=[self.blocking.uuid],
+        )
+        self.later = Task(uuid=uuid.uuid4(), description="Later", status="pending")
+        self.later.due = days(30)
+        for task in (self.blocking, self.blocked, self.done, self.later):
+            task.entry = NOW
+
+        self.tasks = [
+            self.busy,
+            self.waiting,
+            self.blocking,
+            self.blocked,
+            self.done,
+            self.later,
+        ]
+
+    def test_default_coefficients(self):
+        urgency = self.model.compute(self.tasks, now=NOW)
+
+        assert urgency == pytest.approx(
+            [
+                # project + active + annotations + tags + next + due + age + H
+                1.0 + 4.0 + 0.8 + 0.9 + 15.0 + 12.0 + 2.0 + 6.0,
+                # age + due + scheduled + waiting
+                2.0 * 73 / 365 + 12.0 * (14.0 * 0.8 / 21.0 + 0.2) + 5.0 - 3.0,
+                8.0,
+                -5.0,
+                0.0,
+                12.0 * 0.2,
+            ]
+        )
+
+    def test_user_coefficients(self):
+        self.later.estimate = 3
+        model = self.model.with_coefficients(
+            {
+                "urgency.user.tag.next.coefficient": 0.0,
+                "urgency.user.tag.phone.coefficient": 2.0,
+                "urgency.user.project.Work.coefficient": 3.0,
+                "urgency.user.keyword.office.coefficient": 1.0,
+                "urgency.uda.estimate.coefficient": 0.5,
+            }
+        )
+
+        default = self.model.compute(self.tasks, now=NOW)
+        urgency = model.compute(self.tasks, now=NOW)
+
+        assert urgency[0] - default[0] == pytest.approx(-15.0 + 2.0 + 3.0 + 1.0)
+        assert urgency[5] - default[5] == pytest.approx(0.5)
+
+    def test_age_max(self):
+        model = UrgencyModel({"urgency.age.coefficient": 1.0}, age_max=0)
+
+        assert model.compute([self.waiting], now=NOW)[0] == pytest.approx(
+            1.0 + 12.0 * (14.0 * 0.8 / 21.0 + 0.2) + 5.0 - 3.0
+        )
+
+    def test_age_without_entry(self):
+        # Like Taskwarrior, a task without an entry date counts as fully aged
+        model = UrgencyModel({"urgency.age.coefficient": 1.0})
+        task = Task(uuid=uuid.uuid4(), description="Undated", status="pending")
+
+        assert model.compute([task], now=NOW)[0] == pytest.approx(1.0)
+
+    def test_from_config(self):
+        model = UrgencyModel.from_config(
+            {
+                "urgency.due.coefficient": "1.5",
+                "urgency.age.max": "10",
+                "urgency.inherit": "0",
+                "data.location": "~/.task",
+            }
+        )
+
+        assert model.coefficients["urgency.due.coefficient"] == 1.5
+        assert model.coefficients["urgency.user.tag.next.coefficient"] == 15.0
+        assert model.age_max == 10
+
+    def test_next_tag(self):
+        default = self.model.compute([self.busy], now=NOW)[0]
+
+        for value, expected in [("0", default - 15.0), ("15", default)]:
+            model = UrgencyModel.from_config(
+                {"urgency.user.tag.next.coefficient": value}
+            )
+            assert model.compute([self.busy], now=NOW)[0] == pytest.approx(expected)
+
+    def test_top(self):
+        top = self.model.top(self.tasks, 3, now=NOW)
+
+        assert [task for task, _ in top] == [self.busy, self.waiting, self.blocking]
+        assert top[0][1] == pytest.approx(41.7)
+        assert len(self.model.top(self.tasks, 100, now=NOW)) == len(self.tasks)
+        assert self.model.top(self.tasks, 0, now=NOW) == []
+
+    def test_empty(self):
+        assert len(self.model.compute([], now=NOW)) == 0
+
+
+class TestUrgencyMatchesTaskwarrior(TestClient):
+    def test_next_tag_configured(self):
+        with open(self.taskrc_path, "a") as outf:
+            outf.write("urgency.user.tag.next.coefficient = 4.0\n")
+        self.client.add(Task(description="Report", tags=["next"]))
+
+        tasks = self.client.filter()
+        model = UrgencyModel.from_client(self.client)
+
+        assert model.coefficients["urgency.user.tag.next.coefficient"] == 4.0
+        assert model.compute(tasks) == pytest.approx(
+            [task.urgency for task in tasks], abs=1e-3
+        )
+
+    def test_matches(self):
+        now = datetime.datetime.now(tz=pytz.utc)
+
+        first = Task(description="Report", project="Work", tags=["next", "a", "b"])
+        first.due = now - datetime.timedelta(days=3)
+        first.add_annotation("Draft sent")
+        self.client.add(first)
+
+        second = Task(description="Review", depends=[first.uuid], priority="M")
+        second.scheduled = now - datetime.timedelta(days=1)
+        self.client.add(second)
+
+        third = Task(description="Someday")
+        third.due = now + datetime.timedelta(days=30)
+        third.wait = now + datetime.timedelta(days=2)
+        self.client.add(third)
+
+        tasks = self.client.filter()
+        model = UrgencyModel.from_client(self.client)
+
+        assert model.compute(tasks) == pytest.approx(
+            [task.urgency for task in tasks], abs=1e-3
+        )
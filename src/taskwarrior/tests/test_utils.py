@@ -0,0 +1,50 @@
+import io
+from unittest import TestCase
+
+import pytest
+
+from ..utils import chunked
+from ..utils import convert_dict_to_override_args
+from ..utils import iter_json_array
+
+
+class TestConvertDictToOverrideArgs(TestCase):
+    def test_nested(self):
+        assert convert_dict_to_override_args(
+            {"json": {"array": "TRUE"}, "verbose": "nothing"}
+        ) == ["rc.json.array=TRUE", "rc.verbose=nothing"]
+
+    def test_quotes_spaces(self):
+        assert convert_dict_to_override_args({"context": "some value"}) == [
+            'rc.context="some value"'
+        ]
+
+
+class TestChunked(TestCase):
+    def test_chunked(self):
+        assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
+
+    def test_empty(self):
+        assert list(chunked([], 2)) == []
+
+
+class TestIterJsonArray(TestCase):
+    DATA = '[\n{"description":"Café","tags":["a","b"]},\n{"urgency":1234},\n5678\n]'
+
+    def test_small_reads(self):
+        for read_size in (1, 2, 3, 7, 1024):
+            assert list(
+                iter_json_array(io.BytesIO(self.DATA.encode("utf-8")), read_size)
+            ) == [{"description": "Café", "tags": ["a", "b"]}, {"urgency": 1234}, 5678]
+
+    def test_empty(self):
+        assert list(iter_json_array(io.BytesIO(b""))) == []
+        assert list(iter_json_array(io.BytesIO(b"[]"))) == []
+
+    def test_truncated(self):
+        with pytest.raises(ValueError):
+            list(iter_json_array(io.BytesIO(b'[{"description"'), 2))
+
+    def test_not_array(self):
+        with pytest.raises(ValueError):
+            list(iter_json_array(io.BytesIO(b'{"description": "x"}')))
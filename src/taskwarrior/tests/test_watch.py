@@ -0,0 +1,96 @@
+import os
+import shutil
+import sys
+import tempfile
+import uuid
+from unittest import TestCase
+
+import pytest
+
+from ..client import Client
+from ..datafile import format_line
+
+pytestmark = pytest.mark.skipif(
+    not sys.platform.startswith("linux"), reason="inotify is Linux-only"
+)
+
+
+def undo_entry(task_uuid, old=None):
+    new = {"description": "Changed", "uuid": str(task_uuid)}
+    lines = ["time 1642998491\n"]
+    if old is not None:
+        lines.append(f"old {format_line(old)}\n")
+    lines.append(f"new {format_line(new)}\n---\n")
+    return "".join(lines)
+
+
+class TestChangeFeed(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.taskrc = os.path.join(self.root, "taskrc")
+        with open(self.taskrc, "w") as outf:
+            outf.write(f"data.location = {self.root}\n")
+        self.write("undo.data", undo_entry(uuid.uuid4()))
+
+        self.client = Client(self.taskrc)
+        self.feed = self.client.watch(debounce=0.05, parse_undo=True)
+
+    def tearDown(self):
+        self.feed.close()
+        shutil.rmtree(self.root)
+
+    def write(self, filename, text, mode="a"):
+        with open(os.path.join(self.root, filename), mode) as outf:
+            outf.write(text)
+
+    def test_no_change(self):
+        assert self.feed.wait(timeout=0.1) is None
+
+    def test_reports_changed_uuids(self):
+        first, second = uuid.uuid4(), uuid.uuid4()
+
+        self.write("pending.data", "[description:\"Changed\"]\n", mode="w")
+        self.write("undo.data", undo_entry(first))
+        self.write("undo.data", undo_entry(second, old={"uuid": str(second)}))
+
+        event = self.feed.wait(timeout=1)
+
+        assert event.files == {"pending.data", "undo.data"}
+        assert event.uuids == {first, second}
+        assert self.feed.wait(timeout=0.1) is None
+
+    def test_ignores_other_files(self):
+        self.write("backlog.data", "{}\n")
+        self.write("taskrc", "\n")
+
+        assert self.feed.wait(timeout=0.1) is None
+
+    def test_uuids_unknown(self):
+        self.write("completed.data", "[description:\"Done\"]\n")
+
+        assert self.feed.wait(timeout=1) == ({"completed.data"}, None)
+
+        # As after `task undo`
+        self.write("undo.data", "", mode="w")
+
+        assert self.feed.wait(timeout=1) == ({"undo.data"}, None)
+
+    def test_partial_entry(self):
+        task_uuid = uuid.uuid4()
+        entry = undo_entry(task_uuid)
+        self.write("undo.data", entry[:20])
+
+        assert self.feed.wait(timeout=1).uuids == set()
+
+        self.write("undo.data", entry[20:])
+
+        assert self.feed.wait(timeout=1).uuids == {task_uuid}
+
+    def test_iteration_stops_when_closed(self):
+        self.write("pending.data", "\n")
+
+        for event in self.feed:
+            assert event.files == {"pending.data"}
+            self.feed.close()
+
+        assert list(self.feed) == []
@@ -0,0 +1,169 @@
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+from unittest import TestCase
+
+import pytest
+
+from ..client import Client
+from ..exceptions import CommandError
+from ..task import Task
+from ..writes import get_write_queue
+from .test_executors import make_task_bin
+
+REJECTED_UUID = "00000000-0000-4000-8000-000000000000"
+
+# Logs each invocation, then waits while the hold file exists; imports of
+# tasks described as "Rejected", and deletes of `REJECTED_UUID`, fail.
+FAKE_TASK = """echo "$@" >> "{root}/log"
+while [ -e "{root}/hold" ]; do sleep 0.01; done
+for verb; do :; done
+if [ "$verb" = import ]; then
+    input=$(cat)
+    case "$input" in
+        *Rejected*) echo "Rejected" >&2; exit 2 ;;
+    esac
+    echo "$input" >> "{root}/imported"
+fi
+case "$verb $*" in
+    delete*{rejected}*) echo "Not deletable" >&2; exit 1 ;;
+esac
+echo "$verb done"
+"""
+
+
+class TestWriteQueue(TestCase):
+    def setUp(self):
+        self.root = tempfile.mkdtemp()
+        self.task_bin = make_task_bin(
+            self.root, FAKE_TASK.format(root=self.root, rejected=REJECTED_UUID)
+        )
+
+        self.taskrc = os.path.join(self.root, "taskrc")
+        with open(self.taskrc, "w") as outf:
+            outf.write(f"data.location = {self.root}\n")
+
+        self.client = Client(self.taskrc, task_bin=self.task_bin, write_queue=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def get_invocations(self):
+        with open(os.path.join(self.root, "log")) as inf:
+            return [
+                [arg for arg in line.split() if not arg.startswith("rc.")]
+                for line in inf
+            ]
+
+    def get_imported(self):
+        with open(os.path.join(self.root, "imported")) as inf:
+            return [json.loads(line) for line in inf]
+
+    def hold(self):
+        open(os.path.join(self.root, "hold"), "w").close()
+
+    def release(self):
+        os.unlink(os.path.join(self.root, "hold"))
+
+    def wait_for_invocations(self, count):
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            if os.path.exists(os.path.join(self.root, "log")):
+                if len(self.get_invocations()) >= count:
+                    return
+            time.sleep(0.01)
+        raise AssertionError("Taskwarrior was not invoked")
+
+    def test_shared_by_data_location(self):
+        other = Client(self.taskrc, task_bin=self.task_bin)
+
+        assert self.client.get_write_queue() is other.get_write_queue()
+        assert self.client.get_write_queue() is get_write_queue(self.root + "/.")
+
+    def test_merges_queued_writes(self):
+        deleted = [Task(uuid=uuid.uuid4(), description=str(i)) for i in range(2)]
+
+        self.hold()
+        first = self.client.submit_import(Task(description="First"))
+        self.wait_for_invocations(1)
+        futures = [
+            self.client.submit_import(Task(description="Second")),
+            self.client.submit_import(Task(description="Third")),
+            *[self.client.submit_delete(task) for task in deleted],
+            self.client.submit_import(Task(description="Fourth")),
+        ]
+        self.release()
+
+        assert first.result(timeout=5) == ("import done\n", "")
+        assert [future.result(timeout=5)[0] for future in futures] == [
+            "import done\n",
+            "import done\n",
+            "delete done\n",
+            "delete done\n",
+            "import done\n",
+        ]
+        assert self.get_invocations() == [
+            ["import"],
+            ["import"],
+            [str(task.uuid) for task in deleted] + ["status.not:deleted", "delete"],
+            ["import"],
+        ]
+        assert self.get_imported() == [
+            [{"description": "First"}],
+            [{"description": "Second"}, {"description": "Third"}],
+            [{"description": "Fourth"}],
+        ]
+
+    def test_isolates_failed_imports(self):
+        self.hold()
+        self.client.submit_import(Task(description="First"))
+        self.wait_for_invocations(1)
+        accepted = self.client.submit_import(Task(description="Accepted"))
+        rejected = self.client.submit_import(Task(description="Rejected"))
+        self.release()
+
+        assert accepted.result(timeout=5) == ("import done\n", "")
+        with pytest.raises(CommandError):
+            rejected.result(timeout=5)
+        assert self.get_imported()[-1] == {"description": "Accepted"}
+
+    def test_isolates_failed_deletes(self):
+        accepted = Task(uuid=uuid.uuid4(), description="Accepted")
+        rejected = Task(uuid=REJECTED_UUID, description="Rejected")
+
+        self.hold()
+        self.client.submit_import(Task(description="First"))
+        self.wait_for_invocations(1)
+        futures = [self.client.submit_delete(task) for task in [accepted, rejected]]
+        self.release()
+
+        assert futures[0].result(timeout=5) == ("delete done\n", "")
+        with pytest.raises(CommandError):
+            futures[1].result(timeout=5)
+        assert self.get_invocations()[-2:] == [
+            [str(accepted.uuid), "delete"],
+            [REJECTED_UUID, "delete"],
+        ]
+
+    def test_synchronous_calls(self):
+        threads = [
+            threading.Thread(
+                target=self.client.add, args=(Task(description=f"Task {i}"),)
+            )
+            for i in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        imported = [task for tasks in self.get_imported() for task in tasks]
+        assert sorted(task["description"] for task in imported) == [
+            f"Task {i}" for i in range(8)
+        ]
+        with pytest.raises(CommandError):
+            self.client.add(Task(description="Rejected"))
@@ -1,4 +1,19 @@
-from typing import Any, Dict, Tuple, Union
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Dict
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from typing import Union
+
+from typing_extensions import Literal
+
+from .exceptions import CommandError
+
+if TYPE_CHECKING:
+    from .task import Task
 
 
 StdoutStderr = Tuple[str, str]
@@ -6,3 +21,10 @@ StdoutStderr = Tuple[str, str]
 
 DictFilterSpec = Dict[str, Any]
 FilterSpec = Union[DictFilterSpec, str]
+
+Validation = Literal["eager", "lazy"]
+
+
+class ImportResult(NamedTuple):
+    task: Task
+    error: Optional[CommandError] = None
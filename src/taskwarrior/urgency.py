@@ -0,0 +1,315 @@
+"""Computes Taskwarrior's urgency for many tasks at once, without Taskwarrior.
+
+The `urgency` of exported tasks is whatever Taskwarrior computed when
+exporting them, using the coefficients configured at that time.  An
+`UrgencyModel` instead computes urgency locally, using NumPy, so that tasks
+can be ranked using different coefficients without exporting them again::
+
+    model = UrgencyModel.from_client(client)
+    tasks = client.filter(status="pending")
+    scores = model.compute(tasks)
+    model.with_coefficients({"urgency.due.coefficient": 20.0}).top(tasks, 10)
+
+Urgency is the sum of each term below multiplied by its coefficient
+(`urgency.<term>.coefficient`), as in Taskwarrior 2.6:
+
+* `due`: 0.2 for tasks due in 14 days or more, rising linearly to 1.0 for
+  tasks at least 7 days overdue;
+* `blocking` and `blocked`: the task is blocking or blocked by another
+  task that is neither completed nor deleted;
+* `scheduled`: the task's scheduled date has passed;
+* `active`: the task has been started;
+* `age`: the task's age in whole days, relative to `urgency.age.max`;
+* `annotations` and `tags`: 0.8, 0.9, or 1.0 for one, two, or three or
+  more annotations or tags;
+* `project`: the task has a project;
+* `waiting`: the task is waiting;
+
+followed by any configured `urgency.user.tag.<tag>`,
+`urgency.user.project.<project>`, `urgency.user.keyword.<keyword>`,
+`urgency.uda.<uda>`, and `urgency.uda.<uda>.<value>` coefficients; like
+Taskwarrior, `urgency.user.tag.next.coefficient` defaults to 15.
+
+`urgency.inherit` is not supported.  Taskwarrior computes urgency in single
+precision, so its figures may differ from these in the sixth significant
+digit.
+
+"""
+from __future__ import annotations
+
+import datetime
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from .client import Client
+from .exceptions import ClientUsageError
+from .task import CLOSED_STATUSES
+from .task import Task
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+# Taskwarrior's defaults; `priority` is a UDA whose values have coefficients.
+DEFAULT_COEFFICIENTS = {
+    "urgency.user.tag.next.coefficient": 15.0,
+    "urgency.due.coefficient": 12.0,
+    "urgency.blocking.coefficient": 8.0,
+    "urgency.uda.priority.H.coefficient": 6.0,
+    "urgency.uda.priority.M.coefficient": 3.9,
+    "urgency.uda.priority.L.coefficient": 1.8,
+    "urgency.scheduled.coefficient": 5.0,
+    "urgency.active.coefficient": 4.0,
+    "urgency.age.coefficient": 2.0,
+    "urgency.annotations.coefficient": 1.0,
+    "urgency.tags.coefficient": 1.0,
+    "urgency.project.coefficient": 1.0,
+    "urgency.waiting.coefficient": -3.0,
+    "urgency.blocked.coefficient": -5.0,
+}
+DEFAULT_AGE_MAX = 365
+
+SECONDS_PER_DAY = 86400.0
+
+
+class UrgencyModel:
+    """Taskwarrior's urgency coefficients, applied to tasks using NumPy.
+
+    * `coefficients`: settings named as in your taskrc (e.g.
+      `urgency.due.coefficient`); these replace Taskwarrior's defaults.
+    * `age_max`: the age in days after which age no longer increases
+      urgency (`urgency.age.max`); 0 means age always counts fully.
+
+    """
+
+    coefficients: Dict[str, float]
+    age_max: int
+
+    def __init__(
+        self,
+        coefficients: Optional[Mapping[str, float]] = None,
+        age_max: int = DEFAULT_AGE_MAX,
+    ):
+        if np is None:
+            raise ClientUsageError(
+                "NumPy is required to compute urgency; "
+                "install it using `pip install taskwarrior[columns]`."
+            )
+
+        self.coefficients = {**DEFAULT_COEFFICIENTS, **(coefficients or {})}
+        self.age_max = age_max
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, str]) -> UrgencyModel:
+        """Creates a model using the `urgency.*` settings in `config`."""
+        return cls(
+            {
+                key: float(value)
+                for key, value in config.items()
+                if key.startswith("urgency.") and key.endswith(".coefficient")
+            },
+            age_max=int(config.get("urgency.age.max", DEFAULT_AGE_MAX)),
+        )
+
+    @classmethod
+    def from_client(cls, client: Client) -> UrgencyModel:
+        """Creates a model using the client's taskrc and overrides."""
+        return cls.from_config(client.get_config())
+
+    def with_coefficients(self, coefficients: Mapping[str, float]) -> UrgencyModel:
+        """Returns a copy of this model with some coefficients changed."""
+        return type(self)({**self.coefficients, **coefficients}, age_max=self.age_max)
+
+    def compute(
+        self, tasks: Sequence[Task], now: Optional[datetime.datetime] = None
+    ) -> np.ndarray:
+        """Returns the urgency of each task, as a `float64` array.
+
+        Whether tasks are blocked or blocking is determined using only the
+        dependencies between the given tasks.
+
+        """
+        now_timestamp = (
+            now or datetime.datetime.now(datetime.timezone.utc)
+        ).timestamp()
+        count = len(tasks)
+        urgency = np.zeros(count, dtype=np.float64)
+
+        def flags(predicate: Callable[[Task], bool]) -> np.ndarray:
+            return np.fromiter(
+                (predicate(task) for task in tasks), dtype=np.bool_, count=count
+            )
+
+        def timestamps(field: str) -> np.ndarray:
+            return np.fromiter(
+                (_get_timestamp(getattr(task, field)) for task in tasks),
+                dtype=np.float64,
+                count=count,
+            )
+
+        def counts(field: str) -> np.ndarray:
+            return np.fromiter(
+                (len(getattr(task, field) or ()) for task in tasks),
+                dtype=np.int64,
+                count=count,
+            )
+
+        blocked, blocking = self._get_blocked_and_blocking(tasks)
+
+        # Terms are only computed if their coefficient is not zero
+        terms: List[Tuple[str, Callable[[], np.ndarray]]] = [
+            ("project", lambda: flags(lambda task: bool(task.project))),
+            ("active", lambda: flags(lambda task: task.start is not None)),
+            ("scheduled", lambda: timestamps("scheduled") < now_timestamp),
+            (
+                "waiting",
+                lambda: self._waiting(tasks, timestamps("wait"), now_timestamp),
+            ),
+            ("blocked", lambda: blocked),
+            ("annotations", lambda: _count_term(counts("annotations"))),
+            ("tags", lambda: _count_term(counts("tags"))),
+            ("due", lambda: _due_term(timestamps("due"), now_timestamp)),
+            ("blocking", lambda: blocking),
+            ("age", lambda: self._age_term(timestamps("entry"), now_timestamp)),
+        ]
+        for name, term in terms:
+            coefficient = self.coefficients.get(f"urgency.{name}.coefficient", 0.0)
+            if coefficient:
+                urgency += coefficient * term()
+
+        for key, coefficient in self.coefficients.items():
+            if not coefficient or not key.endswith(".coefficient"):
+                continue
+            predicate = _get_predicate(key.rpartition(".coefficient")[0])
+            if predicate is not None:
+                urgency += coefficient * flags(predicate)
+
+        return urgency
+
+    def top(
+        self,
+        tasks: Sequence[Task],
+        k: int,
+        now: Optional[datetime.datetime] = None,
+    ) -> List[Tuple[Task, float]]:
+        """Returns the `k` most urgent tasks and their urgency, most urgent first.
+
+        Only the `k` most urgent tasks are sorted.
+
+        """
+        urgency = self.compute(tasks, now=now)
+        k = min(k, len(tasks))
+        if k <= 0:
+            return []
+
+        selected = np.argpartition(-urgency, k - 1)[:k]
+        selected = selected[np.argsort(-urgency[selected], kind="stable")]
+
+        return [(tasks[index], float(urgency[index])) for index in selected]
+
+    def _age_term(self, entry: np.ndarray, now: float) -> np.ndarray:
+        # Whole days, as Taskwarrior truncates
+        age = np.trunc((now - entry) / SECONDS_PER_DAY)
+        if self.age_max == 0:
+            term = np.ones_like(age)
+        else:
+            term = np.where(age > self.age_max, 1.0, age / self.age_max)
+        return np.where(np.isnan(entry), 1.0, term)
+
+    def _waiting(
+        self, tasks: Sequence[Task], wait: np.ndarray, now: float
+    ) -> np.ndarray:
+        closed = np.fromiter(
+            (task.status in CLOSED_STATUSES for task in tasks),
+            dtype=np.bool_,
+            count=len(tasks),
+        )
+        return (wait > now) & ~closed
+
+    def _get_blocked_and_blocking(
+        self, tasks: Sequence[Task]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        open_uuids = {
+            task.uuid
+            for task in tasks
+            if task.uuid is not None and task.status not in CLOSED_STATUSES
+        }
+        blocked = np.zeros(len(tasks), dtype=np.bool_)
+        blocking_uuids = set()
+
+        for index, task in enumerate(tasks):
+            if not task.depends or task.status in CLOSED_STATUSES:
+                continue
+            dependencies = open_uuids.intersection(task.depends)
+            if dependencies:
+                blocked[index] = True
+                blocking_uuids.update(dependencies)
+
+        blocking = np.fromiter(
+            (task.uuid in blocking_uuids for task in tasks),
+            dtype=np.bool_,
+            count=len(tasks),
+        )
+        return blocked, blocking
+
+    def __repr__(self):
+        changed = {
+            key: value
+            for key, value in self.coefficients.items()
+            if DEFAULT_COEFFICIENTS.get(key) != value
+        }
+        return f"UrgencyModel(coefficients={changed}, age_max={self.age_max})"
+
+
+def _get_timestamp(value: Any) -> float:
+    if isinstance(value, datetime.datetime):
+        return value.timestamp()
+    return np.nan
+
+
+def _count_term(counts: np.ndarray) -> np.ndarray:
+    return np.select([counts >= 3, counts == 2, counts == 1], [1.0, 0.9, 0.8], 0.0)
+
+
+def _due_term(due: np.ndarray, now: float) -> np.ndarray:
+    days_overdue = (now - due) / SECONDS_PER_DAY
+    term = np.where(
+        days_overdue >= 7.0,
+        1.0,
+        np.where(days_overdue >= -14.0, (days_overdue + 14.0) * 0.8 / 21.0 + 0.2, 0.2),
+    )
+    return np.where(np.isnan(due), 0.0, term)
+
+
+def _get_predicate(name: str) -> Optional[Callable[[Task], bool]]:
+    """Returns which tasks a user-defined coefficient applies to."""
+    if name.startswith("urgency.user.project."):
+        project = name.partition("urgency.user.project.")[2]
+
+        def in_project(task: Task) -> bool:
+            task_project = task.project
+            if not task_project:
+                return False
+            return task_project == project or task_project.startswith(f"{project}.")
+
+        return in_project
+    elif name.startswith("urgency.user.tag."):
+        tag = name.partition("urgency.user.tag.")[2]
+        return lambda task: tag in (task.tags or ())
+    elif name.startswith("urgency.user.keyword."):
+        keyword = name.partition("urgency.user.keyword.")[2]
+        return lambda task: keyword in task.description
+    elif name.startswith("urgency.uda."):
+        uda, _, value = name.partition("urgency.uda.")[2].partition(".")
+        if value:
+            return lambda task: getattr(task, uda, None) == value
+        return lambda task: getattr(task, uda, None) not in (None, "")
+
+    return None
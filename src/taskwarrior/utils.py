@@ -1,4 +1,19 @@
+import codecs
+import json
+import os
+from typing import IO
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
 from typing import List
+from typing import Optional
+from typing import Set
+from typing import TypeVar
+
+T = TypeVar("T")
+
+JSON_SEPARATORS = frozenset(" \t\r\n,")
 
 
 def convert_dict_to_override_args(config, prefix="") -> List[str]:
@@ -34,3 +49,141 @@ def convert_dict_to_override_args(config, prefix="") -> List[str]:
             right = v if " " not in v else '"%s"' % v
             args.append("=".join([left, right]))
     return args
+
+
+def flatten_config_dict(config: Dict[str, Any], prefix: str = "") -> Dict[str, str]:
+    """Converts a nested dictionary of configuration into dotted key names.
+
+    Uses the same rules as `convert_dict_to_override_args`, but returns a
+    dictionary mapping each dotted key to its value as a string.
+
+    """
+    flattened: Dict[str, str] = {}
+    for k, v in config.items():
+        key = ".".join([prefix, k]) if prefix else k
+        if isinstance(v, dict):
+            flattened.update(flatten_config_dict(v, prefix=key))
+        else:
+            flattened[key] = str(v)
+    return flattened
+
+
+def read_taskrc(path: str, _seen: Optional[Set[str]] = None) -> Dict[str, str]:
+    """Reads the settings defined in a taskrc file.
+
+    * Follows `include` directives; relative includes are resolved relative
+      to the including file.
+    * Ignores comments, blank lines, and files that do not exist.
+
+    Only the settings explicitly present in the file are returned; defaults
+    built in to Taskwarrior itself are not.
+
+    """
+    path = os.path.abspath(os.path.expanduser(path))
+    seen = _seen if _seen is not None else set()
+    if path in seen:
+        return {}
+    seen.add(path)
+
+    config: Dict[str, str] = {}
+    try:
+        with open(path, encoding="utf-8") as inf:
+            lines = inf.readlines()
+    except OSError:
+        return config
+
+    for line in lines:
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+
+        if line.startswith("include "):
+            included = os.path.expanduser(line.partition(" ")[2].strip())
+            if not os.path.isabs(included):
+                included = os.path.join(os.path.dirname(path), included)
+            config.update(read_taskrc(included, _seen=seen))
+        elif "=" in line:
+            key, value = line.split("=", 1)
+            config[key.strip()] = value.strip()
+
+    return config
+
+
+def chunked(iterable: Iterable[T], size: int) -> Iterator[List[T]]:
+    """Yields lists of at most `size` consecutive items from `iterable`."""
+    chunk: List[T] = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class CountingReader:
+    """Wraps a binary stream, counting the bytes read from it."""
+
+    def __init__(self, stream: IO[bytes]):
+        self.stream = stream
+        self.bytes_read = 0
+
+    def read(self, size: int = -1) -> bytes:
+        data = self.stream.read(size)
+        self.bytes_read += len(data)
+        return data
+
+
+def iter_json_array(stream: IO[bytes], read_size: int = 65536) -> Iterator[Any]:
+    """Incrementally decodes a JSON array read from a binary stream.
+
+    Yields each element of the array as soon as it has been read in its
+    entirety rather than waiting for the stream to be exhausted.
+
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")("replace")
+
+    buffer = ""
+    position = 0
+    started = False
+    eof = False
+
+    while True:
+        while position < len(buffer) and buffer[position] in JSON_SEPARATORS:
+            position += 1
+
+        if position < len(buffer):
+            if not started:
+                if buffer[position] != "[":
+                    raise ValueError(
+                        f"Expected JSON array; found {buffer[position]!r}."
+                    )
+                started = True
+                position += 1
+                continue
+            elif buffer[position] == "]":
+                return
+
+            try:
+                item, end = decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                if eof:
+                    raise
+            else:
+                # A scalar running up to the end of the buffer (e.g. a
+                # number) may continue in data we have not yet read.
+                if eof or end < len(buffer) or isinstance(item, (dict, list)):
+                    yield item
+                    position = end
+                    continue
+        elif eof:
+            if not started:
+                # An empty response is treated as an empty array
+                return
+            raise ValueError("Unexpected end of JSON array.")
+
+        data = stream.read(read_size)
+        eof = not data
+        buffer = buffer[position:] + text_decoder.decode(data, final=eof)
+        position = 0
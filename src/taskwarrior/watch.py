@@ -0,0 +1,262 @@
+"""Reports changes to Taskwarrior's data files using Linux's inotify.
+
+Rather than polling using `Client.count` or `Client.filter`, a
+`ChangeFeed` waits for the kernel to report that Taskwarrior rewrote one
+of its data files::
+
+    with client.watch(parse_undo=True) as feed:
+        for event in feed:
+            print(event.files, event.uuids)
+
+Taskwarrior usually writes several files per command, so changes are
+debounced: an event is reported only once the data location has been
+quiet for `debounce` seconds, and covers every file written until then.
+
+"""
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+import uuid
+from typing import TYPE_CHECKING
+from typing import FrozenSet
+from typing import Iterator
+from typing import NamedTuple
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+from .datafile import parse_line
+from .exceptions import ClientUsageError
+
+if TYPE_CHECKING:
+    from .client import Client
+
+DEFAULT_DEBOUNCE = 0.05
+
+WATCHED_FILES = frozenset(["pending.data", "completed.data", "undo.data"])
+
+# From <sys/inotify.h>
+IN_MODIFY = 0x00000002
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = os.O_CLOEXEC
+
+WATCH_MASK = IN_MODIFY | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+# struct inotify_event: wd, mask, cookie, and the length of the name following
+EVENT_HEADER = struct.Struct("iIII")
+
+READ_SIZE = 64 * 1024
+
+_libc: Optional[ctypes.CDLL] = None
+
+
+class ChangeEvent(NamedTuple):
+    """Data files written since the previous event.
+
+    `uuids` holds the UUIDs of the tasks changed, read from the entries
+    appended to `undo.data`.  It is `None` if the feed was not asked to
+    parse `undo.data`, or if the changed tasks cannot be known -- for
+    example after `task undo`, which removes entries from `undo.data`
+    rather than adding them.
+
+    """
+
+    files: FrozenSet[str]
+    uuids: Optional[FrozenSet[uuid.UUID]] = None
+
+
+class ChangeFeed:
+    """Waits for changes to the data files of a data location.
+
+    * `data_location`: the directory holding Taskwarrior's data files.
+    * `debounce`: how long, in seconds, the data files must go unwritten
+      before a change is reported.
+    * `parse_undo`: whether to read the entries appended to `undo.data` to
+      report which tasks changed.
+
+    """
+
+    def __init__(
+        self,
+        data_location: str,
+        debounce: float = DEFAULT_DEBOUNCE,
+        parse_undo: bool = False,
+    ):
+        self.data_location = data_location
+        self.debounce = debounce
+        self.parse_undo = parse_undo
+
+        self._undo_path = os.path.join(data_location, "undo.data")
+        self._undo_offset = self._get_undo_size()
+
+        self._fd: Optional[int] = _inotify_init()
+        try:
+            _inotify_add_watch(self._fd, data_location, WATCH_MASK)
+        except OSError:
+            self.close()
+            raise
+
+    @classmethod
+    def from_client(cls, client: Client, **kwargs) -> ChangeFeed:
+        """Watches the data location set in the client's taskrc."""
+        return cls(client.get_data_location(), **kwargs)
+
+    def fileno(self) -> int:
+        """Returns the inotify descriptor, e.g. for use with `selectors`."""
+        if self._fd is None:
+            raise ClientUsageError("Change feed is closed.")
+        return self._fd
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[ChangeEvent]:
+        """Returns the next change, or `None` if none began within `timeout`."""
+        fd = self.fileno()
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        files: Set[str] = set()
+        overflowed = False
+        while True:
+            if files:
+                wait_for: Optional[float] = self.debounce
+            elif deadline is None:
+                wait_for = None
+            else:
+                wait_for = max(deadline - time.monotonic(), 0)
+
+            if not select.select([fd], [], [], wait_for)[0]:
+                if files:
+                    break
+                return None
+
+            names, overflow = _read_events(fd)
+            files.update(name for name in names if name in WATCHED_FILES)
+            if overflow:
+                files.update(WATCHED_FILES)
+                overflowed = True
+
+        uuids = None
+        if self.parse_undo and "undo.data" in files:
+            uuids = self._read_undo()
+            if overflowed:
+                uuids = None
+
+        return ChangeEvent(frozenset(files), uuids)
+
+    def __iter__(self) -> Iterator[ChangeEvent]:
+        while self._fd is not None:
+            event = self.wait()
+            if event is not None:
+                yield event
+
+    def close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> ChangeFeed:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _get_undo_size(self) -> int:
+        try:
+            return os.path.getsize(self._undo_path)
+        except OSError:
+            return 0
+
+    def _read_undo(self) -> Optional[FrozenSet[uuid.UUID]]:
+        """Returns the UUIDs of tasks in entries appended to `undo.data`."""
+        size = self._get_undo_size()
+        if size < self._undo_offset:
+            # Rewritten rather than appended to
+            self._undo_offset = size
+            return None
+
+        with open(self._undo_path, "rb") as inf:
+            inf.seek(self._undo_offset)
+            appended = inf.read(size - self._undo_offset)
+
+        # An entry being written when the file was read is left for later
+        end = appended.rfind(b"\n") + 1
+        complete = appended[:end]
+        self._undo_offset += len(complete)
+
+        uuids: Set[uuid.UUID] = set()
+        try:
+            for line in complete.decode("utf-8").splitlines():
+                if line.startswith("new "):
+                    uuids.add(uuid.UUID(parse_line(line.partition(" ")[2])["uuid"]))
+        except (KeyError, ValueError):
+            return None
+
+        return frozenset(uuids)
+
+    def __repr__(self):
+        return f"ChangeFeed({self.data_location!r})"
+
+
+def _get_libc() -> ctypes.CDLL:
+    global _libc
+
+    if not sys.platform.startswith("linux"):
+        raise ClientUsageError("Watching for changes requires Linux's inotify.")
+    if _libc is None:
+        _libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+    return _libc
+
+
+def _check(result: int, filename: Optional[str] = None) -> int:
+    if result < 0:
+        errno = ctypes.get_errno()
+        raise OSError(errno, os.strerror(errno), filename)
+    return result
+
+
+def _inotify_init() -> int:
+    return _check(_get_libc().inotify_init1(IN_NONBLOCK | IN_CLOEXEC))
+
+
+def _inotify_add_watch(fd: int, path: str, mask: int) -> int:
+    return _check(
+        _get_libc().inotify_add_watch(fd, os.fsencode(path), ctypes.c_uint32(mask)),
+        path,
+    )
+
+
+def _read_events(fd: int) -> Tuple[Set[str], bool]:
+    """Reads pending inotify events, returning the names of files written.
+
+    Also returns whether the kernel's event queue overflowed, in which
+    case events were lost.
+
+    """
+    names: Set[str] = set()
+    overflow = False
+    while True:
+        try:
+            data = os.read(fd, READ_SIZE)
+        except BlockingIOError:
+            return names, overflow
+
+        offset = 0
+        while offset < len(data):
+            _, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            end = offset + length
+            name = data[offset:end].rstrip(b"\0")
+            offset = end
+
+            if mask & IN_Q_OVERFLOW:
+                overflow = True
+            elif name:
+                names.add(os.fsdecode(name))
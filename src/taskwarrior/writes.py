@@ -0,0 +1,212 @@
+"""Serializes writes to each data location through a single writer.
+
+Taskwarrior locks its data files while it writes them, so many threads
+importing or deleting tasks in the same data location at once mostly wait
+on each other's processes, and may fail when the lock cannot be taken.  A
+`WriteQueue` instead lets a single writer thread per data location run
+every write, merging the requests that queued up while the previous
+invocation ran::
+
+    futures = [client.submit_import(task) for task in tasks]
+    for future in futures:
+        future.result()
+
+Imports queued together are sent as one JSON array to a single
+`task import`, and deletes queued together are made by a single `task
+delete`.  Reads do not go through the queue.
+
+"""
+from __future__ import annotations
+
+import concurrent.futures
+import os
+import queue
+import threading
+from typing import TYPE_CHECKING
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+
+from typing_extensions import Literal
+
+from .client import NOT_DELETED_FILTER
+from .exceptions import CommandError
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .task import Task
+
+DEFAULT_MAX_BATCH_SIZE = 1000
+
+# How long an idle writer waits for more requests before its thread exits
+DEFAULT_IDLE_TIMEOUT = 1.0
+
+_queues: Dict[str, WriteQueue] = {}
+_queues_lock = threading.Lock()
+
+
+class WriteRequest(NamedTuple):
+    client: Client
+    action: Literal["import", "delete"]
+    task: Task
+    future: concurrent.futures.Future
+
+
+class WriteQueue:
+    """Runs imports and deletes for one data location on a single thread.
+
+    Requests are run in the order they were submitted.  Consecutive
+    requests of the same kind made through the same client are merged into
+    a single invocation of at most `max_batch_size` tasks, and every
+    request's future receives that invocation's output.
+
+    If a merged import fails, its tasks are imported again one at a time
+    so that only the futures of the tasks Taskwarrior rejects receive the
+    error; this is safe since Taskwarrior imports nothing when an import
+    fails.  Merged deletes skip tasks that were already deleted, so that
+    one such task does not fail the others; if a merged delete still
+    fails, its tasks are likewise deleted one at a time, each future
+    receiving what `Client.delete` would have returned or raised.
+
+    The writer thread is started when a request is submitted, and exits
+    after having been idle for `idle_timeout` seconds.
+
+    """
+
+    def __init__(
+        self,
+        data_location: str,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    ):
+        self.data_location = data_location
+        self.max_batch_size = max_batch_size
+        self.idle_timeout = idle_timeout
+
+        self._requests: queue.Queue[WriteRequest] = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def submit(
+        self, client: Client, action: Literal["import", "delete"], task: Task
+    ) -> concurrent.futures.Future:
+        """Queues an import or delete of `task`, returning its future.
+
+        The future's result is the `StdoutStderr` of the Taskwarrior
+        invocation that wrote the task, or the `CommandError` it raised.
+
+        """
+        future: concurrent.futures.Future = concurrent.futures.Future()
+
+        with self._lock:
+            self._requests.put(WriteRequest(client, action, task, future))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=f"taskwarrior-writer-{self.data_location}",
+                    daemon=True,
+                )
+                self._thread.start()
+
+        return future
+
+    def _run(self) -> None:
+        while True:
+            try:
+                first = self._requests.get(timeout=self.idle_timeout)
+            except queue.Empty:
+                with self._lock:
+                    if self._requests.empty():
+                        self._thread = None
+                        return
+                continue
+
+            requests = [first]
+            while True:
+                try:
+                    requests.append(self._requests.get_nowait())
+                except queue.Empty:
+                    break
+
+            for batch in self._get_batches(requests):
+                self._write(batch)
+
+    def _get_batches(self, requests: List[WriteRequest]) -> List[List[WriteRequest]]:
+        batches: List[List[WriteRequest]] = []
+        for request in requests:
+            if not request.future.set_running_or_notify_cancel():
+                continue
+
+            if batches:
+                last = batches[-1]
+                if (
+                    last[0].client is request.client
+                    and last[0].action == request.action
+                    and len(last) < self.max_batch_size
+                ):
+                    last.append(request)
+                    continue
+
+            batches.append([request])
+
+        return batches
+
+    def _write(self, batch: List[WriteRequest]) -> None:
+        client = batch[0].client
+        client._invalidate_cache()
+
+        try:
+            if batch[0].action == "import":
+                tasks = ",".join(r.task.json(exclude_unset=True) for r in batch)
+                result = client._execute("import", stdin=f"[{tasks}]")
+            else:
+                result = client._execute(
+                    *[str(request.task.uuid) for request in batch],
+                    NOT_DELETED_FILTER,
+                    "delete",
+                )
+        except CommandError as e:
+            if len(batch) > 1:
+                for request in batch:
+                    self._write_one(request)
+            else:
+                batch[0].future.set_exception(e)
+        except Exception as e:
+            for request in batch:
+                request.future.set_exception(e)
+        else:
+            for request in batch:
+                request.future.set_result(result)
+
+    def _write_one(self, request: WriteRequest) -> None:
+        try:
+            if request.action == "import":
+                result = request.client._execute(
+                    "import", stdin=request.task.json(exclude_unset=True)
+                )
+            else:
+                result = request.client._execute(str(request.task.uuid), "delete")
+        except Exception as e:
+            request.future.set_exception(e)
+        else:
+            request.future.set_result(result)
+
+    def __repr__(self):
+        return f"WriteQueue({self.data_location!r})"
+
+
+def get_write_queue(data_location: str) -> WriteQueue:
+    """Returns the write queue shared by every client of `data_location`.
+
+    Paths are resolved before lookup, so clients reaching the same data
+    location through different paths share a queue.
+
+    """
+    key = os.path.realpath(os.path.expanduser(data_location))
+
+    with _queues_lock:
+        write_queue = _queues.get(key)
+        if write_queue is None:
+            write_queue = _queues[key] = WriteQueue(key)
+        return write_queue